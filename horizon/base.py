@@ -578,6 +578,7 @@ class Dashboard(Registry, HorizonComponent):
         if os.path.exists(template_dir):
             key = os.path.join(cls.slug, panel.slug)
             loaders.panel_template_dirs[key] = template_dir
+            loaders.clear_cache()
         return panel_class
 
     @classmethod
@@ -589,6 +590,7 @@ class Dashboard(Registry, HorizonComponent):
             key = os.path.join(cls.slug, panel.slug)
             if key in loaders.panel_template_dirs:
                 del loaders.panel_template_dirs[key]
+                loaders.clear_cache()
         return success
 
     def allowed(self, context):
@@ -30,9 +30,39 @@ from django.utils._os import safe_join  # noqa
 
 # Set up a cache of the panel directories to search.
 panel_template_dirs = {}
+# Compiled panel templates, keyed by template name. Each entry is a tuple of
+# the template, the path it was read from and that file's modification time.
+template_cache = {}
+# Marks the names which are known not to exist in any panel.
+_MISSING = (None, None, None)
+
+
+def clear_cache():
+    """Empties the compiled panel template cache."""
+    template_cache.clear()
+
+
+def _check_mtime():
+    return getattr(settings, 'HORIZON_TEMPLATE_CACHE_CHECK_MTIME',
+                   settings.DEBUG)
+
+
+def _is_fresh(path, mtime):
+    try:
+        return os.path.getmtime(path) == mtime
+    except OSError:
+        return False
 
 
 class TemplateLoader(tLoaderCls):
+    """Loads templates from the "templates" directories of panels.
+
+    Compiled templates are cached for the life of the process, so once a
+    template has been loaded it is served without touching the disk. When
+    ``HORIZON_TEMPLATE_CACHE_CHECK_MTIME`` is set (it defaults to
+    ``DEBUG``), the file's modification time is checked on each lookup and
+    changed templates are reloaded.
+    """
     is_usable = True
 
     def get_template_sources(self, template_name):
@@ -60,6 +90,59 @@ class TemplateLoader(tLoaderCls):
                 pass
         raise TemplateDoesNotExist(template_name)
 
+    def load_template(self, template_name, template_dirs=None):
+        check_mtime = _check_mtime()
+        cached = template_cache.get(template_name)
+        if cached is _MISSING and not check_mtime:
+            raise TemplateDoesNotExist(template_name)
+        if cached is not None and cached is not _MISSING:
+            template, path, mtime = cached
+            if not check_mtime or _is_fresh(path, mtime):
+                return template, None
+
+        for path in self.get_template_sources(template_name):
+            if os.path.isfile(path):
+                break
+        else:
+            template_cache[template_name] = _MISSING
+            raise TemplateDoesNotExist(template_name)
+        mtime = os.path.getmtime(path)
+        template, display_name = super(TemplateLoader, self).load_template(
+            template_name, template_dirs)
+        if display_name is None:
+            # Only cache templates which compiled; the base loader hands
+            # back the source when one of their includes is missing.
+            template_cache[template_name] = (template, path, mtime)
+        return template, display_name
+
+
+def precompile_templates():
+    """Compiles every template found in the registered panels.
+
+    The compiled templates are put in the loader cache. Returns a tuple of
+    the names which were compiled and a dict mapping the names which failed
+    to their errors.
+    """
+    compiled = []
+    errors = {}
+    for key, template_dir in sorted(panel_template_dirs.items()):
+        panel_name = os.path.basename(key)
+        panel_dir = os.path.join(template_dir, panel_name)
+        for root, dirs, files in os.walk(panel_dir):
+            for filename in sorted(files):
+                if filename.startswith('.'):
+                    continue
+                path = os.path.join(root, filename)
+                name = '/'.join([key] + os.path.relpath(
+                    path, panel_dir).split(os.sep))
+                try:
+                    _loader.load_template(name)
+                except Exception as exc:
+                    errors[name] = exc
+                else:
+                    compiled.append(name)
+    return compiled, errors
+
 
 if django.get_version() >= '1.8':
     e = Engine()
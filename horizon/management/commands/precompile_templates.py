@@ -0,0 +1,41 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from django.core.management.base import CommandError  # noqa
+from django.core.management.base import NoArgsCommand  # noqa
+
+from horizon import base
+from horizon import loaders
+
+
+class Command(NoArgsCommand):
+    help = ("Compiles the templates of every registered panel, reporting "
+            "the ones which fail. The same can be done at startup of the "
+            "WSGI application by calling "
+            "horizon.loaders.precompile_templates() to warm the template "
+            "cache.")
+
+    def handle_noargs(self, **options):
+        # Building the URLconf registers all the dashboards and panels.
+        base.Horizon._urls()
+        compiled, errors = loaders.precompile_templates()
+        verbosity = int(options.get('verbosity', 1))
+        if verbosity > 1:
+            for name in compiled:
+                self.stdout.write("Compiled %s" % name)
+        for name, error in sorted(errors.items()):
+            self.stderr.write("%s: %s" % (name, error))
+        if verbosity > 0:
+            self.stdout.write("Compiled %d panel templates." % len(compiled))
+        if errors:
+            raise CommandError("%d panel templates failed to compile."
+                               % len(errors))
@@ -177,17 +177,24 @@ function build_reverse_links(node){
 
 function ajax_poll(poll_time){
   setTimeout(function() {
-    $.getJSON(ajax_url, function(json) {
-      //update d3 data element
-      $("#d3_data").attr("data-d3_data", JSON.stringify(json));
+    var url = ajax_url;
+    //only ask for the resources changed since the last poll
+    if (version) { url += '?since=' + encodeURIComponent(version); }
+    $.getJSON(url, function(json) {
+      version = json.version;
+      needs_update = false;
 
       //update stack
       $("#stack_box").html(json.stack.info_box);
-      set_in_progress(json.stack, json.nodes);
-      needs_update = false;
 
       //Check Remove nodes
-      remove_nodes(nodes, json.nodes);
+      if (json.incremental) {
+        json.removed.forEach(function(name) {
+          if (findNode(name)) { removeNode(name); }
+        });
+      } else {
+        remove_nodes(nodes, json.nodes);
+      }
 
       //Check for updates and new nodes
       json.nodes.forEach(function(d){
@@ -196,6 +203,7 @@ function ajax_poll(poll_time){
         if (current_node) {
           //Node already exists, just update it
           current_node.status = d.status;
+          current_node.in_progress = d.in_progress;
 
           //Status has changed, image should be updated
           if (current_node.image !== d.image){
@@ -231,6 +239,12 @@ function ajax_poll(poll_time){
         }
       });
 
+      //update d3 data element
+      graph.nodes = nodes;
+      graph.stack = json.stack;
+      $("#d3_data").attr("data-d3_data", JSON.stringify(graph));
+      set_in_progress(json.stack, nodes);
+
       //if any updates needed, do update now
       if (needs_update === true){
         update();
@@ -249,6 +263,7 @@ if ($(container).length){
     stack_id = $("#stack_id").data("stack_id"),
     ajax_url = '/project/stacks/get_d3_data/' + stack_id + '/',
     graph = $("#d3_data").data("d3_data"),
+    version = graph.version,
     force = d3.layout.force()
       .nodes(graph.nodes)
       .links([])
@@ -2,6 +2,8 @@
 
 horizon.network_topology = {
   model: null,
+  raw_model: null,
+  version: null,
   fa_globe_glyph: '\uf0ac',
   fa_globe_glyph_width: 15,
   svg:'#topology_canvas',
@@ -122,10 +124,27 @@ horizon.network_topology = {
     if($('#networktopology').length === 0) {
       return;
     }
-    $.getJSON($('#networktopology').data('networktopology') + '?' + $.now(),
+    var url = $('#networktopology').data('networktopology') + '?' + $.now();
+    if (self.version) {
+      url += '&since=' + encodeURIComponent(self.version);
+    }
+    $.getJSON(url,
       function(data) {
-        self.model = data;
-        self.data_convert();
+        // only the collections which changed since the last version are sent
+        var changed = false;
+        self.raw_model = self.raw_model || {};
+        $.each(['servers', 'networks', 'ports', 'routers'], function(i, key) {
+          if (data[key] !== undefined) {
+            self.raw_model[key] = data[key];
+            changed = true;
+          }
+        });
+        self.version = data.version;
+        if (changed) {
+          // data_convert annotates the model, keep the raw one pristine
+          self.model = $.extend(true, {}, self.raw_model);
+          self.data_convert();
+        }
         setTimeout(function(){
           self.load_network_info();
         }, self.reload_duration);
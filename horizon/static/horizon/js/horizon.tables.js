@@ -15,80 +15,23 @@ horizon.datatables = {
         $table.removeAttr('decay_constant');
         return;
       }
-      // Trigger the update handlers.
-      $rows_to_update.each(function(index, row) {
-        var $row = $(this),
-          $table = $row.closest('table.datatable');
-        horizon.ajax.queue({
-          url: $row.attr('data-update-url'),
-          error: function (jqXHR, textStatus, errorThrown) {
-            switch (jqXHR.status) {
-              // A 404 indicates the object is gone, and should be removed from the table
-              case 404:
-                // Update the footer count and reset to default empty row if needed
-                var $footer, row_count, footer_text, colspan, template, params, $empty_row;
-
-                // existing count minus one for the row we're removing
-                row_count = horizon.datatables.update_footer_count($table, -1);
-
-                if(row_count === 0) {
-                  colspan = $table.find('th[colspan]').attr('colspan');
-                  template = horizon.templates.compiled_templates["#empty_row_template"];
-                  params = {
-                      "colspan": colspan,
-                      no_items_label: gettext("No items to display.")
-                  };
-                  empty_row = template.render(params);
-                  $row.replaceWith(empty_row);
-                } else {
-                  $row.remove();
-                }
-                // Reset tablesorter's data cache.
-                $table.trigger("update");
-                // Enable launch action if quota is not exceeded
-                horizon.datatables.update_actions();
-                break;
-              default:
-                horizon.utils.log(gettext("An error occurred while updating."));
-                $row.removeClass("ajax-update");
-                $row.find("i.ajax-updating").remove();
-                break;
+      // Refresh the rows of each table with batched requests. Each row
+      // sends the checksum of its current contents so that only the rows
+      // which changed are rendered and sent back. The rows are sent in
+      // chunks of batch_update_size to keep the query strings short.
+      $rows_to_update.closest('table.datatable').each(function () {
+        var $table = $(this),
+          $rows = $table.find('tr.status_unknown.ajax-update'),
+          size = horizon.datatables.batch_update_size,
+          pending = Math.ceil($rows.length / size),
+          i;
+        for (i = 0; i < $rows.length; i += size) {
+          horizon.datatables.update_rows($table, $rows.slice(i, i + size),
+                                         function () {
+            pending--;
+            if (pending > 0) {
+              return;
             }
-          },
-          success: function (data, textStatus, jqXHR) {
-            var $new_row = $(data);
-
-            if ($new_row.hasClass('status_unknown')) {
-              var spinner_elm = $new_row.find("td.status_unknown:last");
-              var imagePath = $new_row.find('.btn-action-required').length > 0 ?
-                "dashboard/img/action_required.png":
-                "dashboard/img/loading.gif";
-              imagePath = STATIC_URL + imagePath;
-              spinner_elm.prepend(
-                $("<div>")
-                  .addClass("loading_gif")
-                  .append($("<img>").attr("src", imagePath)));
-            }
-
-            // Only replace row if the html content has changed
-            if($new_row.html() !== $row.html()) {
-              if($row.find('.table-row-multi-select:checkbox').is(':checked')) {
-                // Preserve the checkbox if it's already clicked
-                $new_row.find('.table-row-multi-select:checkbox').prop('checked', true);
-              }
-              $row.replaceWith($new_row);
-              // Reset tablesorter's data cache.
-              $table.trigger("update");
-              // Reset decay constant.
-              $table.removeAttr('decay_constant');
-              // Check that quicksearch is enabled for this table
-              // Reset quicksearch's data cache.
-              if ($table.attr('id') in horizon.datatables.qs) {
-                horizon.datatables.qs[$table.attr('id')].cache();
-              }
-            }
-          },
-          complete: function (jqXHR, textStatus) {
             // Revalidate the button check for the updated table
             horizon.datatables.validate_button();
 
@@ -104,12 +47,106 @@ horizon.datatables = {
             // Limit the interval to 30 secs
             if(next_poll > 30 * 1000) { next_poll = 30 * 1000; }
             setTimeout(horizon.datatables.update, next_poll);
-          }
-        });
+          });
+        }
       });
     }
   },
 
+  // Maximum number of rows refreshed by a single batched request.
+  batch_update_size: 20,
+
+  update_rows: function ($table, $rows, complete) {
+    var params = [];
+    $rows.each(function () {
+      var $row = $(this),
+        obj_id = $row.attr('data-object-id');
+      params.push({name: 'obj_id', value: obj_id});
+      params.push({name: 'checksum__' + obj_id,
+                   value: $row.attr('data-update-checksum')});
+    });
+    horizon.ajax.queue({
+      url: $rows.first().attr('data-batch-update-url'),
+      data: $.param(params),
+      dataType: 'json',
+      error: function (jqXHR, textStatus, errorThrown) {
+        horizon.utils.log(gettext("An error occurred while updating."));
+        $rows.removeClass("ajax-update");
+        $rows.find("i.ajax-updating").remove();
+      },
+      success: function (data, textStatus, jqXHR) {
+        var find_row = function (obj_id) {
+          return $rows.filter(function () {
+            return $(this).attr('data-object-id') === obj_id;
+          });
+        };
+        // Deleted objects should be removed from the table.
+        $.each(data.deleted, function (index, obj_id) {
+          horizon.datatables.remove_row($table, find_row(obj_id));
+        });
+        $.each(data.rows, function (obj_id, row_html) {
+          horizon.datatables.replace_row($table, find_row(obj_id),
+                                         $(row_html));
+        });
+      },
+      complete: complete
+    });
+  },
+
+  remove_row: function ($table, $row) {
+    // Update the footer count and reset to default empty row if needed
+    var row_count, colspan, template, params, empty_row;
+
+    // existing count minus one for the row we're removing
+    row_count = horizon.datatables.update_footer_count($table, -1);
+
+    if(row_count === 0) {
+      colspan = $table.find('th[colspan]').attr('colspan');
+      template = horizon.templates.compiled_templates["#empty_row_template"];
+      params = {
+          "colspan": colspan,
+          no_items_label: gettext("No items to display.")
+      };
+      empty_row = template.render(params);
+      $row.replaceWith(empty_row);
+    } else {
+      $row.remove();
+    }
+    // Reset tablesorter's data cache.
+    $table.trigger("update");
+    // Enable launch action if quota is not exceeded
+    horizon.datatables.update_actions();
+  },
+
+  replace_row: function ($table, $row, $new_row) {
+    if ($new_row.hasClass('status_unknown')) {
+      var spinner_elm = $new_row.find("td.status_unknown:last");
+      var imagePath = $new_row.find('.btn-action-required').length > 0 ?
+        "dashboard/img/action_required.png":
+        "dashboard/img/loading.gif";
+      imagePath = STATIC_URL + imagePath;
+      spinner_elm.prepend(
+        $("<div>")
+          .addClass("loading_gif")
+          .append($("<img>").attr("src", imagePath)));
+    }
+
+    if($row.find('.table-row-multi-select:checkbox').is(':checked')) {
+      // Preserve the checkbox if it's already clicked
+      $new_row.find('.table-row-multi-select:checkbox').prop('checked', true);
+    }
+    $row.replaceWith($new_row);
+    // Reset tablesorter's data cache.
+    $table.trigger("update");
+    // Reset decay constant.
+    $table.removeAttr('decay_constant');
+    // Check that quicksearch is enabled for this table
+    // Reset quicksearch's data cache.
+    if ($table.attr('id') in horizon.datatables.qs) {
+      horizon.datatables.qs[$table.attr('id')].cache();
+    }
+  },
+
   update_actions: function() {
     var $actions_to_update = $('.btn-launch.ajax-update, .btn-create.ajax-update');
     $actions_to_update.each(function(index, action) {
@@ -95,6 +95,7 @@ class BaseAction(html.HTMLElement):
         self.handles_multiple = kwargs.get('handles_multiple', False)
         self.requires_input = kwargs.get('requires_input', False)
         self.preempt = kwargs.get('preempt', False)
+        self.fetch_selected = kwargs.get('fetch_selected', False)
         self.policy_rules = kwargs.get('policy_rules', None)
 
     def data_type_matched(self, datum):
@@ -211,6 +212,19 @@ class Action(BaseAction):
         to bypass any API calls and processing which would otherwise be
         required to load the table.
 
+    .. attribute:: fetch_selected
+
+        Boolean value indicating whether this action only needs the objects
+        selected by the user rather than the full table data. When ``True``
+        the selected objects are retrieved by id with
+        :meth:`~horizon.tables.DataTable.get_selected_data` and the action is
+        handled before the table data has been loaded; the data is only
+        loaded again for the page the action redirects to.
+
+        Tables whose row class does not implement
+        :meth:`~horizon.tables.Row.get_data` fall back to loading the full
+        table data. Defaults to ``False``.
+
     .. attribute:: allowed_data_types
 
         A list that contains the allowed data types of the action.  If the
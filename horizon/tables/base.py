@@ -14,6 +14,7 @@
 
 import collections
 import copy
+import hashlib
 import json
 import logging
 from operator import attrgetter
@@ -139,8 +140,9 @@ class Column(html.HTMLElement):
 
         A string containing the name of a summation method to be used in
         the generation of a summary row for this column. By default the
-        options are ``"sum"`` or ``"average"``, which behave as expected.
-        Optional.
+        options are ``"sum"``, ``"average"``, ``"min"``, ``"max"`` or
+        ``"count"`` (of the values which are not ``None``), which behave as
+        expected. Optional.
 
     .. attribute:: filters
 
@@ -238,10 +240,20 @@ class Column(html.HTMLElement):
 
         A string of simple help text displayed in a tooltip when you hover
         over the help icon beside the Column name. Defaults to ``None``.
+
+    .. attribute:: api_fields
+
+        A tuple of the API resource fields this column needs to render,
+        e.g. ``("admin_state_up",)`` for a column showing a value derived
+        from that field. Used by :meth:`~DataTable.get_api_fields` when the
+        table supports field projection. Defaults to ``None``.
     """
     summation_methods = {
         "sum": sum,
-        "average": lambda data: sum(data, 0.0) / len(data)
+        "average": lambda data: sum(data, 0.0) / len(data),
+        "min": min,
+        "max": max,
+        "count": len,
     }
     # Used to retain order when instantiating columns on a table
     creation_counter = 0
@@ -274,7 +286,8 @@ class Column(html.HTMLElement):
                  auto=None, truncate=None, link_classes=None, wrap_list=False,
                  form_field=None, form_field_attributes=None,
                  update_action=None, link_attrs=None,
-                 cell_attributes_getter=None, help_text=None):
+                 cell_attributes_getter=None, help_text=None,
+                 api_fields=None):
 
         self.classes = list(classes or getattr(self, "classes", []))
         super(Column, self).__init__()
@@ -311,6 +324,7 @@ class Column(html.HTMLElement):
         self.update_action = update_action
         self.link_attrs = link_attrs or {}
         self.help_text = help_text
+        self.api_fields = api_fields or ()
         if link_classes:
             self.link_attrs['class'] = ' '.join(link_classes)
         self.cell_attributes_getter = cell_attributes_getter
@@ -318,6 +332,8 @@ class Column(html.HTMLElement):
         if status_choices:
             self.status_choices = status_choices
         self.display_choices = display_choices
+        # Built on the first use, see get_data()
+        self._value_pipeline = None
 
         if summation is not None and summation not in self.summation_methods:
             raise ValueError("Summation method %s must be one of %s."
@@ -374,37 +390,52 @@ class Column(html.HTMLElement):
         method for this column.
         """
         datum_id = self.table.get_object_id(datum)
+        cache = self.table._data_cache[self]
+        try:
+            return cache[datum_id]
+        except KeyError:
+            pass
+        if self._value_pipeline is None:
+            self._value_pipeline = self._build_value_pipeline()
+        data = cache[datum_id] = self._value_pipeline(datum)
+        return data
 
-        if datum_id in self.table._data_cache[self]:
-            return self.table._data_cache[self][datum_id]
-
-        data = self.get_raw_data(datum)
-        display_value = None
-
-        if self.display_choices:
-            display_value = [display for (value, display) in
-                             self.display_choices
-                             if value.lower() == (data or '').lower()]
-
-        if display_value:
-            data = display_value[0]
-        else:
-            for filter_func in self.filters:
-                try:
-                    data = filter_func(data)
-                except Exception:
-                    msg = ("Filter '%(filter)s' failed with data "
-                           "'%(data)s' on column '%(col_name)s'")
-                    LOG.warning(msg, {'filter': filter_func.func_name,
-                                      'data': data,
-                                      'col_name': unicode(self.verbose_name)})
-
-        if data and self.truncate:
-            data = truncatechars(data, self.truncate)
-
-        self.table._data_cache[self][datum_id] = data
+    def _build_value_pipeline(self):
+        """Returns a function computing the display data of a datum.
 
-        return self.table._data_cache[self][datum_id]
+        The display choices are turned into a dict of the lowercased values,
+        and the filters and truncation bound, once per column rather than for
+        each cell. This is done on the first use so that the columns can
+        still be customized when the table is instantiated.
+        """
+        get_raw_data = self.get_raw_data
+        display_choices = {}
+        for value, display in reversed(self.display_choices or ()):
+            display_choices[value.lower()] = display
+        filters = tuple(self.filters)
+        truncate = self.truncate
+        column = self
+
+        def pipeline(datum):
+            data = get_raw_data(datum)
+            key = (data or '').lower() if display_choices else None
+            if key in display_choices:
+                data = display_choices[key]
+            else:
+                for filter_func in filters:
+                    try:
+                        data = filter_func(data)
+                    except Exception:
+                        msg = ("Filter '%(filter)s' failed with data "
+                               "'%(data)s' on column '%(col_name)s'")
+                        LOG.warning(msg, {'filter': filter_func.func_name,
+                                          'data': data,
+                                          'col_name':
+                                              unicode(column.verbose_name)})
+            if data and truncate:
+                data = truncatechars(data, truncate)
+            return data
+        return pipeline
 
     def get_link_url(self, datum):
         """Returns the final value for the column's ``link`` property.
@@ -435,23 +466,31 @@ class Column(html.HTMLElement):
     def get_summation(self):
         """Returns the summary value for the data in this column if a
         valid summation method is specified for it. Otherwise returns ``None``.
+
+        The summary values of all of the columns are computed together by
+        :meth:`~horizon.tables.DataTable.get_aggregates`.
         """
         if self.summation not in self.summation_methods:
             return None
+        return self.table.get_aggregates().get(self.name)
 
-        summation_function = self.summation_methods[self.summation]
-        data = [self.get_raw_data(datum) for datum in self.table.data]
-        data = filter(lambda datum: datum is not None, data)
+    def summarize(self, data):
+        """Returns the summary value of ``data``, the raw data of this column
+        which is not ``None``, with the column's filters applied to it.
 
-        if len(data):
-            try:
-                summation = summation_function(data)
-                for filter_func in self.filters:
-                    summation = filter_func(summation)
-                return summation
-            except TypeError:
-                pass
-        return None
+        Returns ``None`` if there is no data or it cannot be summarized,
+        except for a ``"count"``, which is then ``0``.
+        """
+        if not data and self.summation != "count":
+            return None
+        summation_function = self.summation_methods[self.summation]
+        try:
+            summation = summation_function(data)
+            for filter_func in self.filters:
+                summation = filter_func(summation)
+            return summation
+        except TypeError:
+            return None
 
 
 class Row(html.HTMLElement):
@@ -514,10 +553,17 @@ class Row(html.HTMLElement):
         updates of cell. Generally you won't need to change this value.
         It is also used for inline edit of the cell.
         Default: ``"cell_update"``.
+
+    .. attribute:: ajax_batch_action_name
+
+        String that is used for the query parameter key to request a batched
+        AJAX update of several rows of the table at once. Generally you won't
+        need to change this value. Default: ``"rows_update"``.
     """
     ajax = False
     ajax_action_name = "row_update"
     ajax_cell_action_name = "cell_update"
+    ajax_batch_action_name = "rows_update"
 
     def __init__(self, table, datum=None):
         super(Row, self).__init__()
@@ -559,6 +605,8 @@ class Row(html.HTMLElement):
             interval = conf.HORIZON_CONFIG['ajax_poll_interval']
             self.attrs['data-update-interval'] = interval
             self.attrs['data-update-url'] = self.get_ajax_update_url()
+            self.attrs['data-batch-update-url'] = \
+                self.get_ajax_batch_update_url()
             self.classes.append("ajax-update")
 
         self.attrs['data-object-id'] = table.get_object_id(datum)
@@ -576,6 +624,9 @@ class Row(html.HTMLElement):
         if display_name:
             self.attrs['data-display'] = escape(display_name)
 
+        if self.ajax:
+            self.attrs['data-update-checksum'] = self.get_checksum()
+
     def __repr__(self):
         return '<%s: %s>' % (self.__class__.__name__, self.id)
 
@@ -615,6 +666,26 @@ class Row(html.HTMLElement):
         ]))
         return "%s?%s" % (table_url, params)
 
+    def get_ajax_batch_update_url(self):
+        table_url = self.table.get_absolute_url()
+        params = urlencode(SortedDict([
+            ("action", self.ajax_batch_action_name),
+            ("table", self.table.name)
+        ]))
+        return "%s?%s" % (table_url, params)
+
+    def get_checksum(self):
+        """Returns a checksum of the displayed contents of this row.
+
+        The checksum is sent back with batched AJAX updates so that rows
+        whose contents did not change are neither rendered nor returned.
+        """
+        checksum = hashlib.md5(self.status_class.encode('utf-8'))
+        for name, cell in self.cells.items():
+            value = u"%s=%s" % (name, cell.data)
+            checksum.update(value.encode('utf-8'))
+        return checksum.hexdigest()
+
     def can_be_selected(self, datum):
         """By default if multiselect enabled return True. You can remove the
         checkbox after an ajax update here if required.
@@ -627,6 +698,26 @@ class Row(html.HTMLElement):
         """
         return {}
 
+    def get_data_many(self, request, obj_ids):
+        """Fetches the updated data for several rows at once.
+
+        Returns a dict mapping each of the ``obj_ids`` passed in to its
+        data object. Ids which are missing from the returned dict are
+        considered deleted and their rows are removed from the table.
+
+        By default this calls :meth:`~horizon.tables.Row.get_data` for each
+        id. Subclasses should override it to retrieve all of the objects
+        with a single (filtered) list call where the API allows it.
+        """
+        data = {}
+        for obj_id in obj_ids:
+            try:
+                data[obj_id] = self.get_data(request, obj_id)
+            except Exception as e:
+                if not isinstance(e, exceptions.NOT_FOUND):
+                    raise
+        return data
+
 
 class Cell(html.HTMLElement):
     """Represents a single cell in the table."""
@@ -722,7 +813,8 @@ class Cell(html.HTMLElement):
         attributes.
         """
         try:
-            data = self.column.get_data(self.datum)
+            # The data was computed along with the rest of the row
+            data = self.data
             if data is None:
                 if callable(self.column.empty_value):
                     data = self.column.empty_value(self.datum)
@@ -963,6 +1055,15 @@ class DataTableOptions(object):
 
         A list of permission names which this table requires in order to be
         displayed. Defaults to an empty list (``[]``).
+
+    .. attribute:: api_fields
+
+        A tuple of the API resource fields the table always needs (e.g. the
+        ``id`` used for row ids, or fields checked by actions), on top of
+        the ``api_fields`` declared by its columns. Setting it enables
+        :meth:`~DataTable.get_api_fields`, which views may pass on to APIs
+        supporting field projection such as neutron's ``fields``.
+        Default: ``None`` (the table needs complete resources).
     """
     def __init__(self, options):
         self.name = getattr(options, 'name', self.__class__.__name__)
@@ -989,6 +1090,7 @@ class DataTableOptions(object):
                                        "no_data_message",
                                        _("No items to display."))
         self.permissions = getattr(options, 'permissions', [])
+        self.api_fields = getattr(options, 'api_fields', None)
 
         # Set self.filter if we have any FilterActions
         filter_actions = [action for action in self.table_actions if
@@ -1148,6 +1250,9 @@ class DataTable(object):
 
     def __init__(self, request, data=None, needs_form_wrapper=None, **kwargs):
         self.request = request
+        self._object_index = None
+        self._selected_action = None
+        self._aggregates = None
         self.data = data
         self.kwargs = kwargs
         self._needs_form_wrapper = needs_form_wrapper
@@ -1178,6 +1283,17 @@ class DataTable(object):
     def __repr__(self):
         return '<%s: %s>' % (self.__class__.__name__, self._meta.name)
 
+    @property
+    def data(self):
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        # The id index and the aggregates are rebuilt for the new data.
+        self._object_index = None
+        self._aggregates = None
+
     @property
     def name(self):
         return self._meta.name
@@ -1245,6 +1361,39 @@ class DataTable(object):
         filter_field = self.request.session.get(param_name, '')
         return filter_field
 
+    def get_aggregates(self):
+        """Returns the summary values of the columns which have a
+        ``summation`` method, keyed by column name.
+
+        The raw data of all of these columns is gathered in a single pass
+        over the table's data, then summarized by
+        :meth:`~horizon.tables.Column.summarize`. The result is kept until
+        the data or the summation methods change.
+
+        This covers the data in the table, i.e. the current page. Override
+        it to provide values computed over the whole dataset instead, e.g.
+        from the statistics of the API being listed.
+        """
+        columns = [column for column in self.columns.values()
+                   if column.summation in column.summation_methods]
+        data = self.data or []
+        key = (len(data), tuple((column.name, column.summation)
+                                for column in columns))
+        if self._aggregates is None or self._aggregates[0] != key:
+            values = [[] for column in columns]
+            getters = [(column.get_raw_data, column_values.append)
+                       for column, column_values in zip(columns, values)]
+            for datum in data:
+                for get_raw_data, append in getters:
+                    value = get_raw_data(datum)
+                    if value is not None:
+                        append(value)
+            aggregates = dict((column.name, column.summarize(column_values))
+                              for column, column_values
+                              in zip(columns, values))
+            self._aggregates = (key, aggregates)
+        return self._aggregates[1]
+
     def _populate_data_cache(self):
         self._data_cache = {}
         # Set up hash tables to store data points for each column
@@ -1312,23 +1461,67 @@ class DataTable(object):
 
         Uses :meth:`~horizon.tables.DataTable.get_object_id` internally.
         """
-        if not isinstance(lookup, unicode):
-            lookup = unicode(str(lookup), 'utf-8')
-        matches = []
-        for datum in self.data:
-            obj_id = self.get_object_id(datum)
-            if not isinstance(obj_id, unicode):
-                obj_id = unicode(str(obj_id), 'utf-8')
-            if obj_id == lookup:
-                matches.append(datum)
-        if len(matches) > 1:
+        lookup = self._unicode_id(lookup)
+        index, duplicates = self._get_object_index()
+        if lookup in duplicates:
             raise ValueError("Multiple matches were returned for that id: %s."
-                             % matches)
-        if not matches:
+                             % duplicates[lookup])
+        if lookup not in index:
             raise exceptions.Http302(self.get_absolute_url(),
                                      _('No match returned for the id "%s".')
                                      % lookup)
-        return matches[0]
+        return index[lookup]
+
+    def get_selected_data(self, obj_ids):
+        """Returns the data objects for the ``obj_ids`` selected by the user.
+
+        Used instead of the full table data by the actions which set
+        ``fetch_selected``. By default the objects are retrieved with
+        :meth:`~horizon.tables.Row.get_data_many`; ids which are not found
+        are left out. Returns ``None`` if the row class does not implement
+        retrieving its data by id, in which case the full table data is
+        loaded as usual.
+        """
+        row_class = self._meta.row_class
+        if all(six.get_unbound_function(getattr(row_class, name)) is
+               six.get_unbound_function(getattr(Row, name))
+               for name in ('get_data', 'get_data_many')):
+            return None
+        datums = row_class(self).get_data_many(self.request, obj_ids)
+        return [datums[obj_id] for obj_id in obj_ids if obj_id in datums]
+
+    @staticmethod
+    def _unicode_id(obj_id):
+        if not isinstance(obj_id, unicode):
+            obj_id = unicode(str(obj_id), 'utf-8')
+        return obj_id
+
+    def _get_object_index(self):
+        """Returns the index of the table's data by unicode object id.
+
+        The index is built on the first lookup and kept until ``data`` is
+        reassigned, or its length changes. Data without a length, such as a
+        generator, is turned into a list first so that indexing it does not
+        consume it. Objects sharing an id are kept apart, in a dict of the
+        ids to all of their matches.
+        """
+        data = self.data or []
+        if not hasattr(data, '__len__'):
+            data = self._data = list(data)
+        key = (id(data), len(data))
+        if self._object_index is None or self._object_index[0] != key:
+            index = {}
+            duplicates = {}
+            for datum in data:
+                obj_id = self._unicode_id(self.get_object_id(datum))
+                if obj_id in duplicates:
+                    duplicates[obj_id].append(datum)
+                elif obj_id in index:
+                    duplicates[obj_id] = [index.pop(obj_id), datum]
+                else:
+                    index[obj_id] = datum
+            self._object_index = (key, index, duplicates)
+        return self._object_index[1:]
 
     @property
     def has_actions(self):
@@ -1510,7 +1703,19 @@ class DataTable(object):
             # Handle AJAX row updating.
             new_row = self._meta.row_class(self)
 
-            if new_row.ajax and new_row.ajax_action_name == action_name:
+            if new_row.ajax and new_row.ajax_batch_action_name == action_name:
+                try:
+                    rows = self.batch_update_rows(request)
+                    error = False
+                except Exception:
+                    error = exceptions.handle(request, ignore=True)
+                if request.is_ajax():
+                    if not error:
+                        return HttpResponse(json.dumps(rows),
+                                            content_type="application/json")
+                    else:
+                        return HttpResponse(status=error.status_code)
+            elif new_row.ajax and new_row.ajax_action_name == action_name:
                 try:
                     datum = new_row.get_data(request, obj_id)
                     if self.get_object_id(datum) == self.current_item_id:
@@ -1540,8 +1745,64 @@ class DataTable(object):
                         handled = self.take_action(action_name, obj_id)
                         if handled:
                             return handled
+                action = self.base_actions.get(action_name)
+                if action is not None and action.fetch_selected:
+                    return self._take_selected_action(action, obj_id)
         return None
 
+    def _take_selected_action(self, action, obj_id):
+        """Handles an action with ``fetch_selected`` set using only the
+        selected objects as the table data.
+
+        Returns ``None`` without handling the action when the selected
+        objects cannot be retrieved by id, so that it is handled by
+        :meth:`~horizon.tables.DataTable.maybe_handle` once the full table
+        data has been loaded.
+        """
+        obj_ids = [obj_id] if obj_id else \
+            self.request.POST.getlist('object_ids')
+        if action.method != self.request.method or not obj_ids:
+            return None
+        data = self.get_selected_data([self.sanitize_id(i) for i in obj_ids])
+        if data is None:
+            return None
+        self.data = data
+        self._selected_action = action.name
+        return self.take_action(action.name, obj_id, obj_ids)
+
+    def batch_update_rows(self, request):
+        """Handles a batched AJAX update of several rows.
+
+        The ids of the rows are passed as ``obj_id`` query parameters along
+        with the checksum of each row as currently displayed in
+        ``checksum__<obj_id>``. The data for all rows is retrieved with
+        :meth:`~horizon.tables.Row.get_data_many` and only the rows whose
+        checksum changed are rendered. The rows of a table are polled in
+        chunks of ``horizon.datatables.batch_update_size`` rows to keep the
+        query strings short.
+
+        Returns a dict with the rendered ``rows`` keyed by object id and the
+        list of ``deleted`` object ids.
+        """
+        obj_ids = request.GET.getlist("obj_id")
+        datums = self._meta.row_class(self).get_data_many(request, obj_ids)
+        rows = {}
+        deleted = []
+        for obj_id in obj_ids:
+            datum = datums.get(obj_id)
+            if datum is None:
+                deleted.append(obj_id)
+                continue
+            row = self._meta.row_class(self, datum)
+            if self.get_object_id(datum) == self.current_item_id:
+                self.selected = True
+                row.classes.append('current_selected')
+            checksum = request.GET.get("checksum%s%s" % (STRING_SEPARATOR,
+                                                         obj_id))
+            if row.get_checksum() != checksum:
+                rows[obj_id] = row.render()
+        return {"rows": rows, "deleted": deleted}
+
     def inline_edit_handle(self, request, table_name, action_name, obj_id,
                            new_row):
         """Inline edit handler.
@@ -1635,8 +1896,10 @@ class DataTable(object):
         if table_name == self.name and action_name:
             action_names = [action.name for action in
                             self.base_actions.values() if not action.preempt]
-            # do not run preemptive actions here
-            if action_name in action_names:
+            # do not run preemptive actions here, nor the action already
+            # handled with only the selected objects
+            if (action_name in action_names and
+                    action_name != self._selected_action):
                 return self.take_action(action_name, obj_id)
         return None
 
@@ -1669,6 +1932,22 @@ class DataTable(object):
             return datum.name
         return None
 
+    def get_api_fields(self):
+        """Returns a sorted list of the API resource fields this table needs.
+
+        This is the table's :attr:`~DataTableOptions.api_fields` plus the
+        ``api_fields`` of each of its columns, so columns removed from the
+        table don't contribute. Returns ``None`` when the table does not set
+        :attr:`~DataTableOptions.api_fields`, meaning complete resources
+        must be fetched.
+        """
+        if self._meta.api_fields is None:
+            return None
+        fields = set(self._meta.api_fields)
+        for column in self.columns.values():
+            fields.update(column.api_fields)
+        return sorted(fields)
+
     def has_prev_data(self):
         """Returns a boolean value indicating whether there is previous data
         available to this table from the source (generally an API).
@@ -10,7 +10,6 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import itertools
 import logging
 import sys
 
@@ -78,6 +77,7 @@ class FormsetDataTableMixin(object):
     def __init__(self, *args, **kwargs):
         super(FormsetDataTableMixin, self).__init__(*args, **kwargs)
         self._formset = None
+        self._editable_data = None
 
         # Override Meta settings, because we need custom Form and Cell classes,
         # and also our own template.
@@ -96,17 +96,37 @@ class FormsetDataTableMixin(object):
                     required_columns.append(column.name)
         return required_columns
 
+    def is_row_editable(self, datum):
+        """Returns whether the row of ``datum`` gets a form.
+
+        The other rows are displayed as in a normal table, and no form is
+        constructed for them. Defaults to ``True``, in which case every row
+        gets its form whenever the table is rendered: the formset is built
+        as a whole, so only the tables overriding this method (or having no
+        rows) avoid the cost of the forms of their read-only rows.
+        """
+        return True
+
+    def _get_editable_data(self):
+        if self._editable_data is None:
+            self._editable_data = [datum for datum in self.filtered_data
+                                   if self.is_row_editable(datum)]
+        return self._editable_data
+
+    def get_form_initial(self, datum):
+        """Returns the initial data of the form of ``datum``'s row."""
+        form_data = {}
+        for column in self.columns.values():
+            form_data[column.name] = column.get_data(datum)
+        form_data['id'] = self.get_object_id(datum)
+        return form_data
+
     def _get_formset_data(self):
-        """Formats the self.filtered_data in a way suitable for a formset."""
-        data = []
-        for datum in self.filtered_data:
-            form_data = {}
-            for column in self.columns.values():
-                value = column.get_data(datum)
-                form_data[column.name] = value
-            form_data['id'] = self.get_object_id(datum)
-            data.append(form_data)
-        return data
+        """Formats the editable rows of self.filtered_data in a way suitable
+        for a formset.
+        """
+        return [self.get_form_initial(datum)
+                for datum in self._get_editable_data()]
 
     def get_formset(self):
         """Provide the formset corresponding to this DataTable.
@@ -132,13 +152,23 @@ class FormsetDataTableMixin(object):
         """
         try:
             rows = []
-            if self.formset_class is None:
-                formset = []
+            editable_data = self._get_editable_data()
+            # Nothing to construct forms for, unless new rows can be added
+            # or some were submitted.
+            if self.formset_class is None or not (
+                    editable_data or self.formset_class.extra or
+                    self.request.POST):
+                forms = iter(())
             else:
                 formset = self.get_formset()
                 formset.is_valid()
-            for datum, form in itertools.izip_longest(self.filtered_data,
-                                                      formset):
+                forms = iter(formset)
+            editable = set(id(datum) for datum in editable_data)
+            data = [(datum, next(forms, None) if id(datum) in editable
+                     else None) for datum in self.filtered_data]
+            # The forms left are the extra forms, for new rows
+            data.extend((None, form) for form in forms)
+            for datum, form in data:
                 row = self._meta.row_class(self, datum, form)
                 if self.get_object_id(datum) == self.current_item_id:
                     self.selected = True
@@ -176,4 +206,9 @@ class FormsetDataTable(FormsetDataTableMixin, horizon_tables.DataTable):
         replaced with form widgets in the table. Any hidden fields from the
         formset will also be included. The fields that are not hidden and
         don't correspond to any column will not be included in the form.
+
+    The forms are only built for the rows accepted by
+    :meth:`~FormsetDataTableMixin.is_row_editable`, which accepts them all
+    by default. When it accepts none, the formset has no extra forms and
+    nothing was submitted, the formset is not built at all.
     """
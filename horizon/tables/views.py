@@ -14,11 +14,12 @@
 
 from collections import defaultdict
 
+from django.conf import settings
 from django import shortcuts
 
-from horizon import views
-
 from horizon.templatetags.horizon import has_permissions  # noqa
+from horizon.utils import functions
+from horizon import views
 
 
 class MultiTableMixin(object):
@@ -36,13 +37,20 @@ class MultiTableMixin(object):
 
     def _get_data_dict(self):
         if not self._data:
+            # The data of all of the tables is retrieved concurrently
+            names = []
+            func_list = []
             for table in self.table_classes:
-                data = []
                 name = table._meta.name
-                func_list = self._data_methods.get(name, [])
-                for func in func_list:
-                    data.extend(func())
-                self._data[name] = data
+                self._data[name] = []
+                for func in self._data_methods.get(name, []):
+                    names.append(name)
+                    func_list.append(func)
+            max_workers = getattr(settings, 'CONCURRENT_DATA_LOADS', 4)
+            results = functions.run_concurrently(*func_list,
+                                                 max_workers=max_workers)
+            for name, data in zip(names, results):
+                self._data[name].extend(data)
         return self._data
 
     def get_data_methods(self, table_classes, methods):
@@ -12,15 +12,18 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import functools
 import sys
 
 import six
 
+from django.conf import settings
 from django.template.loader import render_to_string
 from django.template import TemplateSyntaxError  # noqa
 from django.utils.datastructures import SortedDict
 
 from horizon import exceptions
+from horizon.utils import functions
 from horizon.utils import html
 
 SEPARATOR = "__"
@@ -118,14 +121,32 @@ class TabGroup(html.HTMLElement):
         return "<%s: %s>" % (self.__class__.__name__, self.slug)
 
     def load_tab_data(self):
-        """Preload all data that for the tabs that will be displayed."""
-        for tab in self._tabs.values():
-            if tab.load and not tab.data_loaded:
-                try:
-                    tab._data = tab.get_context_data(self.request)
-                except Exception:
-                    tab._data = False
-                    exceptions.handle(self.request)
+        """Preload all data that for the tabs that will be displayed.
+
+        The tabs are loaded concurrently, by at most ``CONCURRENT_DATA_LOADS``
+        threads. Errors are handled once all of them are loaded.
+        """
+        tabs = [tab for tab in self._tabs.values()
+                if tab.load and not tab.data_loaded]
+        max_workers = getattr(settings, 'CONCURRENT_DATA_LOADS', 4)
+        errors = functions.run_concurrently(
+            *[functools.partial(self._load_tab, tab) for tab in tabs],
+            max_workers=max_workers)
+        for tab, error in zip(tabs, errors):
+            if error is None:
+                continue
+            try:
+                six.reraise(*error)
+            except Exception:
+                tab._data = False
+                exceptions.handle(self.request)
+
+    def _load_tab(self, tab):
+        """Loads the data of ``tab``, returning the error it raised if any."""
+        try:
+            tab._data = tab.get_context_data(self.request)
+        except Exception:
+            return sys.exc_info()
 
     def get_id(self):
         """Returns the id for this tab group. Defaults to the value of the tab
@@ -18,14 +18,18 @@
 #    under the License.
 
 from django.conf import settings
+from django.template.base import TemplateDoesNotExist  # noqa
 from django.contrib.auth.models import User  # noqa
 from django.core.exceptions import ImproperlyConfigured  # noqa
 from django.core import urlresolvers
+from django.test.utils import override_settings  # noqa
 from django.utils.importlib import import_module  # noqa
+import mock
 
 import horizon
 from horizon import base
 from horizon import conf
+from horizon import loaders
 from horizon.test import helpers as test
 from horizon.test.test_dashboards.cats.dashboard import Cats  # noqa
 from horizon.test.test_dashboards.cats.kittens.panel import Kittens  # noqa
@@ -521,3 +525,67 @@ class RbacHorizonTests(test.TestCase):
                                  ['<Panel: rbac_panel_yes>'])
 
         self.assertTrue(dogs.can_access(context))
+
+
+class TemplateLoaderTests(BaseHorizonTests):
+
+    def setUp(self):
+        super(TemplateLoaderTests, self).setUp()
+        loaders.clear_cache()
+        self.loader = loaders.TemplateLoader()
+
+    def tearDown(self):
+        loaders.clear_cache()
+        super(TemplateLoaderTests, self).tearDown()
+
+    @override_settings(HORIZON_TEMPLATE_CACHE_CHECK_MTIME=False)
+    def test_compiled_templates_are_cached(self):
+        template, display_name = self.loader.load_template(
+            'dogs/puppies/index.html')
+        self.assertIsNone(display_name)
+        self.assertIn('dogs/puppies/index.html', loaders.template_cache)
+
+        with mock.patch('os.path.getmtime') as getmtime, \
+                mock.patch.object(loaders.TemplateLoader,
+                                  'load_template_source') as load_source:
+            cached, display_name = self.loader.load_template(
+                'dogs/puppies/index.html')
+        self.assertIs(template, cached)
+        self.assertFalse(getmtime.called)
+        self.assertFalse(load_source.called)
+
+    @override_settings(HORIZON_TEMPLATE_CACHE_CHECK_MTIME=False)
+    def test_missing_templates_are_cached(self):
+        with self.assertRaises(TemplateDoesNotExist):
+            self.loader.load_template('dogs/puppies/missing.html')
+        with mock.patch('os.path.isfile') as isfile:
+            with self.assertRaises(TemplateDoesNotExist):
+                self.loader.load_template('dogs/puppies/missing.html')
+        self.assertFalse(isfile.called)
+
+    @override_settings(HORIZON_TEMPLATE_CACHE_CHECK_MTIME=True)
+    def test_changed_templates_are_reloaded(self):
+        template, display_name = self.loader.load_template(
+            'dogs/puppies/index.html')
+        cached, display_name = self.loader.load_template(
+            'dogs/puppies/index.html')
+        self.assertIs(template, cached)
+
+        entry = loaders.template_cache['dogs/puppies/index.html']
+        loaders.template_cache['dogs/puppies/index.html'] = (
+            entry[0], entry[1], entry[2] - 1)
+        reloaded, display_name = self.loader.load_template(
+            'dogs/puppies/index.html')
+        self.assertIsNot(template, reloaded)
+
+    def test_precompile_templates(self):
+        compiled, errors = loaders.precompile_templates()
+        self.assertEqual({}, errors)
+        self.assertIn('dogs/puppies/index.html', compiled)
+        self.assertIn('dogs/puppies/two_tabs.html', compiled)
+        self.assertIn('dogs/puppies/two_tabs.html', loaders.template_cache)
+
+    def test_registering_panels_clears_cache(self):
+        self.loader.load_template('dogs/puppies/index.html')
+        Dogs.unregister(Puppies)
+        self.assertEqual({}, loaders.template_cache)
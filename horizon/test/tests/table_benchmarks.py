@@ -0,0 +1,244 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Micro-benchmarks of the rendering primitives of ``horizon.tables``.
+
+They run against synthetic data when ``WITH_BENCHMARKS`` is set; the
+following environment variables are honoured:
+
+``BENCHMARK_SIZE``
+    The number of objects in the table (default 1000).
+``BENCHMARK_ROUNDS``
+    The number of timed runs of each benchmark (default 3).
+``BENCHMARK_PROFILE``
+    Runs each benchmark once more under cProfile and prints the functions
+    with the highest cumulative time. If it names a directory, the raw
+    stats are also saved there as ``<benchmark>.prof``.
+``BENCHMARK_ALLOCATIONS``
+    Prints where memory was allocated by one run of each benchmark. Without
+    tracemalloc (Python 2) the objects still alive after the run are
+    counted by type instead.
+"""
+
+import collections
+import cProfile
+import gc
+import operator
+import os
+import pstats
+import time
+
+from django.template import defaultfilters
+from django.utils import unittest
+
+from horizon import tables
+from horizon.test import helpers as test
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+STATUSES = ('active', 'build', 'error', 'shutoff')
+
+
+class Flavor(object):
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeServer(object):
+    def __init__(self, index):
+        self.id = 'server-%06d' % index
+        self.name = 'server %d' % index
+        self.status = STATUSES[index % len(STATUSES)]
+        self.size = index * 1024 * 1024
+        self.description = 'a synthetic server number %d' % index
+        self.flavor = Flavor('m1.flavor%d' % (index % 10))
+
+
+def make_data(size):
+    return [FakeServer(i) for i in range(size)]
+
+
+def get_server_link(server):
+    return '/servers/%s/' % server.id
+
+
+_flavor_name = operator.attrgetter('flavor.name')
+
+
+def get_flavor_name(server):
+    # String transforms are plain attribute names, nested ones need a callable
+    return _flavor_name(server)
+
+
+class BenchmarkFilterAction(tables.FilterAction):
+    def filter(self, table, servers, filter_string):
+        q = filter_string.lower()
+        return [server for server in servers if q in server.name.lower()]
+
+
+class BenchmarkDeleteAction(tables.BatchAction):
+    name = "delete"
+    action_present = "Delete"
+    action_past = "Deleted"
+    data_type_singular = "Server"
+    data_type_plural = "Servers"
+
+    def allowed(self, request, server=None):
+        return server is None or server.status != 'build'
+
+    def action(self, request, obj_id):
+        pass
+
+
+class BenchmarkEditAction(tables.LinkAction):
+    name = "edit"
+    verbose_name = "Edit"
+
+    def get_link_url(self, datum=None):
+        return get_server_link(datum)
+
+
+class BenchmarkTable(tables.DataTable):
+    STATUS_CHOICES = (('active', True), ('shutoff', True),
+                      ('build', None), ('error', False))
+
+    name = tables.Column('name', link=get_server_link)
+    status = tables.Column('status', status=True,
+                           status_choices=STATUS_CHOICES)
+    size = tables.Column('size', filters=(defaultfilters.filesizeformat,))
+    flavor = tables.Column(get_flavor_name, verbose_name='Flavor')
+    description = tables.Column('description', truncate=20,
+                                filters=(defaultfilters.title,))
+
+    class Meta(object):
+        name = "servers"
+        status_columns = ["status"]
+        table_actions = (BenchmarkFilterAction, BenchmarkDeleteAction)
+        row_actions = (BenchmarkEditAction, BenchmarkDeleteAction)
+
+
+def _count_objects():
+    gc.collect()
+    return collections.Counter(type(obj).__name__ for obj in gc.get_objects())
+
+
+@unittest.skipUnless(os.environ.get('WITH_BENCHMARKS', False),
+                     "The WITH_BENCHMARKS env variable is not set.")
+class DataTableBenchmarks(test.TestCase):
+    size = int(os.environ.get('BENCHMARK_SIZE', 1000))
+    rounds = int(os.environ.get('BENCHMARK_ROUNDS', 3))
+
+    def setUp(self):
+        super(DataTableBenchmarks, self).setUp()
+        self.data = make_data(self.size)
+
+    def benchmark(self, name, func, setup=None):
+        """Times ``func``, calling ``setup`` untimed before each run.
+
+        ``func`` is passed whatever ``setup`` returns.
+        """
+        setup = setup or (lambda: None)
+        timings = []
+        for i in range(self.rounds):
+            arg = setup()
+            start = time.time()
+            func(arg)
+            timings.append(time.time() - start)
+        print("\n%s (%d objects): best %.4fs of %d"
+              % (name, self.size, min(timings), self.rounds))
+        if os.environ.get('BENCHMARK_PROFILE'):
+            self._profile(name, func, setup())
+        if os.environ.get('BENCHMARK_ALLOCATIONS'):
+            self._allocations(func, setup())
+        return min(timings)
+
+    def _profile(self, name, func, arg):
+        profile = cProfile.Profile()
+        profile.runcall(func, arg)
+        stats = pstats.Stats(profile)
+        path = os.environ['BENCHMARK_PROFILE']
+        if os.path.isdir(path):
+            stats.dump_stats(os.path.join(path, '%s.prof' % name))
+        stats.sort_stats('cumulative').print_stats(20)
+
+    def _allocations(self, func, arg):
+        if tracemalloc is not None:
+            tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+            func(arg)
+            after = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            for stat in after.compare_to(before, 'lineno')[:10]:
+                print(stat)
+            return
+        before = _count_objects()
+        result = func(arg)
+        after = _count_objects()
+        after.subtract(before)
+        for type_name, count in after.most_common(10):
+            print("%8d %s" % (count, type_name))
+        del result
+
+    def _table(self):
+        return BenchmarkTable(self.request, self.data)
+
+    def _rows(self):
+        table = self._table()
+        rows = table.get_rows()
+        table._populate_data_cache()
+        return rows
+
+    def test_get_rows(self):
+        self.benchmark('DataTable.get_rows',
+                       lambda table: table.get_rows(), self._table)
+
+    def test_load_cells(self):
+        def load_cells(table):
+            for datum in self.data:
+                table._meta.row_class(table).load_cells(datum)
+        self.benchmark('Row.load_cells', load_cells, self._table)
+
+    def test_cell_value(self):
+        def cell_values(rows):
+            # The actions and checkbox cells are rendered once, with the row
+            return [cell.value for row in rows for cell in row
+                    if not cell.column.auto]
+        self.benchmark('Cell.value', cell_values, self._rows)
+
+    def test_get_raw_data_dotted(self):
+        def get_raw_data(column):
+            return [column.get_raw_data(datum) for datum in self.data]
+        self.benchmark('Column.get_raw_data (dotted)', get_raw_data,
+                       lambda: self._table().columns['flavor'])
+
+    def test_filter_action(self):
+        def filter_data(table):
+            action = table._meta._filter_action
+            return action.filter(table, self.data, 'server 1')
+        self.benchmark('FilterAction.filter', filter_data, self._table)
+
+    def test_get_object_by_id(self):
+        ids = [datum.id for datum in self.data[::10]]
+
+        def lookup(table):
+            return [table.get_object_by_id(obj_id) for obj_id in ids]
+        self.benchmark('DataTable.get_object_by_id (%d lookups)' % len(ids),
+                       lookup, self._table)
+
+    def test_render_row_actions(self):
+        def render(table):
+            return [table.render_row_actions(datum) for datum in self.data]
+        self.benchmark('DataTable.render_row_actions', render, self._table)
@@ -13,14 +13,20 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
+import threading
+import time
+
 from django.core.urlresolvers import reverse
 from django import forms
 from django import http
 from django import shortcuts
 from django.template import defaultfilters
+from django.test.utils import override_settings
 
 from mox import IsA  # noqa
 
+from horizon import exceptions
 from horizon import tables
 from horizon.tables import formset as table_formset
 from horizon.tables import views as table_views
@@ -121,6 +127,13 @@ class MyRow(tables.Row):
         return TEST_DATA_2[0]
 
 
+class MyBatchRow(MyRow):
+    def get_data_many(self, request, obj_ids):
+        # Only the first object still exists.
+        return dict((obj_id, TEST_DATA_2[0]) for obj_id in obj_ids
+                    if obj_id == '1')
+
+
 class MyBatchAction(tables.BatchAction):
     name = "batch"
     action_present = "Batch"
@@ -139,6 +152,11 @@ class MyBatchActionWithHelpText(MyBatchAction):
     action_past = "BatchedHelp"
 
 
+class MySelectedBatchAction(MyBatchAction):
+    name = "batch_selected"
+    fetch_selected = True
+
+
 class MyToggleAction(tables.BatchAction):
     name = "toggle"
     action_present = ("Down", "Up")
@@ -263,6 +281,31 @@ class MyServerFilterTable(MyTable):
                        MyBatchActionWithHelpText)
 
 
+class MyBatchUpdateTable(MyTable):
+    class Meta(object):
+        name = "my_table"
+        status_columns = ["status"]
+        columns = ('id', 'name', 'value', 'optional', 'status')
+        row_class = MyBatchRow
+
+
+class MySelectedActionTable(MyTable):
+    class Meta(object):
+        name = "my_table"
+        columns = ('id', 'name', 'value', 'status')
+        row_class = MyBatchRow
+        table_actions = (MySelectedBatchAction,)
+        row_actions = (MySelectedBatchAction,)
+
+
+class MySelectedActionFullDataTable(MySelectedActionTable):
+    class Meta(object):
+        name = "my_table"
+        columns = ('id', 'name', 'value', 'status')
+        table_actions = (MySelectedBatchAction,)
+        row_actions = (MySelectedBatchAction,)
+
+
 class MyTableSelectable(MyTable):
     class Meta(object):
         name = "my_table"
@@ -379,6 +422,35 @@ class DataTableTests(test.TestCase):
         self.assertEqual(forms.CharField, name_column.form_field.__class__)
         self.assertEqual({'class': 'test'}, name_column.form_field_attributes)
 
+    def test_get_object_by_id(self):
+        self.table = MyTable(self.request, TEST_DATA)
+        self.assertEqual(TEST_DATA[1], self.table.get_object_by_id('2'))
+        self.assertEqual(TEST_DATA[1], self.table.get_object_by_id(2))
+        self.assertEqual(TEST_DATA[2], self.table.get_object_by_id(u'3'))
+        self.assertRaises(exceptions.Http302,
+                          self.table.get_object_by_id, '4')
+
+        # Reassigning the data replaces the index
+        self.table.data = TEST_DATA_2
+        self.assertEqual(TEST_DATA_2[0], self.table.get_object_by_id('1'))
+        self.assertRaises(exceptions.Http302,
+                          self.table.get_object_by_id, '2')
+
+    def test_get_object_by_id_unsized_data(self):
+        self.table = MyTable(self.request, (datum for datum in TEST_DATA))
+        self.assertEqual(TEST_DATA[1], self.table.get_object_by_id('2'))
+        # The generator was not used up by the lookup
+        self.assertEqual(list(TEST_DATA), list(self.table.data))
+
+        # Data replaced in place (e.g. by a subclass) replaces the index
+        self.table._data = TEST_DATA_2
+        self.assertEqual(TEST_DATA_2[0], self.table.get_object_by_id('1'))
+
+    def test_get_object_by_id_duplicates(self):
+        self.table = MyTable(self.request, TEST_DATA + TEST_DATA_2)
+        self.assertRaises(ValueError, self.table.get_object_by_id, '1')
+        self.assertEqual(TEST_DATA[1], self.table.get_object_by_id('2'))
+
     def test_table_force_no_multiselect(self):
         class TempTable(MyTable):
             class Meta(object):
@@ -391,6 +463,22 @@ class DataTableTests(test.TestCase):
                                  ['<Column: id>',
                                   '<Column: actions>'])
 
+    def test_table_api_fields(self):
+        self.table = MyTable(self.request, TEST_DATA)
+        self.assertIsNone(self.table.get_api_fields())
+
+        class TempTable(MyTable):
+            value = tables.Column('value', api_fields=('value',))
+            optional = tables.Column('optional', api_fields=('optional',))
+            status = tables.Column('status', api_fields=('status', 'value'))
+
+            class Meta(object):
+                columns = ('id', 'value', 'status')
+                api_fields = ('id',)
+        self.table = TempTable(self.request, TEST_DATA)
+        self.assertEqual(['id', 'status', 'value'],
+                         self.table.get_api_fields())
+
     def test_table_force_no_actions_column(self):
         class TempTable(MyTable):
             class Meta(object):
@@ -565,6 +653,53 @@ class DataTableTests(test.TestCase):
         self.assertEqual(u'A Status that is longer than 35 ...',
                          row.cells['status'].data)
 
+    def test_table_column_display_choices_and_filters(self):
+        def fail(value):
+            raise ValueError(value)
+
+        class DisplayTable(MyTable):
+            status = tables.Column('status',
+                                   display_choices=(('UP', 'Running'),
+                                                    ('up', 'Ignored')),
+                                   filters=(defaultfilters.upper,))
+            value = tables.Column('value', filters=(fail,
+                                                    defaultfilters.upper))
+
+            class Meta(object):
+                name = "my_table"
+                columns = ('id', 'status', 'value')
+
+        data = (FakeObject('1', 'object_1', 'value_1', 'up'),
+                FakeObject('2', 'object_2', 'value_2', 'down'))
+        self.table = DisplayTable(self.request, data)
+        rows = self.table.get_rows()
+        # The first matching choice wins, and no filter is applied to it
+        self.assertEqual('Running', rows[0].cells['status'].data)
+        self.assertEqual('DOWN', rows[1].cells['status'].data)
+        # A failing filter is skipped
+        self.assertEqual('VALUE_1', rows[0].cells['value'].data)
+        self.assertEqual('VALUE_1', rows[0].cells['value'].value)
+
+    def test_table_column_data_computed_once(self):
+        calls = []
+
+        def get_value(obj):
+            calls.append(obj.id)
+            return obj.value
+
+        class CountingTable(MyTable):
+            value = tables.Column(get_value)
+
+            class Meta(object):
+                name = "my_table"
+                columns = ('id', 'value')
+
+        self.table = CountingTable(self.request, TEST_DATA)
+        for row in self.table.get_rows():
+            [cell.value for cell in row]
+        self.table.render()
+        self.assertEqual(['1', '2', '3'], calls)
+
     def test_table_rendering(self):
         self.table = MyTable(self.request, TEST_DATA)
         # Table actions
@@ -978,6 +1113,75 @@ class DataTableTests(test.TestCase):
         self.assertEqual("Delete Me", unicode(row_actions[0].verbose_name))
         self.assertEqual("Log In", unicode(row_actions[1].verbose_name))
 
+    def test_table_batch_row_update(self):
+        params = {"table": "my_table", "action": "rows_update",
+                  "obj_id": ["1", "2"]}
+        req = self.factory.get('/my_url/', params,
+                               HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.table = MyBatchUpdateTable(req)
+        resp = self.table.maybe_preempt()
+        self.assertEqual(200, resp.status_code)
+        data = json.loads(resp.content)
+        self.assertEqual(["2"], data["deleted"])
+        self.assertEqual(["1"], data["rows"].keys())
+        self.assertIn("my_table__row__1", data["rows"]["1"])
+        self.assertIn("status_down", data["rows"]["1"])
+
+        # Rows whose checksum did not change are not rendered again.
+        table = MyBatchUpdateTable(self.request, TEST_DATA_2)
+        checksum = table.get_rows()[0].get_checksum()
+        params["checksum__1"] = checksum
+        req = self.factory.get('/my_url/', params,
+                               HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.table = MyBatchUpdateTable(req)
+        resp = self.table.maybe_preempt()
+        data = json.loads(resp.content)
+        self.assertEqual({}, data["rows"])
+        self.assertEqual(["2"], data["deleted"])
+
+    def test_fetch_selected_action(self):
+        action_string = "my_table__batch_selected__1"
+        req = self.factory.post('/my_url/', {'action': action_string})
+        self.table = MySelectedActionTable(req)
+        handled = self.table.maybe_preempt()
+        self.assertEqual(302, handled.status_code)
+        self.assertEqual("/my_url/", handled["location"])
+        self.assertEqual([TEST_DATA_2[0]], self.table.data)
+        self.assertEqual(u"Batched Item: object_1",
+                         list(req._messages)[0].message)
+
+        # The action is not taken again once the full data is loaded
+        self.table.data = TEST_DATA
+        self.assertIsNone(self.table.maybe_handle())
+
+        # Selecting multiple objects
+        req = self.factory.post('/my_url/',
+                                {'action': 'my_table__batch_selected',
+                                 'object_ids': ['1']})
+        self.table = MySelectedActionTable(req)
+        handled = self.table.maybe_preempt()
+        self.assertEqual(302, handled.status_code)
+        self.assertEqual([TEST_DATA_2[0]], self.table.data)
+
+    def test_fetch_selected_action_full_data(self):
+        # Rows which cannot be retrieved by id need the full table data
+        action_string = "my_table__batch_selected__1"
+        req = self.factory.post('/my_url/', {'action': action_string})
+        self.table = MySelectedActionFullDataTable(req)
+        self.assertIsNone(self.table.maybe_preempt())
+
+        self.table.data = TEST_DATA
+        handled = self.table.maybe_handle()
+        self.assertEqual(302, handled.status_code)
+        self.assertEqual(u"Batched Item: object_1",
+                         list(req._messages)[0].message)
+
+        # Nothing selected
+        req = self.factory.post('/my_url/',
+                                {'action': 'my_table__batch_selected'})
+        self.table = MySelectedActionTable(req)
+        self.assertIsNone(self.table.maybe_preempt())
+
     def test_server_filtering(self):
         filter_value_param = "my_table__filter__q"
         filter_field_param = '%s_field' % filter_value_param
@@ -1149,6 +1353,25 @@ class DataTableTests(test.TestCase):
         self.assertContains(res, '<td>Summary</td>', 1)
         self.assertContains(res, '<td>6</td>', 1)
 
+        # And with the "min", "max" and "count" methods.
+        table.columns['value'].summation = "max"
+        self.assertEqual(4, table.columns['value'].get_summation())
+        table.columns['value'].summation = "min"
+        self.assertEqual(2, table.columns['value'].get_summation())
+        table.columns['value'].summation = "count"
+        self.assertEqual(2, table.columns['value'].get_summation())
+        table.columns['optional'].summation = "count"
+        self.assertEqual({'value': 2, 'optional': 0},
+                         table.get_aggregates())
+        table.columns['optional'].summation = None
+
+        # An empty table counts nothing, and has no other summary values
+        empty_table = MyTable(self.request, [])
+        empty_table.columns['value'].summation = "count"
+        self.assertEqual(0, empty_table.columns['value'].get_summation())
+        empty_table.columns['value'].summation = "sum"
+        self.assertIsNone(empty_table.columns['value'].get_summation())
+
         # One last test with no summation.
         table.columns['value'].summation = None
         table.needs_summary_row = False
@@ -1166,6 +1389,17 @@ class DataTableTests(test.TestCase):
         self.assertNotContains(res, '<td>3.0</td>')
         self.assertNotContains(res, '<td>6</td>')
 
+    def test_summation_row_server_side_aggregates(self):
+        class AggregatedTable(MyTable):
+            def get_aggregates(self):
+                aggregates = super(AggregatedTable, self).get_aggregates()
+                aggregates['value'] = 42
+                return aggregates
+
+        table = AggregatedTable(self.request, TEST_DATA_4)
+        res = http.HttpResponse(table.render())
+        self.assertContains(res, '<td>42</td>', 1)
+
     def test_table_action_attributes(self):
         table = MyTable(self.request, TEST_DATA)
         self.assertTrue(table.has_actions)
@@ -1341,6 +1575,25 @@ class MultiTableView(tables.MultiTableView):
         return TEST_DATA
 
 
+class ThreadRecordingMultiTableView(MultiTableView):
+    def __init__(self, *args, **kwargs):
+        super(ThreadRecordingMultiTableView, self).__init__(*args, **kwargs)
+        self.threads = set()
+
+    def _record_thread(self):
+        self.threads.add(threading.current_thread().name)
+        # Keep the thread busy so that the other table gets another one
+        time.sleep(0.01)
+
+    def get_table_with_permissions_data(self):
+        self._record_thread()
+        return TEST_DATA_2
+
+    def get_my_table_data(self):
+        self._record_thread()
+        return TEST_DATA
+
+
 class DataTableViewTests(test.TestCase):
     def _prepare_view(self, cls, *args, **kwargs):
         req = self.factory.get('/my_url/')
@@ -1384,6 +1637,21 @@ class DataTableViewTests(test.TestCase):
         self.assertEqual(TableWithPermissions,
                          context['table_with_permissions_table'].__class__)
 
+    def test_multi_table_view_concurrent_data(self):
+        view = self._prepare_view(ThreadRecordingMultiTableView)
+        data = view._get_data_dict()
+        self.assertEqual({'table_with_permissions': list(TEST_DATA_2),
+                          'my_table': list(TEST_DATA)}, data)
+        self.assertEqual(2, len(view.threads))
+
+    @override_settings(CONCURRENT_DATA_LOADS=1)
+    def test_multi_table_view_sequential_data(self):
+        view = self._prepare_view(ThreadRecordingMultiTableView)
+        data = view._get_data_dict()
+        self.assertEqual(list(TEST_DATA), data['my_table'])
+        self.assertEqual(set([threading.current_thread().name]),
+                         view.threads)
+
     fil_value_param = "my_table__filter__q"
     fil_field_param = '%s_field' % fil_value_param
 
@@ -1473,3 +1741,36 @@ class FormsetTableTests(test.TestCase):
         form_data = form.initial
         self.assertEqual('object_1', form_data['name'])
         self.assertEqual(2, form_data['value'])
+
+    def test_rows_not_editable(self):
+        class TableForm(forms.Form):
+            value = forms.IntegerField()
+
+        TableFormset = forms.formsets.formset_factory(TableForm, extra=0)
+
+        class Table(table_formset.FormsetDataTable):
+            formset_class = TableFormset
+
+            name = tables.Column('name')
+            value = tables.Column('value')
+
+            class Meta(object):
+                name = 'table'
+
+            def is_row_editable(self, datum):
+                return datum.id == '2'
+
+        table = Table(self.request, TEST_DATA_4)
+        rows = table.get_rows()
+        self.assertEqual(2, len(rows))
+        self.assertIsNone(rows[0].form)
+        self.assertIsNone(rows[0].cells['value'].field)
+        self.assertEqual(4, rows[1].form.initial['value'])
+        self.assertEqual(1, len(table.get_formset()))
+        self.assertIn('name="table-TOTAL_FORMS"', table.render())
+
+        # No form is constructed when no row is editable
+        table = Table(self.request, TEST_DATA_4[:1])
+        rows = table.get_rows()
+        self.assertIsNone(rows[0].form)
+        self.assertIsNone(table._formset)
@@ -14,10 +14,13 @@
 
 import datetime
 import os
+import threading
+import time
 
 from django.core.exceptions import ValidationError  # noqa
 import django.template
 from django.template import defaultfilters
+from django.utils import translation
 
 from horizon import forms
 from horizon.test import helpers as test
@@ -456,3 +459,57 @@ class UnitsTests(test.TestCase):
 
         self.assertEqual(units.normalize(1, 'unknown_unit'),
                          (1, 'unknown_unit'))
+
+
+class RunConcurrentlyTests(test.TestCase):
+    def test_results_in_order(self):
+        self.assertEqual([1, 2, 3], functions.run_concurrently(
+            lambda: 1, lambda: 2, lambda: 3))
+
+    def test_error_is_reraised(self):
+        def fail():
+            raise ValueError("failed")
+
+        with self.assertRaises(ValueError):
+            functions.run_concurrently(lambda: 1, fail)
+
+    def test_first_error_is_reraised(self):
+        def fail(exc):
+            def func():
+                time.sleep(0.01 if exc is KeyError else 0)
+                raise exc()
+            return func
+
+        with self.assertRaises(KeyError):
+            functions.run_concurrently(fail(KeyError), fail(ValueError))
+
+    def test_max_workers(self):
+        threads = set()
+
+        def thread_name():
+            threads.add(threading.current_thread().name)
+            time.sleep(0.01)
+
+        functions.run_concurrently(*[thread_name] * 6, max_workers=2)
+        self.assertEqual(2, len(threads))
+
+        threads.clear()
+        functions.run_concurrently(thread_name, thread_name, max_workers=1)
+        self.assertEqual(set([threading.current_thread().name]), threads)
+
+    def test_nested_calls_run_in_the_worker(self):
+        def nested():
+            worker = threading.current_thread().name
+            threads = functions.run_concurrently(
+                lambda: threading.current_thread().name,
+                lambda: threading.current_thread().name)
+            return worker, threads
+
+        for worker, threads in functions.run_concurrently(nested, nested):
+            self.assertNotEqual(threading.current_thread().name, worker)
+            self.assertEqual([worker, worker], threads)
+
+    def test_language_is_kept(self):
+        with translation.override('fr'):
+            languages = functions.run_concurrently(translation.get_language)
+        self.assertEqual(['fr'], languages)
@@ -13,11 +13,15 @@
 import decimal
 import math
 import re
+import sys
+import threading
 
 from oslo_utils import units
+import six
 
 from django.conf import settings
 from django.contrib.auth import logout  # noqa
+from django.core import urlresolvers
 from django import http
 from django.utils.encoding import force_text
 from django.utils.functional import lazy  # noqa
@@ -145,3 +149,70 @@ def format_value(value):
     if int(value) == value:
         return int(value)
     return round(value, 1)
+
+
+# Marks the threads run_concurrently starts, see below
+_worker = threading.local()
+
+
+def run_concurrently(*functions, **kwargs):
+    """Calls each of the given functions in its own thread.
+
+    Returns the list of their results, in order, once all of them returned.
+    If any of them raised, the exception of the first one (in the order
+    given) is re-raised in the calling thread. URL reversing and
+    translations are thread local, so each thread gets the script prefix
+    and the active language of the caller.
+
+    The ``max_workers`` keyword argument bounds the number of threads used,
+    the remaining functions waiting for a free thread. A single function,
+    or a ``max_workers`` of 1, is simply called in the calling thread. So
+    are the functions given by a function which is itself being run
+    concurrently (e.g. a tab loading its data with api.base.gather), so that
+    pools are never nested and ``max_workers`` stays the bound per request.
+    """
+    max_workers = kwargs.pop('max_workers', None)
+    if kwargs:
+        raise TypeError("Unexpected keyword arguments: %s"
+                        % ", ".join(kwargs))
+    if (len(functions) < 2 or max_workers == 1 or
+            getattr(_worker, 'active', False)):
+        return [function() for function in functions]
+
+    prefix = urlresolvers.get_script_prefix()
+    language = translation.get_language()
+    results = [None] * len(functions)
+    errors = {}
+    pending = iter(enumerate(functions))
+    lock = threading.Lock()
+
+    def run():
+        urlresolvers.set_script_prefix(prefix)
+        translation.activate(language)
+        _worker.active = True
+        try:
+            while True:
+                with lock:
+                    try:
+                        index, function = next(pending)
+                    except StopIteration:
+                        return
+                try:
+                    results[index] = function()
+                except Exception:
+                    errors[index] = sys.exc_info()
+        finally:
+            _worker.active = False
+            translation.deactivate()
+
+    workers = len(functions)
+    if max_workers:
+        workers = min(workers, max_workers)
+    threads = [threading.Thread(target=run) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        six.reraise(*errors[min(errors)])
+    return results
@@ -44,6 +44,7 @@ from openstack_dashboard.api import neutron
 from openstack_dashboard.api import nova
 from openstack_dashboard.api import sahara
 from openstack_dashboard.api import swift
+from openstack_dashboard.api import tracing
 from openstack_dashboard.api import trove
 from openstack_dashboard.api import vpn
 
@@ -61,6 +62,7 @@ __all__ = [
     "neutron",
     "nova",
     "swift",
+    "tracing",
     "ceilometer",
     "trove",
     "vpn",
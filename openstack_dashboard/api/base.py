@@ -16,18 +16,22 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 from collections import Sequence  # noqa
 import logging
+import operator
+import threading
 
 from django.conf import settings
 
 from horizon import exceptions
+from horizon.utils import functions
 
 import six
 
 
 __all__ = ('APIResourceWrapper', 'APIDictWrapper',
-           'get_service_from_catalog', 'url_for',)
+           'get_service_from_catalog', 'url_for', 'gather',)
 
 
 LOG = logging.getLogger(__name__)
@@ -90,6 +94,51 @@ class APIVersionManager(object):
         self._active = None
 
 
+class ResourceRecord(object):
+    """Compact, read-only copy of the ``_attrs`` of an api object.
+
+    Each wrapper class gets its own subclass, built by :meth:`for_attrs`,
+    which stores the values in slots and exposes them under their original
+    names (``OS-EXT-STS:power_state`` is not a valid slot name). An
+    attribute the api object did not have raises ``AttributeError``.
+    """
+    __slots__ = ()
+    _classes = {}
+
+    @classmethod
+    def for_attrs(cls, attrs):
+        attrs = tuple(attrs)
+        record_class = cls._classes.get(attrs)
+        if record_class is None:
+            slots = tuple('_%d' % i for i in range(len(attrs)))
+            namespace = dict((attr, property(operator.attrgetter(slot)))
+                             for attr, slot in zip(attrs, slots))
+            namespace['__slots__'] = slots
+            namespace['_attrs'] = attrs
+            record_class = type('ResourceRecord', (cls,), namespace)
+            cls._classes[attrs] = record_class
+        return record_class
+
+    @classmethod
+    def from_resource(cls, apiresource):
+        record = cls()
+        values = getattr(apiresource, '__dict__', {})
+        resource_class = type(apiresource)
+        for attr, slot in zip(cls._attrs, cls.__slots__):
+            # Read what the client already has, a client resource which
+            # was not fully loaded would make an API call on a miss.
+            if attr in values:
+                setattr(record, slot, values[attr])
+            elif hasattr(resource_class, attr):
+                setattr(record, slot, getattr(apiresource, attr))
+        return record
+
+    def __repr__(self):
+        return "<ResourceRecord: %s>" % dict(
+            (attr, getattr(self, attr)) for attr in self._attrs
+            if hasattr(self, attr))
+
+
 class APIResourceWrapper(object):
     """Simple wrapper for api objects.
 
@@ -123,6 +172,22 @@ class APIResourceWrapper(object):
             obj[key] = getattr(self._apiresource, key, None)
         return obj
 
+    def compact(self):
+        """Returns a copy of the wrapper holding only the ``_attrs``.
+
+        The api object is replaced by a :class:`ResourceRecord`, so the
+        memory of the client object (its raw info, manager and any
+        attribute not declared in ``_attrs``) is released. Meant for the
+        objects of read-only listings: the methods of the client object
+        are no longer available on the copy.
+        """
+        compacted = object.__new__(type(self))
+        compacted.__dict__.update(self.__dict__)
+        record_class = ResourceRecord.for_attrs(self._attrs)
+        compacted._apiresource = record_class.from_resource(
+            self._apiresource)
+        return compacted
+
 
 class APIDictWrapper(object):
     """Simple wrapper for api dictionaries
@@ -296,40 +361,133 @@ def get_url_for_service(service, region, endpoint_type):
     return None
 
 
+class ServiceCatalogIndex(object):
+    """The endpoints of a service catalog, indexed for lookups.
+
+    Only the first service of each type is used, as
+    :func:`get_service_from_catalog` does. The endpoint urls are keyed by
+    (service type, region, interface), the interface being the endpoint
+    type (e.g. ``publicURL``) of a v2 catalog or the interface (e.g.
+    ``public``) of a v3 one. :meth:`url_for` and :meth:`is_enabled` give
+    the same answers as :func:`get_url_for_service` and a scan of the
+    service endpoints.
+    """
+    def __init__(self, catalog):
+        self.services = {}
+        self.regions = {}
+        self.urls = {}
+        # The endpoints of any region, for the identity service
+        self.any_region_urls = {}
+        for service in catalog or []:
+            service_type = service['type']
+            if service_type in self.services:
+                continue
+            self.services[service_type] = service
+            self.regions[service_type] = set()
+            v3 = get_version_from_service(service) >= 3
+            for endpoint in service.get('endpoints') or []:
+                region = endpoint.get('region')
+                self.regions[service_type].add(region)
+                if not v3:
+                    urls = endpoint.items()
+                elif 'interface' in endpoint and 'url' in endpoint:
+                    urls = [(endpoint['interface'], endpoint['url'])]
+                else:
+                    continue
+                for interface, url in urls:
+                    self.urls.setdefault((service_type, region, interface),
+                                         url)
+                    self.any_region_urls.setdefault(
+                        (service_type, interface), url)
+
+    def url_for(self, service_type, region, endpoint_type):
+        service = self.services.get(service_type)
+        if service is None:
+            return None
+        interface = endpoint_type
+        if get_version_from_service(service) >= 3:
+            interface = ENDPOINT_TYPE_TO_INTERFACE.get(endpoint_type, '')
+        if (service_type == 'identity' and
+                region not in self.regions[service_type]):
+            return self.any_region_urls.get((service_type, interface))
+        return self.urls.get((service_type, region, interface))
+
+    def is_enabled(self, service_type, region, service_name=None):
+        service = self.services.get(service_type)
+        if service is None:
+            return False
+        regions = self.regions[service_type]
+        # ignore region for identity
+        if region in regions or (service_type == 'identity' and regions):
+            if service_name:
+                return service['name'] == service_name
+            return True
+        return False
+
+
+# Service catalog indexes by token id, the catalog of a token never changes
+CATALOG_INDEX_CACHE_SIZE = 1000
+_catalog_indexes = collections.OrderedDict()
+_catalog_indexes_lock = threading.Lock()
+
+
+def get_catalog_index(request):
+    """Returns the :class:`ServiceCatalogIndex` of the user's catalog.
+
+    The index is built once per token and kept in the process, for the
+    ``CATALOG_INDEX_CACHE_SIZE`` most recently used tokens.
+    """
+    catalog = getattr(request.user, 'service_catalog', None)
+    token_id = getattr(getattr(request.user, 'token', None), 'id', None)
+    if not token_id:
+        return ServiceCatalogIndex(catalog)
+    with _catalog_indexes_lock:
+        index = _catalog_indexes.pop(token_id, None)
+        if index is None:
+            index = ServiceCatalogIndex(catalog)
+            if len(_catalog_indexes) >= CATALOG_INDEX_CACHE_SIZE:
+                _catalog_indexes.popitem(last=False)
+        _catalog_indexes[token_id] = index
+    return index
+
+
+def clear_catalog_indexes():
+    with _catalog_indexes_lock:
+        _catalog_indexes.clear()
+
+
 def url_for(request, service_type, endpoint_type=None, region=None):
     endpoint_type = endpoint_type or getattr(settings,
                                              'OPENSTACK_ENDPOINT_TYPE',
                                              'publicURL')
     fallback_endpoint_type = getattr(settings, 'SECONDARY_ENDPOINT_TYPE', None)
 
-    catalog = request.user.service_catalog
-    service = get_service_from_catalog(catalog, service_type)
-    if service:
-        if not region:
-            region = request.user.services_region
-        url = get_url_for_service(service,
-                                  region,
-                                  endpoint_type)
-        if not url and fallback_endpoint_type:
-            url = get_url_for_service(service,
-                                      region,
-                                      fallback_endpoint_type)
-        if url:
-            return url.replace('127.0.0.1', '172.18.195.254')
+    index = get_catalog_index(request)
+    if not region:
+        region = request.user.services_region
+    url = index.url_for(service_type, region, endpoint_type)
+    if not url and fallback_endpoint_type:
+        url = index.url_for(service_type, region, fallback_endpoint_type)
+    if url:
+        return url.replace('127.0.0.1', '172.18.195.254')
     raise exceptions.ServiceCatalogException(service_type)
 
 
 def is_service_enabled(request, service_type, service_name=None):
-    service = get_service_from_catalog(request.user.service_catalog,
-                                       service_type)
-    if service:
-        region = request.user.services_region
-        for endpoint in service['endpoints']:
-            # ignore region for identity
-            if service['type'] == 'identity' or \
-               endpoint['region'] == region:
-                if service_name:
-                    return service['name'] == service_name
-                else:
-                    return True
-    return False
+    return get_catalog_index(request).is_enabled(
+        service_type, request.user.services_region, service_name)
+
+
+def gather(*calls):
+    """Makes the given API calls concurrently and returns their results.
+
+    ``calls`` are callables taking no argument, usually a
+    ``functools.partial`` of an ``openstack_dashboard.api`` function. The
+    API clients block, so each call is made in a thread of its own, with at
+    most ``CONCURRENT_DATA_LOADS`` threads at once, and a view waiting on
+    several services waits for the slowest of them rather than for all of
+    them in turn. The results are returned in the order of ``calls``; if
+    any call raised, the exception of the first one is re-raised.
+    """
+    return functions.run_concurrently(
+        *calls, max_workers=getattr(settings, 'CONCURRENT_DATA_LOADS', 4))
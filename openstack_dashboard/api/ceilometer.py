@@ -24,6 +24,7 @@ from horizon.utils.memoized import memoized  # noqa
 from openstack_dashboard.api import base
 from openstack_dashboard.api import keystone
 from openstack_dashboard.api import nova
+from openstack_dashboard.api import tracing
 
 LOG = logging.getLogger(__name__)
 
@@ -271,6 +272,7 @@ class Statistic(base.APIResourceWrapper):
 
 
 @memoized
+@tracing.traced('metering')
 def ceilometerclient(request):
     """Initialization of Ceilometer client."""
 
@@ -33,6 +33,7 @@ from horizon.utils.memoized import memoized  # noqa
 
 from openstack_dashboard.api import base
 from openstack_dashboard.api import nova
+from openstack_dashboard.api import tracing
 
 LOG = logging.getLogger(__name__)
 
@@ -72,12 +73,6 @@ class BaseCinderAPIResourceWrapper(base.APIResourceWrapper):
         return (getattr(self._apiresource, 'description', None) or
                 getattr(self._apiresource, 'display_description', None))
 
-    def to_dict(self):
-        obj = {}
-        for key in self._attrs:
-            obj[key] = getattr(self._apiresource, key, None)
-        return obj
-
 
 class Volume(BaseCinderAPIResourceWrapper):
 
@@ -141,6 +136,7 @@ class VolumeTransfer(base.APIResourceWrapper):
 
 
 @memoized
+@tracing.traced('volume')
 def cinderclient(request):
     api_version = VERSIONS.get_active_version()
 
@@ -34,6 +34,7 @@ from horizon import exceptions
 from horizon.utils import functions as utils
 from horizon.utils.memoized import memoized  # noqa
 from openstack_dashboard.api import base
+from openstack_dashboard.api import tracing
 
 
 LOG = logging.getLogger(__name__)
@@ -41,6 +42,7 @@ VERSIONS = base.APIVersionManager("image", preferred_version=2)
 
 
 @memoized
+@tracing.traced('image')
 def glanceclient(request, version='1'):
     url = base.url_for(request, 'image')
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
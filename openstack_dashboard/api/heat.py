@@ -18,6 +18,7 @@ from heatclient import client as heat_client
 from horizon.utils import functions as utils
 from horizon.utils.memoized import memoized  # noqa
 from openstack_dashboard.api import base
+from openstack_dashboard.api import tracing
 
 LOG = logging.getLogger(__name__)
 
@@ -31,6 +32,7 @@ def format_parameters(params):
 
 
 @memoized
+@tracing.traced('orchestration')
 def heatclient(request, password=None):
     api_version = "1"
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
@@ -34,6 +34,7 @@ from horizon import messages
 from horizon.utils import functions as utils
 
 from openstack_dashboard.api import base
+from openstack_dashboard.api import tracing
 from openstack_dashboard import policy
 
 
@@ -120,6 +121,7 @@ def _get_endpoint_url(request, endpoint_type, catalog=None):
     return url
 
 
+@tracing.traced('identity')
 def keystoneclient(request, admin=False):
     """Returns a client connected to the Keystone backend.
 
@@ -34,6 +34,7 @@ from horizon import exceptions
 from horizon.utils.memoized import memoized  # noqa
 
 from openstack_dashboard.api import base
+from openstack_dashboard.api import tracing
 
 LOG = logging.getLogger(__name__)
 
@@ -43,6 +44,7 @@ SHARE_STATE_AVAILABLE = "available"
 DEFAULT_QUOTA_NAME = 'default'
 
 
+@tracing.traced('share')
 def manilaclient(request):
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
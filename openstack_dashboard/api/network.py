@@ -63,6 +63,10 @@ def tenant_floating_ip_list(request):
     return NetworkClient(request).floating_ips.list()
 
 
+def tenant_floating_ip_count(request):
+    return NetworkClient(request).floating_ips.count()
+
+
 def tenant_floating_ip_get(request, floating_ip_id):
     return NetworkClient(request).floating_ips.get(floating_ip_id)
 
@@ -110,6 +114,10 @@ def security_group_list(request):
     return NetworkClient(request).secgroups.list()
 
 
+def security_group_count(request):
+    return NetworkClient(request).secgroups.count()
+
+
 def security_group_get(request, sg_id):
     return NetworkClient(request).secgroups.get(sg_id)
 
@@ -58,6 +58,14 @@ class FloatingIpManager(object):
         """
         pass
 
+    def count(self):
+        """Returns the number of floating IPs of the project.
+
+        Backends which can count them without fetching their details
+        should override this.
+        """
+        return len(self.list())
+
     @abc.abstractmethod
     def get(self, floating_ip_id):
         """Fetches the floating IP.
@@ -184,6 +192,14 @@ class SecurityGroupManager(object):
         """
         pass
 
+    def count(self):
+        """Returns the number of security groups of the project.
+
+        Backends which can count them without fetching their details
+        should override this.
+        """
+        return len(self.list())
+
     @abc.abstractmethod
     def get(self, sg_id):
         """Fetches the security group.
@@ -36,6 +36,7 @@ from horizon.utils.memoized import memoized  # noqa
 from openstack_dashboard.api import base
 from openstack_dashboard.api import network_base
 from openstack_dashboard.api import nova
+from openstack_dashboard.api import tracing
 from openstack_dashboard import policy
 
 
@@ -86,8 +87,10 @@ class Network(NeutronAPIDictWrapper):
     """Wrapper for neutron Networks."""
 
     def __init__(self, apiresource):
-        apiresource['admin_state'] = \
-            'UP' if apiresource['admin_state_up'] else 'DOWN'
+        # admin_state_up may be left out of a fields= projection
+        if 'admin_state_up' in apiresource:
+            apiresource['admin_state'] = \
+                'UP' if apiresource['admin_state_up'] else 'DOWN'
         # Django cannot handle a key name with ':', so use '__'
         for key in apiresource.keys():
             if ':' in key:
@@ -96,7 +99,8 @@ class Network(NeutronAPIDictWrapper):
 
     def to_dict(self):
         d = dict(super(NeutronAPIDictWrapper, self).to_dict())
-        d['subnets'] = [s.to_dict() for s in d['subnets']]
+        if 'subnets' in d:
+            d['subnets'] = [s.to_dict() for s in d['subnets']]
         return d
 
 
@@ -116,8 +120,10 @@ class Port(NeutronAPIDictWrapper):
         for key in apiresource.keys():
             if ':' in key:
                 apiresource['__'.join(key.split(':'))] = apiresource[key]
-        apiresource['admin_state'] = \
-            'UP' if apiresource['admin_state_up'] else 'DOWN'
+        # admin_state_up may be left out of a fields= projection
+        if 'admin_state_up' in apiresource:
+            apiresource['admin_state'] = \
+                'UP' if apiresource['admin_state_up'] else 'DOWN'
         if 'mac_learning_enabled' in apiresource:
             apiresource['mac_state'] = \
                 ON_STATE if apiresource['mac_learning_enabled'] else OFF_STATE
@@ -245,6 +251,13 @@ class SecurityGroupManager(network_base.SecurityGroupManager):
         tenant_id = self.request.user.tenant_id
         return self._list(tenant_id=tenant_id)
 
+    def count(self):
+        # Neutron can't count, but listing only the ids skips fetching and
+        # wrapping the rules of every group.
+        tenant_id = self.request.user.tenant_id
+        return len(self.client.list_security_groups(
+            tenant_id=tenant_id, fields=['id']).get('security_groups'))
+
     def _sg_name_dict(self, sg_id, rules):
         """Create a mapping dict from secgroup id to its name."""
         related_ids = set([sg_id])
@@ -373,6 +386,13 @@ class FloatingIpManager(network_base.FloatingIpManager):
             fip['instance_id'] = None
             fip['instance_type'] = None
 
+    def count(self):
+        # Only the ids are needed to count, and unlike list() no ports
+        # have to be fetched to find the instances.
+        tenant_id = self.request.user.tenant_id
+        return len(self.client.list_floatingips(
+            tenant_id=tenant_id, fields=['id']).get('floatingips'))
+
     def list(self, all_tenants=False, **search_opts):
         if not all_tenants:
             tenant_id = self.request.user.tenant_id
@@ -387,7 +407,9 @@ class FloatingIpManager(network_base.FloatingIpManager):
         fips = fips.get('floatingips')
         # Get port list to add instance_id to floating IP list
         # instance_id is stored in device_id attribute
-        ports = port_list(self.request, **port_search_opts)
+        ports = port_list(self.request,
+                          fields=['id', 'device_id', 'device_owner'],
+                          **port_search_opts)
         port_dict = SortedDict([(p['id'], p) for p in ports])
         for fip in fips:
             self._set_instance_info(fip, port_dict.get(fip['port_id']))
@@ -523,6 +545,7 @@ def get_ipver_str(ip_version):
 
 
 @memoized
+@tracing.traced('network')
 def neutronclient(request):
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
@@ -588,8 +611,17 @@ def list_resources_with_long_filters(list_method,
 
 
 def network_list(request, **params):
+    """Return a list of networks.
+
+    Pass ``fields`` (a list of field names) to have neutron return only
+    those fields. Subnets are only expanded when ``subnets`` is among them.
+    """
     LOG.debug("network_list(): params=%s", params)
+    if params.get('fields') is None:
+        params.pop('fields', None)
     networks = neutronclient(request).list_networks(**params).get('networks')
+    if 'fields' in params and 'subnets' not in params['fields']:
+        return [Network(n) for n in networks]
     # Get subnet list to expand subnet info in network list.
     subnets = subnet_list(request)
     subnet_dict = dict([(s['id'], s) for s in subnets])
@@ -722,7 +754,14 @@ def subnet_delete(request, subnet_id):
 
 
 def port_list(request, **params):
+    """Return a list of ports.
+
+    Pass ``fields`` (a list of field names, e.g. from
+    ``DataTable.get_api_fields()``) to have neutron return only those fields.
+    """
     LOG.debug("port_list(): params=%s" % (params))
+    if params.get('fields') is None:
+        params.pop('fields', None)
     ports = neutronclient(request).list_ports(**params).get('ports')
     return [Port(p) for p in ports]
 
@@ -40,6 +40,7 @@ from horizon.utils.memoized import memoized  # noqa
 
 from openstack_dashboard.api import base
 from openstack_dashboard.api import network_base
+from openstack_dashboard.api import tracing
 
 
 LOG = logging.getLogger(__name__)
@@ -197,6 +198,9 @@ class NovaUsage(base.APIResourceWrapper):
     def memory_mb_hours(self):
         return getattr(self, "total_memory_mb_usage", 0)
 
+    def to_dict(self):
+        return self._apiresource.to_dict()
+
 
 class SecurityGroup(base.APIResourceWrapper):
     """Wrapper around novaclient.security_groups.SecurityGroup.
@@ -436,6 +440,7 @@ class FloatingIpManager(network_base.FloatingIpManager):
 
 
 @memoized
+@tracing.traced('compute')
 def novaclient(request):
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
@@ -608,7 +613,14 @@ def server_get(request, instance_id):
     return Server(novaclient(request).servers.get(instance_id), request)
 
 
-def server_list(request, search_opts=None, all_tenants=False):
+def server_list(request, search_opts=None, all_tenants=False,
+                compact=False):
+    """Lists the servers.
+
+    With ``compact`` the servers only keep their ``Server._attrs`` (see
+    :meth:`~openstack_dashboard.api.base.APIResourceWrapper.compact`),
+    which is enough for the read-only listings of many servers.
+    """
     page_size = utils.get_page_size(request)
     c = novaclient(request)
     paginate = False
@@ -625,6 +637,8 @@ def server_list(request, search_opts=None, all_tenants=False):
         search_opts['project_id'] = request.user.tenant_id
     servers = [Server(s, request)
                for s in c.servers.list(True, search_opts)]
+    if compact:
+        servers = [server.compact() for server in servers]
 
     has_more_data = False
     if paginate and len(servers) > page_size:
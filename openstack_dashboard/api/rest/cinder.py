@@ -52,7 +52,7 @@ class Volumes(generic.View):
                 request,
                 search_opts=rest_utils.parse_filters_kwargs(request)[0]
             )
-        return {'items': [u.to_dict() for u in result]}
+        return {'items': result}
 
 
 @urls.register
@@ -72,4 +72,4 @@ class VolumeSnapshots(generic.View):
             request,
             search_opts=rest_utils.parse_filters_kwargs(request)[0]
         )
-        return {'items': [u.to_dict() for u in result]}
+        return {'items': result}
@@ -46,7 +46,7 @@ class Images(generic.View):
     """
     url_regex = r'glance/images/$'
 
-    @rest_utils.ajax()
+    @rest_utils.ajax(cached=True)
     def get(self, request):
         """Get a list of images.
 
@@ -82,7 +82,7 @@ class Images(generic.View):
             request, filters=filters, **kwargs)
 
         return {
-            'items': [i.to_dict() for i in images],
+            'items': images,
             'has_more_data': has_more_data,
             'has_prev_data': has_prev_data,
         }
@@ -39,7 +39,7 @@ class Networks(generic.View):
         """
         tenant_id = request.user.tenant_id
         result = api.neutron.network_list_for_tenant(request, tenant_id)
-        return{'items': [n.to_dict() for n in result]}
+        return {'items': result}
 
     @rest_utils.ajax(data_required=True)
     def post(self, request):
@@ -77,7 +77,7 @@ class Subnets(generic.View):
     """
     url_regex = r'neutron/subnets/$'
 
-    @rest_utils.ajax()
+    @rest_utils.ajax(streamed=True)
     def get(self, request):
         """Get a list of subnets for a project
 
@@ -86,7 +86,7 @@ class Subnets(generic.View):
 
         """
         result = api.neutron.subnet_list(request, **request.GET)
-        return{'items': [n.to_dict() for n in result]}
+        return {'items': result}
 
     @rest_utils.ajax(data_required=True)
     def post(self, request):
@@ -123,7 +123,7 @@ class Ports(generic.View):
     """
     url_regex = r'neutron/ports/$'
 
-    @rest_utils.ajax()
+    @rest_utils.ajax(streamed=True)
     def get(self, request):
         """Get a list of ports for a network
 
@@ -133,4 +133,4 @@ class Ports(generic.View):
         # see
         # https://github.com/openstack/neutron/blob/master/neutron/api/v2/attributes.py
         result = api.neutron.port_list(request, **request.GET)
-        return{'items': [n.to_dict() for n in result]}
+        return {'items': result}
@@ -68,7 +68,7 @@ class AvailabilityZones(generic.View):
     """
     url_regex = r'nova/availzones/$'
 
-    @rest_utils.ajax()
+    @rest_utils.ajax(cached=True)
     def get(self, request):
         """Get a list of availability zones.
 
@@ -195,7 +195,7 @@ class Extensions(generic.View):
     """
     url_regex = r'nova/extensions/$'
 
-    @rest_utils.ajax()
+    @rest_utils.ajax(cached=True)
     def get(self, request):
         """Get a list of extensions.
 
@@ -215,7 +215,7 @@ class Flavors(generic.View):
     """
     url_regex = r'nova/flavors/$'
 
-    @rest_utils.ajax()
+    @rest_utils.ajax(cached=True)
     def get(self, request):
         """Get a list of flavors.
 
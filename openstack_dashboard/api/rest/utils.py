@@ -12,17 +12,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import functools
+import hashlib
 import json
 import logging
 
 from django.conf import settings
 from django import http
+from django.core.cache import cache
 from django.utils import decorators
+from django.utils import http as utils_http
+from django.utils import module_loading
 
 from oslo_serialization import jsonutils
+import six
+try:
+    import simplejson as json_encoder
+    # Looking up _asdict() on a client resource may trigger a lazy load
+    json_encoder_options = {'namedtuple_as_object': False}
+except ImportError:
+    json_encoder = json
+    json_encoder_options = {}
 
 from horizon import exceptions
 
+from openstack_dashboard.api import base as api_base
+from openstack_dashboard.api import tracing
+
 log = logging.getLogger(__name__)
 
 
@@ -35,10 +50,182 @@ http_errors = exceptions.UNAUTHORIZED + exceptions.NOT_FOUND + \
     exceptions.RECOVERABLE + (AjaxError, )
 
 
+def _to_serializable(obj):
+    '''``default`` hook for the JSON encoder.
+
+    API wrappers (and client resources) are converted as the encoder
+    reaches them, so views may return lists of resources directly rather
+    than building a list of dicts up front. This is what a serializer set
+    in REST_API_JSON_SERIALIZER gets; the default one writes most wrappers
+    without calling it, see _iterencode().
+    '''
+    to_dict = getattr(obj, 'to_dict', None)
+    if callable(to_dict):
+        data = to_dict()
+        if isinstance(data, dict):
+            return data
+    return jsonutils.to_primitive(obj)
+
+
+# The wrapper classes which do not override to_dict() get written straight
+# from the data they wrap, by type
+_wrapper_kinds = {}
+
+
+def _wrapper_kind(obj):
+    obj_type = type(obj)
+    try:
+        return _wrapper_kinds[obj_type]
+    except KeyError:
+        kind = None
+        for wrapper_class in (api_base.APIDictWrapper,
+                              api_base.APIResourceWrapper):
+            if issubclass(obj_type, wrapper_class):
+                plain = (six.get_unbound_function(obj_type.to_dict) is
+                         six.get_unbound_function(wrapper_class.to_dict))
+                kind = wrapper_class if plain else 'custom'
+        _wrapper_kinds[obj_type] = kind
+        return kind
+
+
+def _has_wrappers(obj):
+    if _wrapper_kind(obj):
+        return True
+    if isinstance(obj, dict):
+        return any(_has_wrappers(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_wrappers(value) for value in obj)
+    return False
+
+
+def _encode(encoder, obj):
+    # encoder.encode() sets up a whole encoder for anything but a string
+    if obj is None:
+        return 'null'
+    elif obj is True:
+        return 'true'
+    elif obj is False:
+        return 'false'
+    elif type(obj) in six.integer_types:
+        return str(obj)
+    return encoder.encode(obj)
+
+
+def _encode_key(encoder, key):
+    if isinstance(key, six.string_types):
+        return encoder.encode(key)
+    # JSON object keys are strings, e.g. 1 becomes "1"
+    return encoder.encode(_encode(encoder, key))
+
+
+_encoded_attrs = {}
+
+
+def _encoded_attrs_of(encoder, wrapper):
+    """The ``_attrs`` of ``wrapper``, each with its encoded key."""
+    cache_key = (type(wrapper), encoder.sort_keys, encoder.key_separator)
+    attrs = _encoded_attrs.get(cache_key)
+    if attrs is None:
+        keys = sorted(wrapper._attrs) if encoder.sort_keys else wrapper._attrs
+        attrs = [(key, _encode_key(encoder, key) + encoder.key_separator)
+                 for key in keys]
+        _encoded_attrs[cache_key] = attrs
+    return attrs
+
+
+def _iterencode_items(encoder, items):
+    yield '{'
+    for i, (key, value) in enumerate(items):
+        if i:
+            yield encoder.item_separator
+        yield _encode_key(encoder, key)
+        yield encoder.key_separator
+        for chunk in _iterencode(encoder, value):
+            yield chunk
+    yield '}'
+
+
+def _iterencode_list(encoder, values):
+    yield '['
+    for i, value in enumerate(values):
+        if i:
+            yield encoder.item_separator
+        for chunk in _iterencode(encoder, value):
+            yield chunk
+    yield ']'
+
+
+def _unwrap(obj):
+    # The wrapped dict itself, rather than a copy
+    if _wrapper_kind(obj) is api_base.APIDictWrapper:
+        return obj._apidict
+    return obj
+
+
+def _iterencode(encoder, obj):
+    '''Encode ``obj`` with ``encoder``, one chunk at a time.
+
+    The API wrappers which do not override ``to_dict()`` are written
+    straight from their ``_apidict`` or from the ``_attrs`` of their api
+    object, without building a dict for each of them first. Values with no
+    wrapper in them are left to ``encoder.encode()`` as a whole.
+    '''
+    obj = _unwrap(obj)
+    if _wrapper_kind(obj) is api_base.APIResourceWrapper:
+        resource = obj._apiresource
+        attrs = _encoded_attrs_of(encoder, obj)
+        values = [getattr(resource, key, None) for key, prefix in attrs]
+        if any(_has_wrappers(value) for value in values):
+            return _iterencode_items(
+                encoder, zip([key for key, prefix in attrs], values))
+        return iter(('{%s}' % encoder.item_separator.join(
+            [prefix + _encode(encoder, value)
+             for (key, prefix), value in zip(attrs, values)]),))
+    if isinstance(obj, (list, tuple)):
+        values = [_unwrap(value) for value in obj]
+        if any(_has_wrappers(value) for value in values):
+            return _iterencode_list(encoder, values)
+        return iter((encoder.encode(values),))
+    if isinstance(obj, dict) and _has_wrappers(obj):
+        items = sorted(obj.items()) if encoder.sort_keys else obj.items()
+        return _iterencode_items(encoder, items)
+    # Wrappers with their own to_dict() are left to the default hook
+    return iter((_encode(encoder, obj),))
+
+
+def _default_dumps(data, **kwargs):
+    kwargs.update(json_encoder_options)
+    encoder = json_encoder.JSONEncoder(**kwargs)
+    return ''.join(_iterencode(encoder, data))
+
+
+_serializers = {}
+
+
+def _serializer():
+    path = getattr(settings, 'REST_API_JSON_SERIALIZER', None)
+    if path not in _serializers:
+        _serializers[path] = module_loading.import_by_path(path) if path \
+            else _default_dumps
+    return _serializers[path]
+
+
+def dumps(data):
+    '''Serialize data for a REST API response.
+
+    The serializer defaults to the simplejson encoder when simplejson is
+    installed and to the standard library one otherwise, see _iterencode();
+    REST_API_JSON_SERIALIZER may name another ``json.dumps`` compatible
+    callable by dotted path. The serializer is only imported once.
+    '''
+    return _serializer()(data, default=_to_serializable,
+                         sort_keys=settings.DEBUG)
+
+
 class CreatedResponse(http.HttpResponse):
     def __init__(self, location, data=None):
         if data is not None:
-            content = jsonutils.dumps(data, sort_keys=settings.DEBUG)
+            content = dumps(data)
             content_type = 'application/json'
         else:
             content = ''
@@ -53,7 +240,7 @@ class JSONResponse(http.HttpResponse):
         if status == 204:
             content = ''
         else:
-            content = jsonutils.dumps(data, sort_keys=settings.DEBUG)
+            content = dumps(data)
 
         super(JSONResponse, self).__init__(
             status=status,
@@ -62,7 +249,140 @@ class JSONResponse(http.HttpResponse):
         )
 
 
-def ajax(authenticated=True, data_required=False):
+# Listings with more items than this are streamed by the ajax decorator of
+# the views which allow it
+STREAMING_LISTING_SIZE = 1000
+
+
+class StreamingJSONResponse(http.StreamingHttpResponse):
+    '''JSON response which is encoded while it is being sent.
+
+    Meant for very large listings: the encoded payload is never held in
+    memory as a whole. Streamed responses carry no ETag and are never put in
+    the response cache. The data is encoded after the status was sent, so
+    an error raised while encoding it (e.g. by an attribute loaded lazily
+    from an API) can only truncate the response: only stream data which is
+    fully loaded.
+    '''
+    chunk_size = 64 * 1024
+
+    def __init__(self, data, status=200, content_type='application/json'):
+        super(StreamingJSONResponse, self).__init__(
+            self._iter_chunks(data),
+            status=status,
+            content_type=content_type,
+        )
+
+    def _iter_chunks(self, data):
+        encoder = json_encoder.JSONEncoder(default=_to_serializable,
+                                           sort_keys=settings.DEBUG,
+                                           **json_encoder_options)
+        chunks = []
+        size = 0
+        for chunk in _iterencode(encoder, data):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.chunk_size:
+                yield ''.join(chunks)
+                chunks = []
+                size = 0
+        if chunks:
+            yield ''.join(chunks)
+
+
+def _is_large_listing(data):
+    items = data.get('items') if isinstance(data, dict) else None
+    return (isinstance(items, (list, tuple)) and
+            len(items) > STREAMING_LISTING_SIZE)
+
+
+RESPONSE_CACHE_PREFIX = 'horizon:rest:response'
+
+
+def _etag(content):
+    return hashlib.md5(content).hexdigest()
+
+
+def _etag_matches(request, etag):
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if not if_none_match:
+        return False
+    etags = utils_http.parse_etags(if_none_match)
+    return '*' in etags or etag in etags
+
+
+def _not_modified(etag):
+    response = http.HttpResponseNotModified()
+    response['ETag'] = utils_http.quote_etag(etag)
+    return response
+
+
+def _response_cache_timeout():
+    return getattr(settings, 'REST_API_RESPONSE_CACHE_TIMEOUT', 0)
+
+
+def _use_response_cache(request, cached):
+    return (cached and request.method == 'GET' and
+            _response_cache_timeout())
+
+
+def _cached_response(request):
+    if not _use_response_cache(request, True):
+        return None
+    hit = cache.get(_response_cache_key(request))
+    tracing.record_cache(request, hit is not None)
+    if hit is None:
+        return None
+    etag, content = hit
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    response = http.HttpResponse(content, content_type='application/json')
+    response['ETag'] = utils_http.quote_etag(etag)
+    return response
+
+
+def _etag_response(request, response, cached=False):
+    '''Tag a GET response, storing it in the response cache if cached is
+    true, and swap it for a 304 if the client already holds the same content.
+    '''
+    if request.method != 'GET':
+        return response
+    etag = _etag(response.content)
+    if _use_response_cache(request, cached):
+        cache.set(_response_cache_key(request), (etag, response.content),
+                  _response_cache_timeout())
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    response['ETag'] = utils_http.quote_etag(etag)
+    return response
+
+
+def _to_response(request, data, cached, streamed):
+    if isinstance(data, (http.HttpResponse, http.StreamingHttpResponse)):
+        return data
+    elif data is None:
+        return JSONResponse('', status=204)
+    elif streamed and _is_large_listing(data):
+        return StreamingJSONResponse(data)
+    return _etag_response(request, JSONResponse(data), cached)
+
+
+def _response_cache_key(request):
+    '''Build a per-user cache key for a GET request.
+
+    The key covers the token (so users and projects never share entries),
+    the region, and the full path including the query string.
+    '''
+    token = getattr(request.user, 'token', None)
+    token_id = getattr(token, 'id', None) or ''
+    region = getattr(request.user, 'services_region', None) or ''
+    key = '%s|%s|%s' % (token_id, region, request.get_full_path())
+    return '%s:%s' % (RESPONSE_CACHE_PREFIX,
+                      hashlib.md5(key.encode('utf-8')).hexdigest())
+
+
+def ajax(authenticated=True, data_required=False, cached=False,
+         streamed=False):
     '''Provide a decorator to wrap a view method so that it may exist in an
     entirely AJAX environment:
 
@@ -77,18 +397,34 @@ def ajax(authenticated=True, data_required=False):
     If data_required is true then we'll assert that there is a JSON body
     present.
 
+    Successful GET responses carry an ETag; a request whose If-None-Match
+    header matches it gets a 304 "NOT MODIFIED" with no body.
+
+    If streamed is true then listings of more than STREAMING_LISTING_SIZE
+    items are sent as a StreamingJSONResponse instead, without an ETag. An
+    error while encoding a streamed listing cannot be reported with an
+    error status any more, so only views whose items are fully loaded
+    (e.g. dicts) should set it.
+
+    If cached is true then successful GET responses are additionally kept
+    in the Django cache, per user and per full request path, for
+    REST_API_RESPONSE_CACHE_TIMEOUT seconds (disabled when 0). This is meant
+    for listings which change rarely but are polled often.
+
     The wrapped view method should return either:
 
     - JSON serialisable data
-    - an object of the django http.HttpResponse subclass (one of JSONResponse
-      or CreatedResponse is suggested)
+    - an object of the django http.HttpResponse or http.StreamingHttpResponse
+      subclasses (one of JSONResponse, CreatedResponse or
+      StreamingJSONResponse is suggested)
     - nothing
 
     Methods returning nothing (or None explicitly) will result in a 204 "NO
     CONTENT" being returned to the caller.
     '''
     def decorator(function, authenticated=authenticated,
-                  data_required=data_required):
+                  data_required=data_required, cached=cached,
+                  streamed=streamed):
         @functools.wraps(function,
                          assigned=decorators.available_attrs(function))
         def _wrapped(self, request, *args, **kw):
@@ -109,14 +445,15 @@ def ajax(authenticated=True, data_required=False):
                 if not request.DATA:
                     return JSONResponse('request requires JSON body', 400)
 
+            if cached:
+                response = _cached_response(request)
+                if response is not None:
+                    return response
+
             # invoke the wrapped function, handling exceptions sanely
             try:
                 data = function(self, request, *args, **kw)
-                if isinstance(data, http.HttpResponse):
-                    return data
-                elif data is None:
-                    return JSONResponse('', status=204)
-                return JSONResponse(data)
+                return _to_response(request, data, cached, streamed)
             except http_errors as e:
                 # exception was raised with a specific HTTP status
                 if hasattr(e, 'http_status'):
@@ -18,6 +18,7 @@ from django.conf import settings
 from horizon import exceptions
 from horizon.utils.memoized import memoized  # noqa
 from openstack_dashboard.api import base
+from openstack_dashboard.api import tracing
 
 from saharaclient import client as api_client
 
@@ -44,6 +45,7 @@ VERSIONS.load_supported_version(1.1, {"client": api_client,
 
 
 @memoized
+@tracing.traced('data-processing')
 def client(request):
     try:
         service_type = SAHARA_SERVICE
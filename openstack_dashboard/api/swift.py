@@ -16,9 +16,12 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
 import logging
+import threading
 
 from oslo_utils import timeutils
+from six.moves import queue
 import six.moves.urllib.parse as urlparse
 import swiftclient
 
@@ -29,6 +32,7 @@ from horizon import exceptions
 from horizon.utils.memoized import memoized  # noqa
 
 from openstack_dashboard.api import base
+from openstack_dashboard.api import tracing
 
 
 LOG = logging.getLogger(__name__)
@@ -36,6 +40,11 @@ FOLDER_DELIMITER = "/"
 # Swift ACL
 GLOBAL_READ_ACL = ".r:*"
 LIST_CONTENTS_ACL = ".rlistings"
+# The number of listing pages swift_filter_objects reads at most
+FILTER_MAX_PAGES = 10
+# The number of concurrent requests used for bulk operations when the
+# cluster has no bulk delete middleware
+BULK_WORKERS = 10
 
 
 class Container(base.APIDictWrapper):
@@ -105,19 +114,36 @@ def _metadata_to_header(metadata):
     return headers
 
 
-@memoized
-def swift_api(request):
+def _ssl_options():
+    return {'cacert': getattr(settings, 'OPENSTACK_SSL_CACERT', None),
+            'insecure': getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)}
+
+
+@tracing.traced('object-store')
+def _swift_connection(request):
     endpoint = base.url_for(request, 'object-store')
-    cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
-    insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     return swiftclient.client.Connection(None,
                                          request.user.username,
                                          None,
                                          preauthtoken=request.user.token.id,
                                          preauthurl=endpoint,
-                                         cacert=cacert,
-                                         insecure=insecure,
-                                         auth_version="2.0")
+                                         auth_version="2.0",
+                                         **_ssl_options())
+
+
+@memoized
+def swift_api(request):
+    return _swift_connection(request)
+
+
+@memoized
+def swift_get_capabilities(request):
+    """Returns the cluster's /info capabilities, or ``{}`` if unavailable."""
+    try:
+        return swift_api(request).get_capabilities()
+    except Exception:
+        LOG.info('Unable to retrieve the Swift capabilities.')
+        return {}
 
 
 def swift_container_exists(request, container_name):
@@ -139,8 +165,7 @@ def swift_object_exists(request, container_name, object_name):
 def swift_get_containers(request, marker=None):
     limit = getattr(settings, 'API_RESULT_LIMIT', 1000)
     headers, containers = swift_api(request).get_account(limit=limit + 1,
-                                                         marker=marker,
-                                                         full_listing=True)
+                                                         marker=marker)
     container_objs = [Container(c) for c in containers]
     if(len(container_objs) > limit):
         return (container_objs[0:-1], True)
@@ -198,8 +223,8 @@ def swift_update_container(request, name, metadata=({})):
 def swift_delete_container(request, name):
     # It cannot be deleted if it's not empty. The batch remove of objects
     # be done in swiftclient instead of Horizon.
-    objects, more = swift_get_objects(request, name)
-    if objects:
+    headers = swift_api(request).head_container(name)
+    if int(headers.get('x-container-object-count', 0)):
         error_msg = _("The container cannot be deleted "
                       "since it is not empty.")
         exc = exceptions.Conflict(error_msg)
@@ -215,8 +240,7 @@ def swift_get_objects(request, container_name, prefix=None, marker=None,
     kwargs = dict(prefix=prefix,
                   marker=marker,
                   limit=limit + 1,
-                  delimiter=FOLDER_DELIMITER,
-                  full_listing=True)
+                  delimiter=FOLDER_DELIMITER)
     headers, objects = swift_api(request).get_container(container_name,
                                                         **kwargs)
     object_objs = _objectify(objects, container_name)
@@ -228,24 +252,43 @@ def swift_get_objects(request, container_name, prefix=None, marker=None,
 
 
 def swift_filter_objects(request, filter_string, container_name, prefix=None,
-                         marker=None):
-    # FIXME(kewu): Swift currently has no real filtering API, thus the marker
-    # parameter here won't actually help the pagination. For now I am just
-    # getting the largest number of objects from a container and filtering
-    # based on those objects.
-    limit = 9999
-    objects = swift_get_objects(request,
-                                container_name,
-                                prefix=prefix,
-                                marker=marker,
-                                limit=limit)
+                         marker=None, limit=None):
+    """Returns the objects and pseudo-folders matching filter_string.
+
+    Swift has no server side search, so the listing (narrowed by prefix and
+    the folder delimiter) is read one page at a time from marker on and
+    matched here. Reading stops as soon as ``limit`` (API_RESULT_LIMIT by
+    default) matches are found, at the end of the listing, or after
+    FILTER_MAX_PAGES pages.
+
+    Returns a tuple of the matches and whether they are truncated, i.e.
+    reading stopped before the end of the listing.
+    """
+    limit = limit or getattr(settings, 'API_RESULT_LIMIT', 1000)
     filter_string_list = filter_string.lower().strip().split(' ')
 
     def matches_filter(obj):
         for q in filter_string_list:
             return wildcard_search(obj.name.lower(), q)
 
-    return filter(matches_filter, objects[0])
+    matches = []
+    for page in range(FILTER_MAX_PAGES):
+        objects, more = swift_get_objects(request,
+                                          container_name,
+                                          prefix=prefix,
+                                          marker=marker,
+                                          limit=limit)
+        for index, obj in enumerate(objects):
+            if matches_filter(obj):
+                matches.append(obj)
+                if len(matches) >= limit:
+                    return (matches, more or index + 1 < len(objects))
+        if not more:
+            return (matches, False)
+        # pseudo-folders are listed under their subdir, which is also the
+        # marker swift expects to continue after them
+        marker = objects[-1].get('subdir') or objects[-1].name
+    return (matches, True)
 
 
 def wildcard_search(string, q):
@@ -306,17 +349,22 @@ def swift_create_pseudo_folder(request, container_name, pseudo_folder_name):
     return PseudoFolder(obj_info, container_name)
 
 
-def swift_delete_object(request, container_name, object_name):
+def swift_pseudo_folder_is_empty(request, container_name, folder_name):
     objects, more = swift_get_objects(request, container_name,
-                                      prefix=object_name)
-    # In case the given object is pseudo folder,
-    # it can be deleted only if it is empty.
+                                      prefix=folder_name, limit=1)
     # swift_get_objects will return at least
     # one object (i.e container_name) even if the
-    # given pseudo folder is empty. So if swift_get_objects
-    # returns more than one object then only it will be
+    # given pseudo folder is empty. So if the listing
+    # has more than one object then only it will be
     # considered as non empty folder.
-    if len(objects) > 1:
+    return not more
+
+
+def swift_delete_object(request, container_name, object_name):
+    # In case the given object is pseudo folder,
+    # it can be deleted only if it is empty.
+    if not swift_pseudo_folder_is_empty(request, container_name,
+                                        object_name):
         error_msg = _("The pseudo folder cannot be deleted "
                       "since it is not empty.")
         exc = exceptions.Conflict(error_msg)
@@ -326,6 +374,112 @@ def swift_delete_object(request, container_name, object_name):
     return True
 
 
+def _close_http_connection(http_conn):
+    # The requests based connections of recent swiftclient versions have
+    # no close() of their own, their session holds the sockets.
+    close = getattr(http_conn, 'close', None)
+    if close is None:
+        close = getattr(getattr(http_conn, 'request_session', None),
+                        'close', None)
+    if close is not None:
+        close()
+
+
+def _bulk_delete(request, container_name, object_names, max_deletes):
+    # Connection.post_account() cannot send a request body with the
+    # swiftclient versions supported, so the POST goes through a plain
+    # swiftclient HTTP connection to the account.
+    endpoint = base.url_for(request, 'object-store')
+    headers = {'X-Auth-Token': request.user.token.id,
+               'Accept': 'application/json',
+               'Content-Type': 'text/plain'}
+    results = {}
+    parsed, http_conn = swiftclient.client.http_connection(
+        endpoint, **_ssl_options())
+    try:
+        for start in range(0, len(object_names), max_deletes):
+            names = object_names[start:start + max_deletes]
+            body = '\n'.join(urlparse.quote(
+                (u'/%s/%s' % (container_name, name)).encode('utf8'))
+                for name in names)
+            http_conn.request('POST', parsed.path + '?bulk-delete', body,
+                              headers)
+            resp = http_conn.getresponse()
+            content = resp.read()
+            result = json.loads(content) if content else {}
+            status = int(result.get('Response Status',
+                                    '%s' % resp.status)[:3])
+            if resp.status >= 300 or (status >= 300 and
+                                      not result.get('Errors')):
+                error = swiftclient.client.ClientException(
+                    'Bulk delete failed', http_status=status,
+                    http_reason=resp.reason, http_response_content=content)
+                results.update((name, error) for name in names)
+                continue
+            results.update((name, None) for name in names)
+            for path, error_status in result.get('Errors', []):
+                path = urlparse.unquote(path.encode('utf8')).decode('utf8')
+                name = path.lstrip('/').split('/', 1)[-1]
+                results[name] = swiftclient.client.ClientException(
+                    'Object DELETE failed',
+                    http_status=int(error_status[:3]),
+                    http_reason=error_status)
+    finally:
+        _close_http_connection(http_conn)
+    return results
+
+
+def _concurrent_delete(request, container_name, object_names):
+    pending = queue.Queue()
+    for name in object_names:
+        pending.put(name)
+    results = {}
+
+    def worker():
+        # swiftclient connections are not thread safe, each worker gets one
+        conn = _swift_connection(request)
+        while True:
+            try:
+                name = pending.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                conn.delete_object(container_name, name)
+                results[name] = None
+            except swiftclient.client.ClientException as e:
+                # an object already gone counts as deleted
+                not_found = getattr(e, 'http_status', None) == 404
+                results[name] = None if not_found else e
+            except Exception as e:
+                results[name] = e
+
+    threads = [threading.Thread(target=worker)
+               for i in range(min(BULK_WORKERS, len(object_names)))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def swift_delete_objects(request, container_name, object_names):
+    """Deletes many objects from one container.
+
+    Uses the bulk delete middleware when the cluster advertises it, and up
+    to BULK_WORKERS concurrent DELETE requests otherwise. Returns a dict
+    mapping each object name to ``None`` if it was deleted (or was already
+    gone), or to the exception which prevented it.
+    """
+    if not object_names:
+        return {}
+    bulk_delete = swift_get_capabilities(request).get('bulk_delete')
+    if bulk_delete:
+        max_deletes = bulk_delete.get('max_deletes_per_request', 10000)
+        return _bulk_delete(request, container_name, list(object_names),
+                            max_deletes)
+    return _concurrent_delete(request, container_name, object_names)
+
+
 def swift_get_object(request, container_name, object_name, with_data=True):
     if with_data:
         headers, data = swift_api(request).get_object(container_name,
@@ -0,0 +1,289 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Tracing of the calls made to the OpenStack services while serving a request.
+
+The client factories of ``openstack_dashboard.api`` are decorated with
+:func:`traced`. When the request is being traced, the clients they return
+are wrapped so that each call to a client method is recorded with its
+duration and the number of items it returned. Caches record their hits and
+misses with :func:`record_cache`.
+
+:class:`ApiTraceMiddleware` decides which requests are traced, according to
+the ``API_TRACE`` setting, and reports the trace in a response header, a
+log line and, optionally, a panel appended to HTML pages.
+"""
+
+import collections
+import functools
+import inspect
+import json
+import logging
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.template.loader import render_to_string
+from django.utils.encoding import force_text
+
+LOG = logging.getLogger(__name__)
+
+HEADER = 'X-Horizon-API-Trace'
+# The number of calls kept in a trace, the counts and the per service and
+# per call summaries include the ones dropped.
+MAX_CALLS = 500
+
+DEFAULT_CONFIG = {
+    'enabled': False,
+    'sample_rate': 1.0,
+    'header': True,
+    'log': True,
+    'panel': False,
+}
+
+
+def get_config():
+    config = dict(DEFAULT_CONFIG)
+    config.update(getattr(settings, 'API_TRACE', {}))
+    return config
+
+
+Call = collections.namedtuple('Call', ['service', 'name', 'duration',
+                                       'items', 'error'])
+
+
+class Trace(object):
+    """The upstream calls and cache lookups made for one request."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.duration = None
+        self.calls = []
+        self.call_count = 0
+        self.call_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._services = collections.defaultdict(
+            lambda: {'calls': 0, 'time': 0.0})
+        self._call_counts = collections.Counter()
+        # calls may be made from several threads, see run_concurrently
+        self._lock = threading.Lock()
+
+    def add_call(self, service, name, duration, items=None, error=None):
+        with self._lock:
+            self.call_count += 1
+            self.call_time += duration
+            self._services[service]['calls'] += 1
+            self._services[service]['time'] += duration
+            self._call_counts['%s:%s' % (service, name)] += 1
+            if len(self.calls) < MAX_CALLS:
+                self.calls.append(Call(service, name, duration, items, error))
+
+    def add_cache_lookup(self, hit):
+        with self._lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+
+    def finish(self):
+        self.duration = time.time() - self.started
+
+    def services(self):
+        """Returns the number of calls and time spent for each service."""
+        with self._lock:
+            return dict((service, dict(summary))
+                        for service, summary in self._services.items())
+
+    def repeated_calls(self):
+        """Returns the calls made more than once, the usual N+1 suspects."""
+        with self._lock:
+            return dict((name, count)
+                        for name, count in self._call_counts.items()
+                        if count > 1)
+
+    def header_value(self):
+        return ('calls=%d; time=%.3f; cache_hits=%d; cache_misses=%d'
+                % (self.call_count, self.call_time, self.cache_hits,
+                   self.cache_misses))
+
+    def to_dict(self):
+        return {'calls': self.call_count,
+                'time': round(self.call_time, 6),
+                'duration': round(self.duration or 0.0, 6),
+                'cache_hits': self.cache_hits,
+                'cache_misses': self.cache_misses,
+                'services': self.services(),
+                'repeated': self.repeated_calls()}
+
+
+def get_trace(request):
+    trace = getattr(request, '_api_trace', None)
+    return trace if isinstance(trace, Trace) else None
+
+
+def record_cache(request, hit):
+    """Records a cache lookup made for the request, if it is traced."""
+    trace = get_trace(request)
+    if trace is not None:
+        trace.add_cache_lookup(hit)
+
+
+def _count_items(result):
+    # Swift returns the listings along with the response headers
+    if (isinstance(result, tuple) and len(result) == 2 and
+            isinstance(result[0], dict) and isinstance(result[1], list)):
+        return len(result[1])
+    if isinstance(result, (list, tuple)):
+        return len(result)
+    # Neutron and Swift wrap listings in a dict with a single list
+    if isinstance(result, dict) and len(result) == 1:
+        value = list(result.values())[0]
+        if isinstance(value, list):
+            return len(value)
+    return None
+
+
+def _traced_iteration(trace, service, name, iterator, duration):
+    # Generators (e.g. glance's paginated listings) make their calls while
+    # they are consumed, so the call is timed and counted as they are.
+    items = 0
+    error = None
+    try:
+        while True:
+            start = time.time()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                duration += time.time() - start
+                return
+            except Exception as exc:
+                duration += time.time() - start
+                error = exc.__class__.__name__
+                raise
+            duration += time.time() - start
+            items += 1
+            yield item
+    finally:
+        trace.add_call(service, name, duration, items=items, error=error)
+
+
+class TracedClient(object):
+    """Records the calls made through a client and the objects it holds."""
+
+    def __init__(self, obj, trace, service, path=()):
+        self.__dict__['_obj'] = obj
+        self.__dict__['_trace'] = trace
+        self.__dict__['_service'] = service
+        self.__dict__['_path'] = path
+        self.__dict__['_package'] = type(obj).__module__.split('.')[0]
+
+    def __getattr__(self, name):
+        value = getattr(self._obj, name)
+        if name.startswith('_'):
+            return value
+        if inspect.ismethod(value):
+            return self._wrap_method(value, self._path + (name,))
+        # Managers (e.g. client.servers) come from the client package
+        if (not inspect.isclass(value) and
+                type(value).__module__.split('.')[0] == self._package):
+            return TracedClient(value, self._trace, self._service,
+                                self._path + (name,))
+        return value
+
+    def __setattr__(self, name, value):
+        setattr(self._obj, name, value)
+
+    def __repr__(self):
+        return repr(self._obj)
+
+    def _wrap_method(self, method, path):
+        trace = self._trace
+        service = self._service
+        name = '.'.join(path)
+
+        @functools.wraps(method)
+        def traced_method(*args, **kwargs):
+            start = time.time()
+            try:
+                result = method(*args, **kwargs)
+            except Exception as exc:
+                trace.add_call(service, name, time.time() - start,
+                               error=exc.__class__.__name__)
+                raise
+            if inspect.isgenerator(result):
+                return _traced_iteration(trace, service, name, result,
+                                         time.time() - start)
+            trace.add_call(service, name, time.time() - start,
+                           items=_count_items(result))
+            return result
+        return traced_method
+
+
+def traced(service):
+    """Decorates a client factory so that traced requests get traced clients.
+
+    The factory is called as usual; when the request it is given is being
+    traced the client is wrapped in a :class:`TracedClient`.
+    """
+    def decorator(factory):
+        @functools.wraps(factory)
+        def wrapper(request, *args, **kwargs):
+            client = factory(request, *args, **kwargs)
+            trace = get_trace(request)
+            if trace is None or client is None:
+                return client
+            return TracedClient(client, trace, service)
+        return wrapper
+    return decorator
+
+
+class ApiTraceMiddleware(object):
+    """Traces a sample of the requests and reports their upstream calls."""
+
+    def process_request(self, request):
+        config = get_config()
+        if config['enabled'] and random.random() < config['sample_rate']:
+            request._api_trace = Trace()
+
+    def process_response(self, request, response):
+        trace = get_trace(request)
+        if trace is None:
+            return response
+        trace.finish()
+        config = get_config()
+        if config['header']:
+            response[HEADER] = trace.header_value()
+        if config['log']:
+            data = trace.to_dict()
+            data.update(method=request.method, path=request.path,
+                        status=response.status_code)
+            LOG.info("API trace %s", json.dumps(data, sort_keys=True))
+        if config['panel']:
+            self._add_panel(response, trace)
+        return response
+
+    def _add_panel(self, response, trace):
+        if (getattr(response, 'streaming', False) or
+                'html' not in response.get('Content-Type', '')):
+            return
+        content = force_text(response.content, settings.DEFAULT_CHARSET)
+        index = content.rfind('</body>')
+        if index == -1:
+            return
+        panel = render_to_string('api_trace_panel.html', {'trace': trace})
+        response.content = (content[:index] + panel +
+                            content[index:]).encode(settings.DEFAULT_CHARSET)
+        if response.has_header('Content-Length'):
+            response['Content-Length'] = len(response.content)
@@ -18,6 +18,7 @@ from django.conf import settings
 from troveclient.v1 import client
 
 from openstack_dashboard.api import base
+from openstack_dashboard.api import tracing
 
 from horizon.utils import functions as utils
 from horizon.utils.memoized import memoized  # noqa
@@ -26,6 +27,7 @@ LOG = logging.getLogger(__name__)
 
 
 @memoized
+@tracing.traced('database')
 def troveclient(request):
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
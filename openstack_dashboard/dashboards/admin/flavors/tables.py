@@ -26,6 +26,8 @@ from horizon import tables
 from horizon.templatetags import sizeformat
 
 from openstack_dashboard import api
+from openstack_dashboard.dashboards.project.instances \
+    import utils as instance_utils
 
 
 class DeleteFlavor(tables.DeleteAction):
@@ -47,6 +49,7 @@ class DeleteFlavor(tables.DeleteAction):
 
     def delete(self, request, obj_id):
         api.nova.flavor_delete(request, obj_id)
+        instance_utils.invalidate_flavor_catalog(request)
 
 
 class CreateFlavor(tables.LinkAction):
@@ -23,6 +23,8 @@ from novaclient.v1_1 import flavors
 
 from openstack_dashboard.dashboards.admin.flavors import constants
 from openstack_dashboard.dashboards.admin.flavors import workflows
+from openstack_dashboard.dashboards.project.instances \
+    import utils as instance_utils
 
 
 class FlavorsViewTests(test.BaseAdminViewTests):
@@ -38,6 +40,23 @@ class FlavorsViewTests(test.BaseAdminViewTests):
         self.assertTemplateUsed(res, constants.FLAVORS_TEMPLATE_NAME)
         self.assertItemsEqual(res.context['table'].data, self.flavors.list())
 
+    @test.create_stubs({api.nova: ('flavor_list', 'flavor_delete'),
+                        instance_utils: ('invalidate_flavor_catalog',)})
+    def test_delete_flavor(self):
+        flavor = self.flavors.first()
+        api.nova.flavor_list(IsA(http.HttpRequest), None) \
+            .AndReturn(self.flavors.list())
+        api.nova.flavor_delete(IsA(http.HttpRequest), flavor.id)
+        # The projects must not be offered the deleted flavor
+        instance_utils.invalidate_flavor_catalog(IsA(http.HttpRequest))
+        self.mox.ReplayAll()
+
+        res = self.client.post(reverse(constants.FLAVORS_INDEX_URL),
+                               {'action': 'flavors__delete__%s' % flavor.id})
+        self.assertNoFormErrors(res)
+        self.assertRedirectsNoFollow(res,
+                                     reverse(constants.FLAVORS_INDEX_URL))
+
 
 class BaseFlavorWorkflowTests(test.BaseAdminViewTests):
     def _flavor_create_params(self, flavor, id=None):
@@ -24,6 +24,8 @@ from horizon import forms
 from horizon import workflows
 
 from openstack_dashboard import api
+from openstack_dashboard.dashboards.project.instances \
+    import utils as instance_utils
 
 
 class CreateFlavorInfoAction(workflows.Action):
@@ -216,6 +218,7 @@ class CreateFlavor(workflows.Workflow):
                 exceptions.handle(
                     request,
                     _('Unable to set flavor access for project %s.') % project)
+        instance_utils.invalidate_flavor_catalog(request)
         return True
 
 
@@ -303,6 +306,8 @@ class UpdateFlavor(workflows.Workflow):
                 api.nova.flavor_extra_set(request, flavor.id, extras_dict)
         except Exception:
             exceptions.handle(request, ignore=True)
+            # The old flavor may be gone already
+            instance_utils.invalidate_flavor_catalog(request)
             return False
 
         # Add flavor access if the flavor is not public.
@@ -313,4 +318,5 @@ class UpdateFlavor(workflows.Workflow):
                 exceptions.handle(request, _('Modified flavor information, '
                                              'but unable to modify flavor '
                                              'access.'))
+        instance_utils.invalidate_flavor_catalog(request)
         return True
@@ -23,6 +23,8 @@ from horizon.utils import filters
 from openstack_dashboard import api
 from openstack_dashboard.dashboards.project.instances \
     import tables as project_tables
+from openstack_dashboard.dashboards.project.instances \
+    import utils as instance_utils
 from openstack_dashboard import policy
 
 
@@ -84,6 +86,11 @@ class AdminUpdateRow(project_tables.UpdateRow):
         instance.tenant_name = getattr(tenant, "name", None)
         return instance
 
+    def get_data_many(self, request, instance_ids):
+        # Instances of every project are shown here, so they cannot be
+        # batched through the project scoped server listing.
+        return tables.Row.get_data_many(self, request, instance_ids)
+
 
 class AdminInstanceFilterAction(tables.FilterAction):
     # Change default name of 'filter' to distinguish this one from the
@@ -179,3 +186,9 @@ class AdminInstancesTable(tables.DataTable):
                        project_tables.SoftRebootInstance,
                        project_tables.RebootInstance,
                        project_tables.TerminateInstance)
+
+    def get_selected_data(self, obj_ids):
+        instances = instance_utils.server_lookup(self.request, obj_ids,
+                                                 all_tenants=True)
+        return [instances[obj_id] for obj_id in obj_ids
+                if obj_id in instances]
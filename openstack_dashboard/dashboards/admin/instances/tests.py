@@ -43,7 +43,8 @@ class InstanceViewTest(test.BaseAdminViewTests):
             AndReturn([tenants, False])
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest),
-                             all_tenants=True, search_opts=search_opts) \
+                             all_tenants=True, search_opts=search_opts,
+                             compact=True) \
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
                                              all_tenants=True)
@@ -67,7 +68,8 @@ class InstanceViewTest(test.BaseAdminViewTests):
 
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest),
-                             all_tenants=True, search_opts=search_opts) \
+                             all_tenants=True, search_opts=search_opts,
+                             compact=True) \
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
                                              all_tenants=True)
@@ -77,9 +79,13 @@ class InstanceViewTest(test.BaseAdminViewTests):
             AndRaise(self.exceptions.nova)
         api.keystone.tenant_list(IsA(http.HttpRequest)).\
             AndReturn([tenants, False])
+        flavor_ids = []
         for server in servers:
-            api.nova.flavor_get(IsA(http.HttpRequest), server.flavor["id"]). \
-                AndReturn(full_flavors[server.flavor["id"]])
+            if server.flavor["id"] not in flavor_ids:
+                flavor_ids.append(server.flavor["id"])
+        for flavor_id in flavor_ids:
+            api.nova.flavor_get(IsA(http.HttpRequest), flavor_id). \
+                AndReturn(full_flavors[flavor_id])
 
         self.mox.ReplayAll()
 
@@ -103,7 +109,8 @@ class InstanceViewTest(test.BaseAdminViewTests):
 
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest),
-                             all_tenants=True, search_opts=search_opts) \
+                             all_tenants=True, search_opts=search_opts,
+                             compact=True) \
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
                                              all_tenants=True)
@@ -131,7 +138,8 @@ class InstanceViewTest(test.BaseAdminViewTests):
     def test_index_server_list_exception(self):
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest),
-                             all_tenants=True, search_opts=search_opts) \
+                             all_tenants=True, search_opts=search_opts,
+                             compact=True) \
             .AndRaise(self.exceptions.nova)
 
         self.mox.ReplayAll()
@@ -140,6 +148,23 @@ class InstanceViewTest(test.BaseAdminViewTests):
         self.assertTemplateUsed(res, 'admin/instances/index.html')
         self.assertEqual(len(res.context['instances_table'].data), 0)
 
+    @test.create_stubs({api.nova: ('server_list', 'server_delete')})
+    def test_terminate_instances(self):
+        servers = self.servers.list()[:2]
+        api.nova.server_list(IsA(http.HttpRequest),
+                             search_opts={'paginate': True},
+                             all_tenants=True) \
+            .AndReturn([self.servers.list(), False])
+        for server in servers:
+            api.nova.server_delete(IsA(http.HttpRequest), server.id)
+        self.mox.ReplayAll()
+
+        formData = {'action': 'instances__terminate',
+                    'object_ids': [server.id for server in servers]}
+        res = self.client.post(INDEX_URL, formData)
+
+        self.assertRedirectsNoFollow(res, INDEX_URL)
+
     @test.create_stubs({api.nova: ('server_get', 'flavor_get',
                                    'extension_supported', ),
                         api.keystone: ('tenant_get',)})
@@ -185,7 +210,8 @@ class InstanceViewTest(test.BaseAdminViewTests):
             AndReturn([self.tenants.list(), False])
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest),
-                             all_tenants=True, search_opts=search_opts) \
+                             all_tenants=True, search_opts=search_opts,
+                             compact=True) \
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
                                              all_tenants=True)
@@ -216,7 +242,8 @@ class InstanceViewTest(test.BaseAdminViewTests):
         api.nova.extension_supported('AdminActions', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
         api.nova.server_list(IsA(http.HttpRequest),
-                             all_tenants=True, search_opts=search_opts) \
+                             all_tenants=True, search_opts=search_opts,
+                             compact=True) \
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
                                              all_tenants=True)
@@ -32,6 +32,8 @@ from openstack_dashboard.dashboards.admin.instances \
     import forms as project_forms
 from openstack_dashboard.dashboards.admin.instances \
     import tables as project_tables
+from openstack_dashboard.dashboards.project.instances \
+    import utils as instance_utils
 from openstack_dashboard.dashboards.project.instances import views
 from openstack_dashboard.dashboards.project.instances.workflows \
     import update_instance
@@ -96,7 +98,8 @@ class AdminIndexView(tables.DataTableView):
             instances, self._more = api.nova.server_list(
                 self.request,
                 search_opts=search_opts,
-                all_tenants=True)
+                all_tenants=True,
+                compact=True)
         except Exception:
             self._more = False
             exceptions.handle(self.request,
@@ -111,29 +114,16 @@ class AdminIndexView(tables.DataTableView):
                     message=_('Unable to retrieve IP addresses from Neutron.'),
                     ignore=True)
 
-            # Gather our flavors to correlate against IDs
-            try:
-                flavors = api.nova.flavor_list(self.request)
-            except Exception:
-                # If fails to retrieve flavor list, creates an empty list.
-                flavors = []
-
-            full_flavors = SortedDict([(f.id, f) for f in flavors])
+            # Correlate our instances to their flavors through the cached
+            # lookup map rather than listing the whole flavor catalog.
+            full_flavors = instance_utils.flavor_lookup(
+                self.request, [inst.flavor["id"] for inst in instances])
             tenant_dict = SortedDict([(t.id, t) for t in tenants])
             # Loop through instances to get flavor and tenant info.
             for inst in instances:
                 flavor_id = inst.flavor["id"]
-                try:
-                    if flavor_id in full_flavors:
-                        inst.full_flavor = full_flavors[flavor_id]
-                    else:
-                        # If the flavor_id is not in full_flavors list,
-                        # gets it via nova api.
-                        inst.full_flavor = api.nova.flavor_get(
-                            self.request, flavor_id)
-                except Exception:
-                    msg = _('Unable to retrieve instance size information.')
-                    exceptions.handle(self.request, msg)
+                if flavor_id in full_flavors:
+                    inst.full_flavor = full_flavors[flavor_id]
                 tenant = tenant_dict.get(inst.tenant_id, None)
                 inst.tenant_name = getattr(tenant, "name", None)
         return instances
@@ -80,7 +80,8 @@ class UpdatePort(project_tables.UpdatePort):
 class PortsTable(project_tables.PortsTable):
     name = tables.Column("name_or_id",
                          verbose_name=_("Name"),
-                         link="horizon:admin:networks:ports:detail")
+                         link="horizon:admin:networks:ports:detail",
+                         api_fields=("id", "name"))
 
     class Meta(object):
         name = "ports"
@@ -88,3 +89,4 @@ class PortsTable(project_tables.PortsTable):
         table_actions = (CreatePort, DeletePort)
         row_actions = (UpdatePort, DeletePort,)
         hidden_title = False
+        api_fields = project_tables.PortsTable._meta.api_fields
@@ -99,7 +99,8 @@ class NetworkTests(test.BaseAdminViewTests):
             .AndReturn(self.networks.first())
         api.neutron.subnet_list(IsA(http.HttpRequest), network_id=network_id)\
             .AndReturn([self.subnets.first()])
-        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id)\
+        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id,
+                              fields=IsA(list))\
             .AndReturn([self.ports.first()])
         api.neutron.is_extension_supported(IsA(http.HttpRequest),
                                            'mac-learning')\
@@ -144,7 +145,8 @@ class NetworkTests(test.BaseAdminViewTests):
             .AndRaise(self.exceptions.neutron)
         api.neutron.subnet_list(IsA(http.HttpRequest), network_id=network_id)\
             .AndReturn([self.subnets.first()])
-        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id)\
+        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id,
+                              fields=IsA(list))\
             .AndReturn([self.ports.first()])
         api.neutron.list_dhcp_agent_hosting_networks(IsA(http.HttpRequest),
                                                      network_id).\
@@ -186,7 +188,8 @@ class NetworkTests(test.BaseAdminViewTests):
             AndReturn(self.networks.first())
         api.neutron.subnet_list(IsA(http.HttpRequest), network_id=network_id).\
             AndRaise(self.exceptions.neutron)
-        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id).\
+        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id,
+                              fields=IsA(list)).\
             AndReturn([self.ports.first()])
         api.neutron.is_extension_supported(IsA(http.HttpRequest),
                                            'mac-learning')\
@@ -234,7 +237,8 @@ class NetworkTests(test.BaseAdminViewTests):
             AndReturn(self.networks.first())
         api.neutron.subnet_list(IsA(http.HttpRequest), network_id=network_id).\
             AndReturn([self.subnets.first()])
-        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id).\
+        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id,
+                              fields=IsA(list)).\
             AndRaise(self.exceptions.neutron)
         api.neutron.is_extension_supported(IsA(http.HttpRequest),
                                            'mac-learning')\
@@ -898,7 +902,8 @@ class NetworkSubnetTests(test.BaseAdminViewTests):
         api.neutron.subnet_delete(IsA(http.HttpRequest), subnet.id)
         api.neutron.subnet_list(IsA(http.HttpRequest), network_id=network_id)\
             .AndReturn([self.subnets.first()])
-        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id)\
+        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id,
+                              fields=IsA(list))\
             .AndReturn([self.ports.first()])
         api.neutron.is_extension_supported(IsA(http.HttpRequest),
                                            'mac-learning')\
@@ -938,7 +943,8 @@ class NetworkSubnetTests(test.BaseAdminViewTests):
             .AndRaise(self.exceptions.neutron)
         api.neutron.subnet_list(IsA(http.HttpRequest), network_id=network_id)\
             .AndReturn([self.subnets.first()])
-        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id)\
+        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id,
+                              fields=IsA(list))\
             .AndReturn([self.ports.first()])
         api.neutron.is_extension_supported(IsA(http.HttpRequest),
                                            'mac-learning')\
@@ -1329,7 +1335,8 @@ class NetworkPortTests(test.BaseAdminViewTests):
         api.neutron.port_delete(IsA(http.HttpRequest), port.id)
         api.neutron.subnet_list(IsA(http.HttpRequest), network_id=network_id)\
             .AndReturn([self.subnets.first()])
-        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id)\
+        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id,
+                              fields=IsA(list))\
             .AndReturn([self.ports.first()])
         api.neutron.is_extension_supported(IsA(http.HttpRequest),
                                            'mac-learning')\
@@ -1369,7 +1376,8 @@ class NetworkPortTests(test.BaseAdminViewTests):
             .AndRaise(self.exceptions.neutron)
         api.neutron.subnet_list(IsA(http.HttpRequest), network_id=network_id)\
             .AndReturn([self.subnets.first()])
-        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id)\
+        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id,
+                              fields=IsA(list))\
             .AndReturn([self.ports.first()])
         api.neutron.is_extension_supported(IsA(http.HttpRequest),
                                            'mac-learning')\
@@ -1481,7 +1489,8 @@ class NetworkAgentTests(test.BaseAdminViewTests):
             AndReturn(self.agents.list())
         api.neutron.subnet_list(IsA(http.HttpRequest), network_id=network_id)\
             .AndReturn([self.subnets.first()])
-        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id)\
+        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id,
+                              fields=IsA(list))\
             .AndReturn([self.ports.first()])
         api.neutron.remove_network_from_dhcp_agent(IsA(http.HttpRequest),
                                                    agent_id, network_id)
@@ -1510,7 +1519,8 @@ class NetworkAgentTests(test.BaseAdminViewTests):
             AndReturn(self.agents.list())
         api.neutron.subnet_list(IsA(http.HttpRequest), network_id=network_id)\
             .AndReturn([self.subnets.first()])
-        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id)\
+        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id,
+                              fields=IsA(list))\
             .AndReturn([self.ports.first()])
         api.neutron.remove_network_from_dhcp_agent(IsA(http.HttpRequest),
                                                    agent_id, network_id)\
@@ -120,7 +120,9 @@ class DetailView(tables.MultiTableView):
     def get_ports_data(self):
         try:
             network_id = self.kwargs['network_id']
-            ports = api.neutron.port_list(self.request, network_id=network_id)
+            fields = self.get_tables()['ports'].get_api_fields()
+            ports = api.neutron.port_list(self.request, network_id=network_id,
+                                          fields=fields)
         except Exception:
             ports = []
             msg = _('Port list can not be retrieved.')
@@ -17,12 +17,16 @@
 #    under the License.
 
 import datetime
+import threading
+import time
 
 from django.core.urlresolvers import reverse
 from django import http
+from django.test.utils import override_settings  # noqa
 from django.utils import encoding
 from django.utils import timezone
 
+import mock
 from mox import IsA  # noqa
 
 from horizon.templatetags import sizeformat
@@ -44,8 +48,8 @@ class UsageViewTests(test.BaseAdminViewTests):
         self.mox.StubOutWithMock(api.keystone, 'tenant_list')
         self.mox.StubOutWithMock(api.neutron, 'is_extension_supported')
         self.mox.StubOutWithMock(api.network, 'floating_ip_supported')
-        self.mox.StubOutWithMock(api.network, 'tenant_floating_ip_list')
-        self.mox.StubOutWithMock(api.network, 'security_group_list')
+        self.mox.StubOutWithMock(api.network, 'tenant_floating_ip_count')
+        self.mox.StubOutWithMock(api.network, 'security_group_count')
         self.mox.StubOutWithMock(api.cinder, 'tenant_absolute_limits')
 
         api.nova.extension_supported(
@@ -90,10 +94,10 @@ class UsageViewTests(test.BaseAdminViewTests):
                                            'security-group').AndReturn(True)
         api.network.floating_ip_supported(IsA(http.HttpRequest)) \
             .AndReturn(True)
-        api.network.tenant_floating_ip_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.floating_ips.list())
-        api.network.security_group_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.q_secgroups.list())
+        api.network.tenant_floating_ip_count(IsA(http.HttpRequest)) \
+            .AndReturn(len(self.floating_ips.list()))
+        api.network.security_group_count(IsA(http.HttpRequest)) \
+            .AndReturn(len(self.q_secgroups.list()))
         api.cinder.tenant_absolute_limits(IsA(http.HttpRequest)) \
             .AndReturn(self.cinder_limits['absolute'])
 
@@ -180,10 +184,10 @@ class UsageViewTests(test.BaseAdminViewTests):
                                            'security-group').AndReturn(True)
         api.network.floating_ip_supported(IsA(http.HttpRequest)) \
             .AndReturn(True)
-        api.network.tenant_floating_ip_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.floating_ips.list())
-        api.network.security_group_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.q_secgroups.list())
+        api.network.tenant_floating_ip_count(IsA(http.HttpRequest)) \
+            .AndReturn(len(self.floating_ips.list()))
+        api.network.security_group_count(IsA(http.HttpRequest)) \
+            .AndReturn(len(self.q_secgroups.list()))
         api.cinder.tenant_absolute_limits(IsA(http.HttpRequest)) \
             .AndReturn(self.cinder_limits['absolute'])
         self.mox.ReplayAll()
@@ -203,3 +207,155 @@ class UsageViewTests(test.BaseAdminViewTests):
                                                             obj.disk_gb_hours,
                                                             obj.vcpu_hours)
                 self.assertContains(res, row)
+
+
+class GlobalUsageTests(test.BaseAdminViewTests):
+
+    @override_settings(CONCURRENT_DATA_LOADS=4)
+    def test_get_limits_concurrent(self):
+        threads = set()
+
+        def limits(**values):
+            def get_limits():
+                threads.add(threading.current_thread().name)
+                time.sleep(0.01)
+                return values
+            return get_limits
+
+        global_usage = usage.GlobalUsage(self.request)
+        with mock.patch.multiple(global_usage,
+                                 get_nova_limits=limits(ram=1, cores=2),
+                                 get_neutron_limits=limits(cores=3),
+                                 get_cinder_limits=limits(volumes=4),
+                                 get_manila_limits=limits()):
+            global_usage.get_limits()
+        # The neutron limits take precedence over the nova ones
+        self.assertEqual({'ram': 1, 'cores': 3, 'volumes': 4},
+                         global_usage.limits)
+        self.assertEqual(4, len(threads))
+        self.assertNotIn(threading.current_thread().name, threads)
+
+    def test_summarize_usages(self):
+        usage_list = [api.nova.NovaUsage(u) for u in self.usages.list()]
+        expected = {}
+        for project_usage in usage_list:
+            for key, value in project_usage.get_summary().items():
+                expected[key] = expected.get(key, 0) + value
+        self.assertEqual(expected, usage.base.summarize_usages(usage_list))
+        self.assertEqual({}, usage.base.summarize_usages([]))
+
+    @test.create_stubs({api.nova: ('usage_list',)})
+    def test_usage_list_not_cached_by_default(self):
+        start = datetime.datetime(2015, 3, 1, 0, 0, 0)
+        end = datetime.datetime(2015, 3, 10, 23, 59, 59)
+        usage_list = [api.nova.NovaUsage(u) for u in self.usages.list()]
+        api.nova.usage_list(IsA(http.HttpRequest), start, end) \
+            .AndReturn(usage_list)
+        self.mox.ReplayAll()
+
+        global_usage = usage.GlobalUsage(self.request)
+        self.assertEqual(usage_list, global_usage.get_usage_list(start, end))
+
+    @override_settings(GLOBAL_USAGE_CACHE_TIMEOUT=3600)
+    @test.create_stubs({api.nova: ('usage_list',)})
+    def test_usage_list_rolling_cache(self):
+        start = datetime.datetime(2015, 3, 1, 0, 0, 0)
+        march_10 = datetime.datetime(2015, 3, 10, 0, 0, 0)
+        march_11 = datetime.datetime(2015, 3, 11, 0, 0, 0)
+        end_10 = datetime.datetime(2015, 3, 10, 23, 59, 59)
+        end_11 = datetime.datetime(2015, 3, 11, 23, 59, 59)
+        usages = [api.nova.NovaUsage(u) for u in self.usages.list()]
+        # The days before the 10th are fetched in one go and cached, then
+        # each load only fetches the current day and the one which ended.
+        api.nova.usage_list(IsA(http.HttpRequest), start, march_10) \
+            .AndReturn(usages)
+        api.nova.usage_list(IsA(http.HttpRequest), march_10, end_10) \
+            .AndReturn(usages)
+        api.nova.usage_list(IsA(http.HttpRequest), march_10, end_10) \
+            .AndReturn(usages)
+        api.nova.usage_list(IsA(http.HttpRequest), march_10, march_11) \
+            .AndReturn(usages)
+        api.nova.usage_list(IsA(http.HttpRequest), march_11, end_11) \
+            .AndReturn(usages[:1])
+        self.mox.ReplayAll()
+
+        global_usage = usage.GlobalUsage(self.request)
+        today = timezone.make_aware(datetime.datetime(2015, 3, 10, 12, 0),
+                                    timezone.utc)
+        with mock.patch.object(usage.GlobalUsage, 'today', today):
+            first = global_usage.get_usage_list(start, end_10)
+            second = global_usage.get_usage_list(start, end_10)
+        self.assertEqual([u.total_hours * 2 for u in usages],
+                         [u.total_hours for u in first])
+        self.assertEqual([u.total_hours for u in first],
+                         [u.total_hours for u in second])
+
+        today = timezone.make_aware(datetime.datetime(2015, 3, 11, 12, 0),
+                                    timezone.utc)
+        with mock.patch.object(usage.GlobalUsage, 'today', today):
+            third = global_usage.get_usage_list(start, end_11)
+        self.assertEqual([usages[0].total_hours * 3,
+                          usages[1].total_hours * 2],
+                         [u.total_hours for u in third])
+        server_usages = third[0].server_usages
+        self.assertEqual(len(usages[0].server_usages), len(server_usages))
+        self.assertEqual(usages[0].server_usages[0]['hours'] * 3,
+                         server_usages[0]['hours'])
+
+    @override_settings(GLOBAL_USAGE_CACHE_TIMEOUT=3600)
+    @test.create_stubs({api.nova: ('usage_list',)})
+    def test_usage_list_cached_per_endpoint(self):
+        start = datetime.datetime(2015, 3, 1, 0, 0, 0)
+        end = datetime.datetime(2015, 3, 9, 23, 59, 59)
+        usages = [api.nova.NovaUsage(u) for u in self.usages.list()]
+        api.nova.usage_list(IsA(http.HttpRequest), start, end) \
+            .AndReturn(usages)
+        api.nova.usage_list(IsA(http.HttpRequest), start, end) \
+            .AndReturn(usages[:1])
+        self.mox.ReplayAll()
+
+        global_usage = usage.GlobalUsage(self.request)
+        today = timezone.make_aware(datetime.datetime(2015, 3, 10, 12, 0),
+                                    timezone.utc)
+        with mock.patch.object(usage.GlobalUsage, 'today', today):
+            global_usage.get_usage_list(start, end)
+            # Same region name, but another cloud
+            self.request.user.endpoint = 'http://another-keystone:5000/v2.0'
+            other = global_usage.get_usage_list(start, end)
+        self.assertEqual([usages[0].tenant_id],
+                         [u.tenant_id for u in other])
+
+    @test.create_stubs({api.keystone: ('tenant_list',)})
+    def test_project_names_index(self):
+        tenants = self.tenants.list()
+        api.keystone.tenant_list(IsA(http.HttpRequest)) \
+            .AndReturn([tenants[:1], False])
+        api.keystone.tenant_list(IsA(http.HttpRequest)) \
+            .AndReturn([tenants, False])
+        self.mox.ReplayAll()
+
+        global_usage = usage.GlobalUsage(self.request)
+        names = global_usage.get_project_names([tenants[0].id])
+        self.assertEqual({tenants[0].id: tenants[0].name}, names)
+        # Served from the cache
+        global_usage.get_project_names([tenants[0].id])
+        # An unknown project rebuilds the index once
+        names = global_usage.get_project_names([tenants[1].id, 'deleted'])
+        self.assertEqual(tenants[1].name, names[tenants[1].id])
+        self.assertNotIn('deleted', names)
+        global_usage.get_project_names([tenants[1].id, 'deleted'])
+
+    @test.create_stubs({api.keystone: ('tenant_list',)})
+    def test_project_names_index_per_region(self):
+        tenants = self.tenants.list()
+        api.keystone.tenant_list(IsA(http.HttpRequest)) \
+            .AndReturn([tenants[:1], False])
+        api.keystone.tenant_list(IsA(http.HttpRequest)) \
+            .AndReturn([tenants[1:2], False])
+        self.mox.ReplayAll()
+
+        global_usage = usage.GlobalUsage(self.request)
+        global_usage.get_project_names([tenants[0].id])
+        self.request.user.services_region = 'another-region'
+        names = global_usage.get_project_names([tenants[0].id])
+        self.assertEqual({tenants[1].id: tenants[1].name}, names)
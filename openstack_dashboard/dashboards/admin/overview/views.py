@@ -24,7 +24,6 @@ from django.utils.translation import ugettext_lazy as _
 from horizon import exceptions
 from horizon.utils import csvbase
 
-from openstack_dashboard import api
 from openstack_dashboard import usage
 
 
@@ -58,17 +57,17 @@ class GlobalOverview(usage.UsageView):
         data = super(GlobalOverview, self).get_data()
         # Pre-fill project names
         try:
-            projects, has_more = api.keystone.tenant_list(self.request)
+            names = self.usage.get_project_names(
+                [instance.tenant_id for instance in data])
         except Exception:
-            projects = []
+            names = {}
             exceptions.handle(self.request,
                               _('Unable to retrieve project list.'))
         for instance in data:
-            project = filter(lambda t: t.id == instance.tenant_id, projects)
             # If we could not get the project name, show the tenant_id with
             # a 'Deleted' identifier instead.
-            if project:
-                instance.project_name = getattr(project[0], "name", None)
+            if instance.tenant_id in names:
+                instance.project_name = names[instance.tenant_id]
             else:
                 deleted = _("Deleted")
                 instance.project_name = translation.string_concat(
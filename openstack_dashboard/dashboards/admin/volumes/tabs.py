@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import functools
+
 from django.utils.datastructures import SortedDict
 from django.utils.translation import ugettext_lazy as _
 
@@ -37,21 +39,29 @@ class VolumeTab(tabs.TableTab, volumes_tabs.VolumeTableMixIn):
     template_name = "admin/volumes/volumes/volumes_tables.html"
     preload = False
 
-    def get_volumes_data(self):
-        volumes = self._get_volumes(search_opts={'all_tenants': True})
-        instances = self._get_instances(search_opts={'all_tenants': True})
-        volume_ids_with_snapshots = self._get_volumes_ids_with_snapshots(
-            search_opts={'all_tenants': True})
-        self._set_volume_attributes(
-            volumes, instances, volume_ids_with_snapshots)
-
+    def _get_tenants(self):
         # Gather our tenants to correlate against IDs
         try:
             tenants, has_more = keystone.tenant_list(self.request)
+            return tenants
         except Exception:
-            tenants = []
             msg = _('Unable to retrieve volume project information.')
             exceptions.handle(self.request, msg)
+            return []
+
+    def get_volumes_data(self):
+        # The API calls may update the search options they are given
+        volumes, instances, volume_ids_with_snapshots, tenants = \
+            api.base.gather(
+                functools.partial(self._get_volumes,
+                                  search_opts={'all_tenants': True}),
+                functools.partial(self._get_instances,
+                                  search_opts={'all_tenants': True}),
+                functools.partial(self._get_volumes_ids_with_snapshots,
+                                  search_opts={'all_tenants': True}),
+                self._get_tenants)
+        self._set_volume_attributes(
+            volumes, instances, volume_ids_with_snapshots)
 
         tenant_dict = SortedDict([(t.id, t) for t in tenants])
         for volume in volumes:
@@ -120,12 +130,13 @@ class SnapshotTab(tabs.TableTab):
     def get_volume_snapshots_data(self):
         if api.base.is_service_enabled(self.request, 'volume'):
             try:
-                snapshots = cinder.volume_snapshot_list(
-                    self.request,
-                    search_opts={'all_tenants': True})
-                volumes = cinder.volume_list(
-                    self.request,
-                    search_opts={'all_tenants': True})
+                snapshots, volumes = api.base.gather(
+                    functools.partial(cinder.volume_snapshot_list,
+                                      self.request,
+                                      search_opts={'all_tenants': True}),
+                    functools.partial(cinder.volume_list,
+                                      self.request,
+                                      search_opts={'all_tenants': True}))
                 volumes = dict((v.id, v) for v in volumes)
             except Exception:
                 snapshots = []
@@ -346,13 +346,18 @@ class DeleteObject(tables.DeleteAction):
     name = "delete_object"
     allowed_data_types = ("objects", "subfolders",)
 
-    def delete(self, request, obj_id):
+    def get_object_name(self, obj_id):
+        """Returns the name in its container of the object ``obj_id``."""
         obj = self.table.get_object_by_id(obj_id)
-        container_name = obj.container_name
         datum_type = getattr(obj, self.table._meta.data_type_name, None)
         if datum_type == 'subfolders':
-            obj_id = obj_id[(len(container_name) + 1):] + "/"
-        api.swift.swift_delete_object(request, container_name, obj_id)
+            return obj_id[(len(obj.container_name) + 1):] + "/"
+        return obj_id
+
+    def delete(self, request, obj_id):
+        obj = self.table.get_object_by_id(obj_id)
+        api.swift.swift_delete_object(request, obj.container_name,
+                                      self.get_object_name(obj_id))
 
     def get_success_url(self, request):
         url = super(DeleteObject, self).get_success_url(request)
@@ -362,6 +367,45 @@ class DeleteObject(tables.DeleteAction):
 class DeleteMultipleObjects(DeleteObject):
     name = "delete_multiple_objects"
 
+    def handle(self, table, request, obj_ids):
+        # The objects are removed in one bulk operation up front, delete()
+        # then only reports each outcome so that the usual messages still
+        # name every object. Pseudo-folders must be empty to be deleted,
+        # the others are left to the per-item path which refuses them.
+        self._bulk_results = {}
+        containers = {}
+        for obj_id in obj_ids:
+            obj = table.get_object_by_id(obj_id)
+            if not table._filter_action(self, request, obj):
+                continue
+            datum_type = getattr(obj, table._meta.data_type_name, None)
+            name = self.get_object_name(obj_id)
+            if (datum_type == 'subfolders' and
+                    not api.swift.swift_pseudo_folder_is_empty(
+                        request, obj.container_name, name)):
+                continue
+            containers.setdefault(obj.container_name, []).append(
+                (name, obj_id))
+        for container_name, objects in containers.items():
+            names = [name for name, obj_id in objects]
+            try:
+                results = api.swift.swift_delete_objects(
+                    request, container_name, names)
+            except Exception as exc:
+                results = dict((name, exc) for name in names)
+            ids_by_name = dict(objects)
+            self._bulk_results.update((ids_by_name[name], error)
+                                      for name, error in results.items())
+        return super(DeleteMultipleObjects, self).handle(table, request,
+                                                         obj_ids)
+
+    def delete(self, request, obj_id):
+        if obj_id not in self._bulk_results:
+            return super(DeleteMultipleObjects, self).delete(request, obj_id)
+        error = self._bulk_results[obj_id]
+        if error is not None:
+            raise error
+
 
 class CopyObject(tables.LinkAction):
     name = "copy"
@@ -393,14 +437,20 @@ class DownloadObject(tables.LinkAction):
 
 class ObjectFilterAction(tables.FilterAction):
     def _filtered_data(self, table, filter_string):
+        # subfolders and objects are filtered from the same listing scan
+        if getattr(self, '_filter_string', None) == filter_string:
+            return self.filtered_data
         request = table.request
         container = self.table.kwargs['container_name']
         subfolder = self.table.kwargs['subfolder_path']
         prefix = wrap_delimiter(subfolder) if subfolder else ''
-        self.filtered_data = api.swift.swift_filter_objects(request,
-                                                            filter_string,
-                                                            container,
-                                                            prefix=prefix)
+        self.filtered_data, truncated = api.swift.swift_filter_objects(
+            request, filter_string, container, prefix=prefix)
+        if truncated:
+            messages.warning(request,
+                             _('Only part of the container was searched, '
+                               'so the filter results may be incomplete.'))
+        self._filter_string = filter_string
         return self.filtered_data
 
     def filter_subfolders_data(self, table, objects, filter_string):
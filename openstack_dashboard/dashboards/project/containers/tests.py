@@ -91,12 +91,13 @@ class SwiftTests(test.TestCase):
             handled = table.maybe_handle()
             self.assertEqual(handled['location'], CONTAINER_INDEX_URL)
 
-    @test.create_stubs({api.swift: ('swift_get_objects', )})
+    @test.create_stubs({api.swift: ('swift_api', )})
     def test_delete_container_nonempty(self):
         container = self.containers.first()
-        objects = self.objects.list()
-        api.swift.swift_get_objects(IsA(http.HttpRequest),
-                                    container.name).AndReturn([objects, False])
+        swift_api = self.mox.CreateMockAnything()
+        api.swift.swift_api(IsA(http.HttpRequest)).AndReturn(swift_api)
+        swift_api.head_container(container.name) \
+            .AndReturn({'x-container-object-count': '4'})
         self.mox.ReplayAll()
 
         action_string = u"containers__delete__%s" % container.name
@@ -312,6 +313,31 @@ class SwiftTests(test.TestCase):
         handled = table.maybe_handle()
         self.assertEqual(handled['location'], index_url)
 
+    @test.create_stubs({api.swift: ('swift_delete_objects',)})
+    def test_delete_multiple(self):
+        container = self.containers.first()
+        objects = self.objects.list()
+        names = [obj.name for obj in objects]
+        args = (tables.wrap_delimiter(container.name),)
+        index_url = reverse('horizon:project:containers:index', args=args)
+        results = dict((name, None) for name in names)
+        results[names[0]] = api.swift.swiftclient.client.ClientException(
+            'busy', http_status=503)
+        api.swift.swift_delete_objects(IsA(http.HttpRequest),
+                                       container.name,
+                                       names).AndReturn(results)
+        self.mox.ReplayAll()
+
+        form_data = {"action": "objects__delete_multiple_objects",
+                     "object_ids": names}
+        req = self.factory.post(index_url, form_data)
+        kwargs = {"container_name": container.name}
+        table = tables.ObjectsTable(req, objects, **kwargs)
+        handled = table.maybe_handle()
+        self.assertEqual(handled['location'], index_url)
+        action = table.base_actions['delete_multiple_objects']
+        self.assertItemsEqual(names[1:], action.success_ids)
+
     @test.create_stubs({api.swift: ('swift_delete_object',)})
     def test_delete_pseudo_folder(self):
         container = self.containers.first()
@@ -332,6 +358,36 @@ class SwiftTests(test.TestCase):
         handled = table.maybe_handle()
         self.assertEqual(handled['location'], index_url)
 
+    @test.create_stubs({api.swift: ('swift_pseudo_folder_is_empty',
+                                    'swift_delete_objects')})
+    def test_delete_multiple_pseudo_folders(self):
+        container = self.containers.first()
+        folder = self.folder.first()
+        args = (tables.wrap_delimiter(container.name),)
+        index_url = reverse('horizon:project:containers:index', args=args)
+        folder_id = '%s/%s' % (container.name, folder.name)
+        api.swift.swift_pseudo_folder_is_empty(IsA(http.HttpRequest),
+                                               container.name,
+                                               folder.name + '/') \
+            .AndReturn(True)
+        api.swift.swift_delete_objects(IsA(http.HttpRequest),
+                                       container.name,
+                                       [folder.name + '/']) \
+            .AndReturn({folder.name + '/': None})
+        self.mox.ReplayAll()
+
+        form_data = {"action": "objects__delete_multiple_objects",
+                     "object_ids": [folder_id]}
+        req = self.factory.post(index_url, form_data)
+        kwargs = {"container_name": container.name}
+        table = tables.ObjectsTable(req, self.folder.list(), **kwargs)
+        # The actions are shared by the tables of a class
+        action = table.base_actions['delete_multiple_objects']
+        action.success_ids = []
+        handled = table.maybe_handle()
+        self.assertEqual(handled['location'], index_url)
+        self.assertEqual([folder_id], action.success_ids)
+
     @test.create_stubs({api.swift: ('swift_get_object',)})
     def test_download(self):
         for container in self.containers.list():
@@ -39,6 +39,8 @@ from openstack_dashboard import api
 from openstack_dashboard.dashboards.project.access_and_security.floating_ips \
     import workflows
 from openstack_dashboard.dashboards.project.instances import tabs
+from openstack_dashboard.dashboards.project.instances \
+    import utils as instance_utils
 from openstack_dashboard.dashboards.project.instances.workflows \
     import resize_instance
 from openstack_dashboard.dashboards.project.instances.workflows \
@@ -84,6 +86,7 @@ class TerminateInstance(policy.PolicyTargetMixin, tables.BatchAction):
     icon = "remove"
     policy_rules = (("compute", "compute:delete"),)
     help_text = _("Terminated instances are not recoverable.")
+    fetch_selected = True
 
     @staticmethod
     def action_present(count):
@@ -677,6 +680,22 @@ class UpdateRow(tables.Row):
             messages.error(request, error)
         return instance
 
+    def get_data_many(self, request, instance_ids):
+        if len(instance_ids) < 2:
+            return super(UpdateRow, self).get_data_many(request,
+                                                        instance_ids)
+        instances = instance_utils.server_lookup(request, instance_ids)
+        full_flavors = instance_utils.flavor_lookup(
+            request, [server.flavor["id"] for server in instances.values()])
+        for instance in instances.values():
+            flavor = full_flavors.get(instance.flavor["id"])
+            if flavor:
+                instance.full_flavor = flavor
+            error = get_instance_error(instance)
+            if error:
+                messages.error(request, error)
+        return instances
+
 
 class StartInstance(policy.PolicyTargetMixin, tables.BatchAction):
     name = "start"
@@ -1060,3 +1079,10 @@ class InstancesTable(tables.DataTable):
                        ResizeLink, LockInstance, UnlockInstance,
                        SoftRebootInstance, RebootInstance,
                        StopInstance, RebuildInstance, TerminateInstance)
+
+    def get_selected_data(self, obj_ids):
+        # Actions only need the servers themselves: unlike the row poll
+        # this neither loads their flavors nor reports instance faults.
+        instances = instance_utils.server_lookup(self.request, obj_ids)
+        return [instances[obj_id] for obj_id in obj_ids
+                if obj_id in instances]
@@ -16,6 +16,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import copy
 import json
 import sys
 import uuid
@@ -29,7 +30,9 @@ from django.utils.datastructures import SortedDict
 from django.utils import encoding
 from django.utils.http import urlencode
 from mox import IgnoreArg  # noqa
+from glanceclient import exc as glance_exceptions
 from mox import IsA  # noqa
+from novaclient import exceptions as nova_exceptions
 
 from horizon import exceptions
 from horizon import forms
@@ -39,6 +42,7 @@ from openstack_dashboard.api import cinder
 from openstack_dashboard.dashboards.project.instances import console
 from openstack_dashboard.dashboards.project.instances import tables
 from openstack_dashboard.dashboards.project.instances import tabs
+from openstack_dashboard.dashboards.project.instances import utils
 from openstack_dashboard.dashboards.project.instances import workflows
 from openstack_dashboard.test import helpers
 from openstack_dashboard.usage import quotas
@@ -102,6 +106,48 @@ class InstanceTests(helpers.TestCase):
         self.assertItemsEqual(instances, self.servers.list())
         self.assertNotContains(res, "Launch Instance (Quota exceeded)")
 
+    @helpers.create_stubs({
+        api.nova: ('flavor_list', 'server_list', 'tenant_absolute_limits',
+                   'extension_supported',),
+        api.glance: ('image_list_detailed',),
+        api.network: ('floating_ip_simple_associate_supported',
+                      'floating_ip_supported',
+                      'servers_update_addresses',),
+    })
+    def test_index_lookup_cache_hit(self):
+        servers = self.servers.list()
+        api.nova.extension_supported('AdminActions',
+                                     IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn(True)
+        search_opts = {'marker': None, 'paginate': True}
+        api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
+            .MultipleTimes().AndReturn([servers, False])
+        api.network.servers_update_addresses(IsA(http.HttpRequest), servers) \
+            .MultipleTimes()
+        # The flavor and image catalogs are only listed for the first page
+        # load; the second one is served from the lookup cache.
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.flavors.list())
+        api.glance.image_list_detailed(IgnoreArg()) \
+            .AndReturn((self.images.list(), False, False))
+        api.nova.tenant_absolute_limits(IsA(http.HttpRequest), reserved=True) \
+           .MultipleTimes().AndReturn(self.limits['absolute'])
+        api.network.floating_ip_supported(IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn(True)
+        api.network.floating_ip_simple_associate_supported(
+            IsA(http.HttpRequest)).MultipleTimes().AndReturn(True)
+
+        self.mox.ReplayAll()
+
+        self.client.get(INDEX_URL)
+        res = self.client.get(INDEX_URL)
+
+        self.assertTemplateUsed(res, 'project/instances/index.html')
+        instances = res.context['instances_table'].data
+        self.assertItemsEqual(instances, self.servers.list())
+        for instance in instances:
+            self.assertEqual(instance.flavor['id'], instance.full_flavor.id)
+
     @helpers.create_stubs({api.nova: ('server_list',
                                       'tenant_absolute_limits',)})
     def test_index_server_list_exception(self):
@@ -142,9 +188,13 @@ class InstanceTests(helpers.TestCase):
             .AndRaise(self.exceptions.nova)
         api.glance.image_list_detailed(IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
+        flavor_ids = []
         for server in servers:
-            api.nova.flavor_get(IsA(http.HttpRequest), server.flavor["id"]). \
-                AndReturn(full_flavors[server.flavor["id"]])
+            if server.flavor["id"] not in flavor_ids:
+                flavor_ids.append(server.flavor["id"])
+        for flavor_id in flavor_ids:
+            api.nova.flavor_get(IsA(http.HttpRequest), flavor_id). \
+                AndReturn(full_flavors[flavor_id])
         api.nova.tenant_absolute_limits(IsA(http.HttpRequest), reserved=True) \
            .MultipleTimes().AndReturn(self.limits['absolute'])
         api.network.floating_ip_supported(IsA(http.HttpRequest)) \
@@ -277,22 +327,14 @@ class InstanceTests(helpers.TestCase):
             for action in instances_table.get_row_actions(instance):
                 self.assertNotIsInstance(action, tables.ConsoleLink)
 
-    @helpers.create_stubs({api.nova: ('server_list',
-                                      'flavor_list',
-                                      'server_delete',),
-                           api.glance: ('image_list_detailed',),
-                           api.network: ('servers_update_addresses',)})
+    @helpers.create_stubs({api.nova: ('server_get',
+                                      'server_delete',)})
     def test_terminate_instance(self):
         servers = self.servers.list()
         server = servers[0]
 
-        search_opts = {'marker': None, 'paginate': True}
-        api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
-            .AndReturn([servers, False])
-        api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
-        api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.nova.server_get(IsA(http.HttpRequest), server.id) \
+            .AndReturn(server)
         api.nova.server_delete(IsA(http.HttpRequest), server.id)
         self.mox.ReplayAll()
 
@@ -302,21 +344,37 @@ class InstanceTests(helpers.TestCase):
         self.assertRedirectsNoFollow(res, INDEX_URL)
 
     @helpers.create_stubs({api.nova: ('server_list',
-                                      'flavor_list',
-                                      'server_delete',),
-                           api.glance: ('image_list_detailed',),
-                           api.network: ('servers_update_addresses',)})
+                                      'server_delete',)})
+    def test_terminate_instances_in_error(self):
+        servers = self.servers.list()[:2]
+        for server in servers:
+            server.status = 'ERROR'
+            server.fault = {'message': 'NoValidHost'}
+
+        api.nova.server_list(IsA(http.HttpRequest),
+                             search_opts={'paginate': True},
+                             all_tenants=False) \
+            .AndReturn([self.servers.list(), False])
+        for server in servers:
+            api.nova.server_delete(IsA(http.HttpRequest), server.id)
+        self.mox.ReplayAll()
+
+        formData = {'action': 'instances__terminate',
+                    'object_ids': [server.id for server in servers]}
+        res = self.client.post(INDEX_URL, formData)
+
+        self.assertRedirectsNoFollow(res, INDEX_URL)
+        # The faults of the instances are not reported by the action
+        self.assertMessageCount(success=1, error=0)
+
+    @helpers.create_stubs({api.nova: ('server_get',
+                                      'server_delete',)})
     def test_terminate_instance_exception(self):
         servers = self.servers.list()
         server = servers[0]
 
-        search_opts = {'marker': None, 'paginate': True}
-        api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
-            .AndReturn([servers, False])
-        api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
-        api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.nova.server_get(IsA(http.HttpRequest), server.id) \
+            .AndReturn(server)
         api.nova.server_delete(IsA(http.HttpRequest), server.id) \
             .AndRaise(self.exceptions.nova)
 
@@ -1416,8 +1474,6 @@ class InstanceTests(helpers.TestCase):
             .AndReturn(self.limits['absolute'])
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         api.nova.keypair_list(IsA(http.HttpRequest)) \
             .AndReturn(self.keypairs.list())
         api.network.security_group_list(IsA(http.HttpRequest)) \
@@ -1630,8 +1686,6 @@ class InstanceTests(helpers.TestCase):
             .AndReturn(self.limits['absolute'])
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         api.nova.keypair_list(IsA(http.HttpRequest)) \
             .AndReturn(self.keypairs.list())
         api.network.security_group_list(IsA(http.HttpRequest)) \
@@ -1778,8 +1832,6 @@ class InstanceTests(helpers.TestCase):
                                config_drive=config_drive_value)
         quotas.tenant_quota_usages(IsA(http.HttpRequest)) \
             .AndReturn(quota_usages)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
 
         self.mox.ReplayAll()
 
@@ -1907,8 +1959,6 @@ class InstanceTests(helpers.TestCase):
               .AndReturn([])
         quotas.tenant_quota_usages(IsA(http.HttpRequest)) \
               .AndReturn(quota_usages)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
 
         self.mox.ReplayAll()
 
@@ -2030,8 +2080,6 @@ class InstanceTests(helpers.TestCase):
         api.neutron.network_list(IsA(http.HttpRequest),
                                  shared=True) \
             .AndReturn(self.networks.list()[1:])
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         if test_with_profile:
             policy_profiles = self.policy_profiles.list()
             policy_profile_id = self.policy_profiles.first().id
@@ -2166,8 +2214,6 @@ class InstanceTests(helpers.TestCase):
         api.neutron.network_list(IsA(http.HttpRequest),
                                  shared=True) \
             .AndReturn(self.networks.list()[1:])
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         if test_with_profile:
             policy_profiles = self.policy_profiles.list()
             policy_profile_id = self.policy_profiles.first().id
@@ -2291,8 +2337,6 @@ class InstanceTests(helpers.TestCase):
         api.neutron.network_list(IsA(http.HttpRequest),
                                  shared=True) \
             .AndReturn(self.networks.list()[1:])
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         if test_with_profile:
             policy_profiles = self.policy_profiles.list()
             api.neutron.profile_list(IsA(http.HttpRequest),
@@ -2302,8 +2346,6 @@ class InstanceTests(helpers.TestCase):
             .AndReturn(True)
         api.nova.extension_supported('ConfigDrive',
                                      IsA(http.HttpRequest)).AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         api.nova.keypair_list(IsA(http.HttpRequest)) \
             .AndReturn(self.keypairs.list())
         api.network.security_group_list(IsA(http.HttpRequest)) \
@@ -2391,8 +2433,6 @@ class InstanceTests(helpers.TestCase):
         api.neutron.network_list(IsA(http.HttpRequest),
                                  shared=True) \
             .AndReturn(self.networks.list()[1:])
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         api.nova.keypair_list(IsA(http.HttpRequest)) \
             .AndReturn(self.keypairs.list())
         api.network.security_group_list(IsA(http.HttpRequest)) \
@@ -2607,8 +2647,6 @@ class InstanceTests(helpers.TestCase):
             .AndRaise(self.exceptions.keystone)
         quotas.tenant_quota_usages(IsA(http.HttpRequest)) \
             .AndReturn(quota_usages)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
 
         self.mox.ReplayAll()
 
@@ -2715,14 +2753,10 @@ class InstanceTests(helpers.TestCase):
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
             .AndReturn([])
 
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         api.nova.tenant_absolute_limits(IsA(http.HttpRequest)) \
            .AndReturn(self.limits['absolute'])
         quotas.tenant_quota_usages(IsA(http.HttpRequest)) \
             .AndReturn(quota_usages)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
 
         self.mox.ReplayAll()
 
@@ -2822,14 +2856,10 @@ class InstanceTests(helpers.TestCase):
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
             .AndReturn([])
 
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         api.nova.tenant_absolute_limits(IsA(http.HttpRequest)) \
            .AndReturn(self.limits['absolute'])
         quotas.tenant_quota_usages(IsA(http.HttpRequest)) \
             .AndReturn(quota_usages)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
 
         self.mox.ReplayAll()
 
@@ -2946,14 +2976,10 @@ class InstanceTests(helpers.TestCase):
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
             .AndReturn([])
 
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         api.nova.tenant_absolute_limits(IsA(http.HttpRequest)) \
            .AndReturn(self.limits['absolute'])
         quotas.tenant_quota_usages(IsA(http.HttpRequest)) \
             .AndReturn(quota_usages)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
 
         self.mox.ReplayAll()
 
@@ -3076,14 +3102,10 @@ class InstanceTests(helpers.TestCase):
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
             .AndReturn([])
-        api.nova.flavor_list(
-            IsA(http.HttpRequest)).AndReturn(self.flavors.list())
         api.nova.tenant_absolute_limits(
             IsA(http.HttpRequest)).AndReturn(self.limits['absolute'])
         quotas.tenant_quota_usages(
             IsA(http.HttpRequest)).AndReturn(quota_usages)
-        api.nova.flavor_list(
-            IsA(http.HttpRequest)).AndReturn(self.flavors.list())
 
         self.mox.ReplayAll()
 
@@ -3200,14 +3222,10 @@ class InstanceTests(helpers.TestCase):
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
             .AndReturn([])
 
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         api.nova.tenant_absolute_limits(IsA(http.HttpRequest)) \
             .AndReturn(self.limits['absolute'])
         quotas.tenant_quota_usages(IsA(http.HttpRequest)) \
             .AndReturn(quota_usages)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
 
         self.mox.ReplayAll()
 
@@ -3384,8 +3402,6 @@ class InstanceTests(helpers.TestCase):
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
             .AndReturn([])
 
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         quotas.tenant_quota_usages(IsA(http.HttpRequest)) \
             .AndReturn(quota_usages)
 
@@ -3518,8 +3534,6 @@ class InstanceTests(helpers.TestCase):
                                      IsA(http.HttpRequest)).AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         api.nova.keypair_list(IsA(http.HttpRequest)) \
             .AndReturn([keypair])
         api.network.security_group_list(IsA(http.HttpRequest)) \
@@ -4042,11 +4056,8 @@ class InstanceTests(helpers.TestCase):
         self.assertContains(res, form_action, count=1)
 
     @django.test.utils.override_settings(API_RESULT_PAGE_SIZE=2)
-    @helpers.create_stubs({api.nova: ('server_list',
-                                      'flavor_list',
-                                      'server_delete',),
-                           api.glance: ('image_list_detailed',),
-                           api.network: ('servers_update_addresses',)})
+    @helpers.create_stubs({api.nova: ('server_get',
+                                      'server_delete',)})
     def test_terminate_instance_with_pagination(self):
         """Instance should be deleted from
            the next page.
@@ -4055,14 +4066,8 @@ class InstanceTests(helpers.TestCase):
         servers = self.servers.list()[:3]
         server = servers[-1]
 
-        search_opts = {'marker': servers[page_size - 1].id, 'paginate': True}
-        api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
-            .AndReturn([servers[page_size:], False])
-        api.network.servers_update_addresses(IsA(http.HttpRequest),
-                                             servers[page_size:])
-        api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.nova.server_get(IsA(http.HttpRequest), server.id) \
+            .AndReturn(server)
         api.nova.server_delete(IsA(http.HttpRequest), server.id)
         self.mox.ReplayAll()
 
@@ -4162,6 +4167,40 @@ class InstanceAjaxTests(helpers.TestCase):
                               HTTP_X_REQUESTED_WITH='XMLHttpRequest')
         self.assertContains(res, server.name)
 
+    @helpers.create_stubs({api.nova: ("server_list",
+                                      "flavor_list",
+                                      "extension_supported"),
+                           api.neutron: ("is_extension_supported",)})
+    def test_rows_update(self):
+        servers = self.servers.list()
+        deleted_id = str(uuid.UUID(int=0))
+
+        api.nova.extension_supported('AdminActions', IsA(http.HttpRequest))\
+            .MultipleTimes().AndReturn(True)
+        api.neutron.is_extension_supported(IsA(http.HttpRequest),
+                                           'security-group')\
+            .MultipleTimes().AndReturn(True)
+        api.nova.server_list(IsA(http.HttpRequest),
+                             search_opts={'paginate': True},
+                             all_tenants=False)\
+            .AndReturn([servers, False])
+        api.nova.flavor_list(IsA(http.HttpRequest))\
+            .AndReturn(self.flavors.list())
+
+        self.mox.ReplayAll()
+
+        params = {'action': 'rows_update',
+                  'table': 'instances',
+                  'obj_id': [servers[0].id, deleted_id],
+                  }
+        res = self.client.get('?'.join((INDEX_URL,
+                                        urlencode(params, doseq=True))),
+                              HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        data = json.loads(res.content)
+        self.assertEqual([deleted_id], data['deleted'])
+        self.assertEqual([servers[0].id], data['rows'].keys())
+        self.assertIn(servers[0].name, data['rows'][servers[0].id])
+
     @helpers.create_stubs({api.nova: ("server_get",
                                       "flavor_get",
                                       "extension_supported"),
@@ -4244,6 +4283,183 @@ class InstanceAjaxTests(helpers.TestCase):
         self.assertContains(res, "Not available")
 
 
+class FlavorCatalogTests(helpers.TestCase):
+    @helpers.create_stubs({api.nova: ('flavor_list',)})
+    def test_flavor_list_cached_sorted(self):
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.flavors.list())
+        self.mox.ReplayAll()
+
+        expected = sorted(self.flavors.list(), key=lambda f: f.ram)
+        for i in range(2):
+            flavors = utils.flavor_list(self.request)
+            self.assertEqual([f.id for f in expected],
+                             [f.id for f in flavors])
+        self.assertEqual([(f.id, f.name) for f in expected],
+                         utils.flavor_field_data(self.request))
+
+    @helpers.create_stubs({api.nova: ('flavor_list',)})
+    def test_flavor_list_cached_extras(self):
+        flavor = self.flavors.first()
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+            .AndReturn([flavor])
+        client = api.nova.novaclient(self.request).client
+        self.mox.StubOutWithMock(client, 'get')
+        client.get('/flavors/%s/os-extra_specs' % flavor.id) \
+            .AndReturn((None, {'extra_specs': {'key': 'value'}}))
+        self.mox.ReplayAll()
+
+        utils.flavor_list(self.request)
+        cached = utils.flavor_list(self.request)[0]
+        self.assertEqual({'key': 'value'},
+                         api.nova.flavor_get_extras(self.request, cached.id,
+                                                    raw=True, flavor=cached))
+
+    @helpers.create_stubs({api.nova: ('flavor_list',)})
+    def test_flavor_list_per_project(self):
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.flavors.list())
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.flavors.list()[:1])
+        self.mox.ReplayAll()
+
+        self.assertEqual(len(self.flavors.list()),
+                         len(utils.flavor_list(self.request)))
+        self.request.user.tenant_id = 'another-project'
+        self.assertEqual(1, len(utils.flavor_list(self.request)))
+
+    @helpers.create_stubs({api.nova: ('flavor_list',)})
+    def test_invalidate_flavor_catalog(self):
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.flavors.list())
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.flavors.list()[:1])
+        self.mox.ReplayAll()
+
+        utils.flavor_list(self.request)
+        utils.invalidate_flavor_catalog(self.request)
+        self.assertEqual(1, len(utils.flavor_list(self.request)))
+
+    @helpers.create_stubs({api.nova: ('flavor_list',),
+                           exceptions: ('handle',)})
+    def test_flavor_list_error_not_cached(self):
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+            .AndRaise(self.exceptions.nova)
+        exceptions.handle(IsA(http.HttpRequest), IgnoreArg())
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.flavors.list())
+        self.mox.ReplayAll()
+
+        self.assertEqual([], utils.flavor_list(self.request))
+        self.assertEqual(len(self.flavors.list()),
+                         len(utils.flavor_list(self.request)))
+
+
+class ServerLookupTests(helpers.TestCase):
+    @helpers.create_stubs({api.nova: ('server_list', 'server_get')})
+    def test_server_lookup_pages(self):
+        servers = self.servers.list()
+        api.nova.server_list(IsA(http.HttpRequest),
+                             search_opts={'paginate': True},
+                             all_tenants=False) \
+            .AndReturn([servers[:1], True])
+        api.nova.server_list(IsA(http.HttpRequest),
+                             search_opts={'paginate': True,
+                                          'marker': servers[0].id},
+                             all_tenants=False) \
+            .AndReturn([servers[1:2], True])
+        api.nova.server_get(IsA(http.HttpRequest), servers[2].id) \
+            .AndReturn(servers[2])
+        api.nova.server_get(IsA(http.HttpRequest), 'deleted') \
+            .AndRaise(nova_exceptions.NotFound(404))
+        self.mox.ReplayAll()
+
+        ids = [s.id for s in servers[:3]] + ['deleted']
+        found = utils.server_lookup(self.request, ids)
+        self.assertEqual(sorted(ids[:3]), sorted(found.keys()))
+
+    @helpers.create_stubs({api.nova: ('server_list',)})
+    def test_server_lookup_whole_list(self):
+        servers = self.servers.list()
+        api.nova.server_list(IsA(http.HttpRequest),
+                             search_opts={'paginate': True},
+                             all_tenants=False) \
+            .AndReturn([servers[:1], False])
+        self.mox.ReplayAll()
+
+        found = utils.server_lookup(self.request, [servers[0].id, 'deleted'])
+        self.assertEqual([servers[0].id], found.keys())
+
+
+class ImageNameLookupTests(helpers.TestCase):
+    @helpers.create_stubs({api.glance: ('image_list_detailed',
+                                        'image_get')})
+    def test_image_name_lookup_caches_misses(self):
+        image = self.images.first()
+        api.glance.image_list_detailed(IsA(http.HttpRequest)) \
+            .AndReturn([[image], False, False])
+        api.glance.image_get(IsA(http.HttpRequest), 'deleted-image') \
+            .AndRaise(glance_exceptions.NotFound())
+        self.mox.ReplayAll()
+
+        # The deleted image is only looked up once
+        for i in range(2):
+            names = utils.image_name_lookup(self.request,
+                                            [image.id, 'deleted-image'])
+            self.assertEqual({image.id: image.name, 'deleted-image': None},
+                             names)
+
+    @helpers.create_stubs({api.glance: ('image_list_detailed',
+                                        'image_get')})
+    def test_image_name_lookup_get_error_not_cached(self):
+        image = self.images.first()
+        api.glance.image_list_detailed(IsA(http.HttpRequest)) \
+            .AndReturn([[], False, False])
+        api.glance.image_get(IsA(http.HttpRequest), image.id) \
+            .AndRaise(self.exceptions.glance)
+        api.glance.image_list_detailed(IsA(http.HttpRequest)) \
+            .AndReturn([[image], False, False])
+        self.mox.ReplayAll()
+
+        self.assertEqual({image.id: None},
+                         utils.image_name_lookup(self.request, [image.id]))
+        self.assertEqual({image.id: image.name},
+                         utils.image_name_lookup(self.request, [image.id]))
+
+    @helpers.create_stubs({api.glance: ('image_list_detailed',)})
+    def test_image_name_lookup_per_endpoint(self):
+        image = self.images.first()
+        api.glance.image_list_detailed(IsA(http.HttpRequest)) \
+            .AndReturn([[image], False, False])
+        other = copy.copy(image)
+        other.name = 'another-image'
+        api.glance.image_list_detailed(IsA(http.HttpRequest)) \
+            .AndReturn([[other], False, False])
+        self.mox.ReplayAll()
+
+        utils.image_name_lookup(self.request, [image.id])
+        # Same region name and image id, but another cloud
+        self.request.user.endpoint = 'http://another-keystone:5000/v2.0'
+        self.assertEqual({image.id: 'another-image'},
+                         utils.image_name_lookup(self.request, [image.id]))
+
+    @helpers.create_stubs({api.glance: ('image_list_detailed',),
+                           exceptions: ('handle',)})
+    def test_image_name_lookup_error_not_cached(self):
+        image = self.images.first()
+        api.glance.image_list_detailed(IsA(http.HttpRequest)) \
+            .AndRaise(self.exceptions.glance)
+        exceptions.handle(IsA(http.HttpRequest), ignore=True)
+        api.glance.image_list_detailed(IsA(http.HttpRequest)) \
+            .AndReturn([[image], False, False])
+        self.mox.ReplayAll()
+
+        self.assertEqual({image.id: None},
+                         utils.image_name_lookup(self.request, [image.id]))
+        self.assertEqual({image.id: image.name},
+                         utils.image_name_lookup(self.request, [image.id]))
+
+
 class ConsoleManagerTests(helpers.TestCase):
 
     def setup_consoles(self):
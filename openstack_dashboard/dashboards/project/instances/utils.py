@@ -10,10 +10,14 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import hashlib
 import logging
+import uuid
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.translation import ugettext_lazy as _
+from novaclient.v1_1 import flavors as nova_flavors
 import six
 
 from horizon import exceptions
@@ -22,9 +26,17 @@ from openstack_dashboard import api
 
 LOG = logging.getLogger(__name__)
 
+LOOKUP_CACHE_PREFIX = 'horizon:instances:lookup'
+# Cached in place of the objects which could not be found
+LOOKUP_MISS = 'horizon:instances:lookup:miss'
+LOOKUP_MISS_TIMEOUT = 60
+FLAVOR_CATALOG_PREFIX = 'horizon:instances:flavors'
+# Pages of the server list searched by server_lookup before falling back
+# to fetching the remaining servers one by one
+SERVER_LOOKUP_PAGES = 2
 
-def flavor_list(request):
-    """Utility method to retrieve a list of flavors."""
+
+def _flavor_list(request):
     try:
         return api.nova.flavor_list(request)
     except Exception:
@@ -33,12 +45,242 @@ def flavor_list(request):
         return []
 
 
-def sort_flavor_list(request, flavors):
+def _flavor_catalog_version_key(request):
+    region = request.user.services_region or ''
+    return ':'.join((FLAVOR_CATALOG_PREFIX, 'version', region))
+
+
+def _flavor_catalog_key(request):
+    version = cache.get(_flavor_catalog_version_key(request)) or '0'
+    region = request.user.services_region or ''
+    return ':'.join((FLAVOR_CATALOG_PREFIX, region, version,
+                     request.user.tenant_id or ''))
+
+
+def _flavors_from_infos(request, infos):
+    # Rebuilt with a real manager, so that get_keys() and the other calls
+    # to nova still work on the cached flavors
+    manager = api.nova.novaclient(request).flavors
+    return [nova_flavors.Flavor(manager, info, loaded=True)
+            for info in infos]
+
+
+def flavor_list(request):
+    """Utility method to retrieve a list of flavors.
+
+    The flavors available to the project are kept sorted by
+    ``CREATE_INSTANCE_FLAVOR_SORT`` in a catalog cached per project and
+    region for ``FLAVOR_CATALOG_CACHE_TIMEOUT`` seconds. Only the flavor
+    information itself is cached, extra specs are left to be fetched by
+    the callers which need them.
+    """
+    timeout = getattr(settings, 'FLAVOR_CATALOG_CACHE_TIMEOUT', 300)
+    if not timeout:
+        return sort_flavors(request, _flavor_list(request))
+    key = _flavor_catalog_key(request)
+    infos = cache.get(key)
+    api.tracing.record_cache(request, infos is not None)
+    if infos is None:
+        flavors = sort_flavors(request, _flavor_list(request))
+        # An empty list is what a failed call returns, don't keep it
+        if flavors:
+            cache.set(key, [flavor._info for flavor in flavors], timeout)
+        return flavors
+    return _flavors_from_infos(request, infos)
+
+
+def invalidate_flavor_catalog(request):
+    """Drops the flavor catalogs of every project in the current region.
+
+    To be called when a flavor is created or deleted, or its access changed.
+    """
+    timeout = getattr(settings, 'FLAVOR_CATALOG_CACHE_TIMEOUT', 300)
+    if timeout:
+        # The catalogs are keyed on the version, a new one orphans them all.
+        # It must outlive the catalogs cached under the previous version.
+        cache.set(_flavor_catalog_version_key(request), uuid.uuid4().hex,
+                  timeout)
+
+
+def _lookup_cache_scope(request):
+    # Clouds of different keystones may share a region name and ids, e.g.
+    # the default nova flavors
+    user = request.user
+    scope = '|'.join(six.text_type(part) for part in (
+        getattr(user, 'endpoint', None),
+        getattr(user, 'services_region', None)))
+    return hashlib.md5(scope.encode('utf-8')).hexdigest()
+
+
+def _lookup_cache_key(scope, kind, obj_id):
+    return ':'.join((LOOKUP_CACHE_PREFIX, kind, scope,
+                     six.text_type(obj_id)))
+
+
+def _cached_lookup(request, kind, ids, fetch_missing):
+    """Resolves ``ids`` through the lookup cache of the keystone and region.
+
+    ``fetch_missing`` is called with the ids which were not found in the
+    cache, in order of first appearance. It returns a dict mapping ids to
+    cacheable values, and the set of ids which could not be looked up
+    because of an error (all of them if the lookup failed). The dict may
+    have more entries than were asked for (e.g. a whole catalog page), in
+    which case all of them are cached but only the requested ones are
+    returned. Entries expire after ``INSTANCE_LOOKUP_CACHE_TIMEOUT``
+    seconds. The ids ``fetch_missing`` could not resolve are left out of
+    the result. Those which were not found, rather than failed, are
+    remembered as such for ``LOOKUP_MISS_TIMEOUT`` seconds so that e.g. a
+    deleted image does not cause a fetch on every page load.
+    """
+    scope = _lookup_cache_scope(request)
+    keys = dict((_lookup_cache_key(scope, kind, obj_id), obj_id)
+                for obj_id in ids)
+    cached = dict((keys[key], value)
+                  for key, value in cache.get_many(keys.keys()).items())
+    missing = []
+    for obj_id in ids:
+        if obj_id not in cached and obj_id not in missing:
+            missing.append(obj_id)
+    api.tracing.record_cache(request, not missing)
+    if missing:
+        fetched, errors = fetch_missing(missing)
+        timeout = getattr(settings, 'INSTANCE_LOOKUP_CACHE_TIMEOUT', 300)
+        if fetched:
+            cache.set_many(dict((_lookup_cache_key(scope, kind, obj_id),
+                                 value)
+                                for obj_id, value in fetched.items()),
+                           timeout)
+        misses = [obj_id for obj_id in missing
+                  if obj_id not in fetched and obj_id not in errors]
+        if misses:
+            cache.set_many(dict((_lookup_cache_key(scope, kind, obj_id),
+                                 LOOKUP_MISS) for obj_id in misses),
+                           min(timeout, LOOKUP_MISS_TIMEOUT))
+        cached.update((obj_id, fetched[obj_id])
+                      for obj_id in missing if obj_id in fetched)
+    return dict((obj_id, value) for obj_id, value in cached.items()
+                if value != LOOKUP_MISS)
+
+
+def server_lookup(request, instance_ids, all_tenants=False):
+    """Returns a dict of instance id -> server for the given instance ids.
+
+    Nova only lets admins filter servers by id, so the project's servers
+    (or those of every project with ``all_tenants``) are listed a page at
+    a time until all of the ids were found, for at most
+    ``SERVER_LOOKUP_PAGES`` pages. The list is sorted newest first, which
+    is where the instances being polled or acted upon usually are. The
+    servers still missing after that are fetched one by one. Servers which
+    do not exist any more are left out.
+    """
+    servers = {}
+    remaining = set(instance_ids)
+    listed_all = False
+    search_opts = {}
+    if len(remaining) > 1:
+        for page in range(SERVER_LOOKUP_PAGES):
+            search_opts['paginate'] = True
+            page_servers, has_more = api.nova.server_list(
+                request, search_opts=search_opts, all_tenants=all_tenants)
+            for server in page_servers:
+                if server.id in remaining:
+                    servers[server.id] = server
+                    remaining.discard(server.id)
+            if not has_more:
+                listed_all = True
+            if listed_all or not remaining:
+                break
+            search_opts = {'marker': page_servers[-1].id}
+    if not listed_all:
+        for instance_id in [i for i in instance_ids if i in remaining]:
+            try:
+                servers[instance_id] = api.nova.server_get(request,
+                                                           instance_id)
+            except Exception as e:
+                if not isinstance(e, exceptions.NOT_FOUND):
+                    raise
+    return servers
+
+
+def flavor_lookup(request, flavor_ids):
+    """Returns a dict of flavor id -> flavor for the given flavor ids.
+
+    Flavors are served from the lookup cache. Nova cannot filter flavors
+    by id, so on a miss the flavor list is fetched once (warming the cache
+    for every flavor in it) and any flavor still missing, e.g. a private
+    or deleted one, is fetched individually.
+    """
+    def fetch_missing(missing):
+        flavors = {}
+        errors = set()
+        try:
+            for flavor in api.nova.flavor_list(request):
+                flavors[six.text_type(flavor.id)] = flavor._info
+        except Exception:
+            exceptions.handle(request, ignore=True)
+        for flavor_id in [f for f in missing if f not in flavors]:
+            try:
+                flavor = api.nova.flavor_get(request, flavor_id)
+                flavors[flavor_id] = flavor._info
+            except Exception as e:
+                if not isinstance(e, exceptions.NOT_FOUND):
+                    errors.add(flavor_id)
+                msg = _('Unable to retrieve instance size information.')
+                exceptions.handle(request, msg)
+        return flavors, errors
+
+    flavor_ids = [six.text_type(flavor_id) for flavor_id in flavor_ids
+                  if flavor_id]
+    infos = _cached_lookup(request, 'flavor', flavor_ids, fetch_missing)
+    if not infos:
+        return {}
+    return dict(zip(infos.keys(),
+                    _flavors_from_infos(request, infos.values())))
+
+
+def image_name_lookup(request, image_ids):
+    """Returns a dict of image id -> image name for the given image ids.
+
+    Names are served from the lookup cache. Glance cannot filter images
+    by a list of ids, so on a miss one page of the image list is fetched
+    to warm the cache and the images still missing are fetched one by
+    one. Images which could not be found (e.g. deleted ones) or retrieved
+    map to None.
+    """
+    def fetch_missing(missing):
+        names = {}
+        errors = set()
+        try:
+            images, _more, _prev = api.glance.image_list_detailed(request)
+        except Exception:
+            exceptions.handle(request, ignore=True)
+            return names, set(missing)
+        for image in images:
+            names[six.text_type(image.id)] = image.name
+        for image_id in missing:
+            if image_id not in names:
+                try:
+                    image = api.glance.image_get(request, image_id)
+                    names[image_id] = image.name
+                except Exception as e:
+                    # Only the images which do not exist are cached as
+                    # such, the others are tried again on the next load
+                    if not isinstance(e, exceptions.NOT_FOUND):
+                        errors.add(image_id)
+        return names, errors
+
+    image_ids = [six.text_type(image_id) for image_id in image_ids
+                 if image_id]
+    names = _cached_lookup(request, 'image', image_ids, fetch_missing)
+    return dict((image_id, names.get(image_id)) for image_id in image_ids)
+
+
+def sort_flavors(request, flavors):
     """Utility method to sort a list of flavors.
-        By default, returns the available flavors, sorted by RAM
-        usage (ascending). Override these behaviours with a
-        CREATE_INSTANCE_FLAVOR_SORT dict
-        in local_settings.py.
+
+    By default, returns the flavors sorted by RAM usage (ascending).
+    Override these behaviours with a CREATE_INSTANCE_FLAVOR_SORT dict
+    in local_settings.py.
     """
     def get_key(flavor, sort_key):
         try:
@@ -55,15 +297,23 @@ def sort_flavor_list(request, flavors):
             key = lambda flavor: get_key(flavor, sort_key)
         else:
             key = sort_key
-        flavor_list = [(flavor.id, '%s' % flavor.name)
-                       for flavor in sorted(flavors, key=key, reverse=rev)]
-        return flavor_list
+        return sorted(flavors, key=key, reverse=rev)
     except Exception:
         exceptions.handle(request,
                           _('Unable to sort instance flavors.'))
         return []
 
 
+def sort_flavor_list(request, flavors):
+    """Utility method to sort a list of flavors.
+
+    Returns the (id, name) choices of the flavors sorted by
+    :func:`sort_flavors`.
+    """
+    return [(flavor.id, '%s' % flavor.name)
+            for flavor in sort_flavors(request, flavors)]
+
+
 def availability_zone_list(request):
     """Utility method to retrieve a list of availability zones."""
     try:
@@ -146,7 +396,9 @@ def flavor_field_data(request, include_empty_option=False):
     """
     flavors = flavor_list(request)
     if flavors:
-        flavors_list = sort_flavor_list(request, flavors)
+        # The flavor list is already sorted
+        flavors_list = [(flavor.id, '%s' % flavor.name)
+                        for flavor in flavors]
         if include_empty_option:
             return [("", _("Select Flavor")), ] + flavors_list
         return flavors_list
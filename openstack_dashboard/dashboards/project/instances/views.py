@@ -45,6 +45,8 @@ from openstack_dashboard.dashboards.project.instances \
     import tables as project_tables
 from openstack_dashboard.dashboards.project.instances \
     import tabs as project_tabs
+from openstack_dashboard.dashboards.project.instances \
+    import utils as instance_utils
 from openstack_dashboard.dashboards.project.instances \
     import workflows as project_workflows
 
@@ -81,46 +83,29 @@ class IndexView(tables.DataTableView):
                     message=_('Unable to retrieve IP addresses from Neutron.'),
                     ignore=True)
 
-            # Gather our flavors and images and correlate our instances to them
-            try:
-                flavors = api.nova.flavor_list(self.request)
-            except Exception:
-                flavors = []
-                exceptions.handle(self.request, ignore=True)
-
-            try:
-                # TODO(gabriel): Handle pagination.
-                images, more, prev = api.glance.image_list_detailed(
-                    self.request)
-            except Exception:
-                images = []
-                exceptions.handle(self.request, ignore=True)
-
-            full_flavors = SortedDict([(str(flavor.id), flavor)
-                                       for flavor in flavors])
-            image_map = SortedDict([(str(image.id), image)
-                                    for image in images])
+            # Correlate our instances to their flavors and images through
+            # the cached lookup maps rather than listing whole catalogs.
+            flavor_ids = [instance.flavor["id"] for instance in instances]
+            image_ids = [instance.image.get('id') for instance in instances
+                         if isinstance(getattr(instance, 'image', None), dict)]
+            full_flavors = instance_utils.flavor_lookup(self.request,
+                                                        flavor_ids)
+            image_names = instance_utils.image_name_lookup(self.request,
+                                                           image_ids)
 
-            # Loop through instances to get flavor info.
             for instance in instances:
                 if hasattr(instance, 'image'):
                     # Instance from image returns dict
                     if isinstance(instance.image, dict):
-                        if instance.image.get('id') in image_map:
-                            instance.image = image_map[instance.image['id']]
-
-                try:
-                    flavor_id = instance.flavor["id"]
-                    if flavor_id in full_flavors:
-                        instance.full_flavor = full_flavors[flavor_id]
-                    else:
-                        # If the flavor_id is not in full_flavors list,
-                        # get it via nova api.
-                        instance.full_flavor = api.nova.flavor_get(
-                            self.request, flavor_id)
-                except Exception:
-                    msg = _('Unable to retrieve instance size information.')
-                    exceptions.handle(self.request, msg)
+                        image_id = instance.image.get('id')
+                        if image_id in image_names:
+                            # Images which are gone map to None
+                            name = image_names[image_id] or _("-")
+                            instance.image = dict(instance.image, name=name)
+
+                flavor_id = instance.flavor["id"]
+                if flavor_id in full_flavors:
+                    instance.full_flavor = full_flavors[flavor_id]
         return instances
 
     def get_filters(self, filters):
@@ -46,20 +46,42 @@ class NetworkTopologyTests(test.TestCase):
     def test_json_view_router_disabled(self):
         self._test_json_view(router_enable=False)
 
-    def _test_json_view(self, router_enable=True):
+    @test.create_stubs({api.nova: ('server_list',),
+                        api.neutron: ('network_list_for_tenant',
+                                      'network_list',
+                                      'router_list',
+                                      'port_list')})
+    def test_json_view_since(self):
+        data = self._test_json_view(since='x.x.x.x')
+        self.assertEqual(set(['servers', 'networks', 'ports', 'routers',
+                              'version']), set(data))
+        version = data['version'].split('.')
+        self.assertEqual(4, len(version))
+
+        self.mox.VerifyAll()
+        self.mox.ResetAll()
+        # only the servers changed
+        since = '.'.join(['stale'] + version[1:])
+        data = self._test_json_view(since=since)
+        self.assertEqual(set(['servers', 'version']), set(data))
+        self.assertEqual('.'.join(version), data['version'])
+
+    def _test_json_view(self, router_enable=True, since=None):
         api.nova.server_list(
-            IsA(http.HttpRequest)).AndReturn([self.servers.list(), False])
+            IsA(http.HttpRequest)).InAnyOrder() \
+            .AndReturn([self.servers.list(), False])
         tenant_networks = [net for net in self.networks.list()
                            if not net['router:external']]
         external_networks = [net for net in self.networks.list()
                              if net['router:external']]
         api.neutron.network_list_for_tenant(
             IsA(http.HttpRequest),
-            self.tenant.id).AndReturn(tenant_networks)
+            self.tenant.id).InAnyOrder().AndReturn(tenant_networks)
         if router_enable:
             api.neutron.network_list(
                 IsA(http.HttpRequest),
-                **{'router:external': True}).AndReturn(external_networks)
+                **{'router:external': True}).InAnyOrder() \
+                .AndReturn(external_networks)
 
         # router1 : gateway port not in the port list
         # router2 : no gateway port
@@ -68,15 +90,20 @@ class NetworkTopologyTests(test.TestCase):
         if router_enable:
             api.neutron.router_list(
                 IsA(http.HttpRequest),
-                tenant_id=self.tenant.id).AndReturn(routers)
+                tenant_id=self.tenant.id).InAnyOrder().AndReturn(routers)
         api.neutron.port_list(
-            IsA(http.HttpRequest)).AndReturn(self.ports.list())
+            IsA(http.HttpRequest),
+            fields=['id', 'network_id', 'device_id', 'fixed_ips',
+                    'device_owner', 'status']).InAnyOrder() \
+            .AndReturn(self.ports.list())
 
         self.mox.ReplayAll()
 
-        res = self.client.get(JSON_URL)
+        res = self.client.get(JSON_URL, {'since': since} if since else {})
         self.assertEqual('text/json', res['Content-Type'])
-        data = json.loads(res.content)
+        data = json.loads(''.join(res.streaming_content))
+        if since:
+            return data
 
         # servers
         # result_server_urls = [(server['id'], server['url'])
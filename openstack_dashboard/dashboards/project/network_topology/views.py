@@ -16,19 +16,22 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import functools
+import hashlib
 import json
 
 from django.conf import settings
 from django.core.urlresolvers import reverse
 from django.core.urlresolvers import reverse_lazy
-from django.http import HttpResponse  # noqa
 from django.utils.translation import ugettext_lazy as _
 from django.views.generic import View  # noqa
 
 from horizon import exceptions
+from horizon.utils import functions
 from horizon import views
 
 from openstack_dashboard import api
+from openstack_dashboard.api.rest import utils as rest_utils
 from openstack_dashboard.usage import quotas
 
 from openstack_dashboard.dashboards.project.network_topology.instances \
@@ -134,6 +137,11 @@ class NetworkTopologyView(views.HorizonTemplateView):
 
 
 class JSONView(View):
+    # the only port fields the topology needs
+    port_fields = ['id', 'network_id', 'device_id', 'fixed_ips',
+                   'device_owner', 'status']
+    # the order of the collections in the version token
+    collections = ('servers', 'networks', 'ports', 'routers')
 
     @property
     def is_router_enabled(self):
@@ -148,13 +156,6 @@ class JSONView(View):
                 continue
             resource['url'] = reverse(view, None, [str(resource['id'])])
 
-    def _check_router_external_port(self, ports, router_id, network_id):
-        for port in ports:
-            if (port['network_id'] == network_id
-                    and port['device_id'] == router_id):
-                return True
-        return False
-
     def _get_servers(self, request):
         # Get nova data
         try:
@@ -249,7 +250,8 @@ class JSONView(View):
 
     def _get_ports(self, request):
         try:
-            neutron_ports = api.neutron.port_list(request)
+            neutron_ports = api.neutron.port_list(request,
+                                                  fields=self.port_fields)
         except Exception:
             neutron_ports = []
 
@@ -267,6 +269,8 @@ class JSONView(View):
     def _prepare_gateway_ports(self, routers, ports):
         # user can't see port on external network. so we are
         # adding fake port based on router information
+        router_ports = set((port['device_id'], port['network_id'])
+                           for port in ports)
         for router in routers:
             external_gateway_info = router.get('external_gateway_info')
             if not external_gateway_info:
@@ -275,9 +279,7 @@ class JSONView(View):
                 'network_id')
             if not external_network:
                 continue
-            if self._check_router_external_port(ports,
-                                                router['id'],
-                                                external_network):
+            if (router['id'], external_network) in router_ports:
                 continue
             fake_port = {'id': 'gateway%s' % external_network,
                          'network_id': external_network,
@@ -285,11 +287,31 @@ class JSONView(View):
                          'fixed_ips': []}
             ports.append(fake_port)
 
+    def _version(self, data):
+        return '.'.join(
+            hashlib.md5(json.dumps(data[key], sort_keys=True)).hexdigest()[:12]
+            for key in self.collections)
+
     def get(self, request, *args, **kwargs):
-        data = {'servers': self._get_servers(request),
-                'networks': self._get_networks(request),
-                'ports': self._get_ports(request),
-                'routers': self._get_routers(request)}
+        """Returns the topology as JSON.
+
+        The response carries a ``version`` token. When the token of an
+        earlier response is passed back as ``since``, the collections which
+        did not change since are left out of the response.
+        """
+        data = dict(zip(self.collections, functions.run_concurrently(
+            *[functools.partial(getter, request) for getter in
+              (self._get_servers, self._get_networks, self._get_ports,
+               self._get_routers)],
+            max_workers=getattr(settings, 'CONCURRENT_DATA_LOADS', 4))))
         self._prepare_gateway_ports(data['routers'], data['ports'])
-        json_string = json.dumps(data, ensure_ascii=False)
-        return HttpResponse(json_string, content_type='text/json')
+        version = self._version(data)
+        since = request.GET.get('since', '').split('.')
+        if len(since) == len(self.collections):
+            for key, old, new in zip(self.collections, since,
+                                     version.split('.')):
+                if old == new:
+                    del data[key]
+        data['version'] = version
+        return rest_utils.StreamingJSONResponse(data,
+                                                content_type='text/json')
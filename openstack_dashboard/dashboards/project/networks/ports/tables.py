@@ -67,17 +67,23 @@ STATUS_DISPLAY_CHOICES = (
 class PortsTable(tables.DataTable):
     name = tables.Column("name_or_id",
                          verbose_name=_("Name"),
-                         link="horizon:project:networks:ports:detail")
-    fixed_ips = tables.Column(get_fixed_ips, verbose_name=_("Fixed IPs"))
-    attached = tables.Column(get_attached, verbose_name=_("Attached Device"))
+                         link="horizon:project:networks:ports:detail",
+                         api_fields=("id", "name"))
+    fixed_ips = tables.Column(get_fixed_ips, verbose_name=_("Fixed IPs"),
+                              api_fields=("fixed_ips",))
+    attached = tables.Column(get_attached, verbose_name=_("Attached Device"),
+                             api_fields=("device_owner", "device_id"))
     status = tables.Column("status",
                            verbose_name=_("Status"),
-                           display_choices=STATUS_DISPLAY_CHOICES)
+                           display_choices=STATUS_DISPLAY_CHOICES,
+                           api_fields=("status",))
     admin_state = tables.Column("admin_state",
                                 verbose_name=_("Admin State"),
-                                display_choices=DISPLAY_CHOICES)
+                                display_choices=DISPLAY_CHOICES,
+                                api_fields=("admin_state_up",))
     mac_state = tables.Column("mac_state", empty_value=api.neutron.OFF_STATE,
-                              verbose_name=_("MAC Learning State"))
+                              verbose_name=_("MAC Learning State"),
+                              api_fields=("mac_learning_enabled",))
 
     def get_object_display(self, port):
         return port.id
@@ -87,6 +93,8 @@ class PortsTable(tables.DataTable):
         verbose_name = _("Ports")
         row_actions = (UpdatePort,)
         hidden_title = False
+        # row ids and the policy target of the row actions
+        api_fields = ("id", "tenant_id")
 
     def __init__(self, request, data=None, needs_form_wrapper=None, **kwargs):
         super(PortsTable, self).__init__(request, data=data,
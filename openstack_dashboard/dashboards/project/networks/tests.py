@@ -163,11 +163,16 @@ class NetworkTests(test.TestCase):
         quota_data = self.quota_usages.first()
         quota_data['subnets']['available'] = 5
         network_id = self.networks.first().id
+        port_fields = ['admin_state_up', 'device_id', 'device_owner',
+                       'fixed_ips', 'id', 'name', 'status', 'tenant_id']
+        if mac_learning:
+            port_fields.insert(5, 'mac_learning_enabled')
         api.neutron.network_get(IsA(http.HttpRequest), network_id)\
             .AndReturn(self.networks.first())
         api.neutron.subnet_list(IsA(http.HttpRequest), network_id=network_id)\
             .AndReturn([self.subnets.first()])
-        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id)\
+        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id,
+                              fields=port_fields)\
             .AndReturn([self.ports.first()])
         api.neutron.network_get(IsA(http.HttpRequest), network_id)\
             .AndReturn(self.networks.first())
@@ -242,7 +247,8 @@ class NetworkTests(test.TestCase):
             AndReturn(self.networks.first())
         api.neutron.subnet_list(IsA(http.HttpRequest), network_id=network_id).\
             AndRaise(self.exceptions.neutron)
-        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id).\
+        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id,
+                              fields=IsA(list)).\
             AndReturn([self.ports.first()])
         # Called from SubnetTable
         api.neutron.is_extension_supported(IsA(http.HttpRequest),
@@ -286,7 +292,8 @@ class NetworkTests(test.TestCase):
             AndReturn(self.networks.first())
         api.neutron.subnet_list(IsA(http.HttpRequest), network_id=network_id).\
             AndReturn([self.subnets.first()])
-        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id).\
+        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id,
+                              fields=IsA(list)).\
             AndRaise(self.exceptions.neutron)
         # Called from SubnetTable
         api.neutron.network_get(IsA(http.HttpRequest), network_id).\
@@ -1578,7 +1585,8 @@ class NetworkSubnetTests(test.TestCase):
             .AndReturn([self.subnets.first()])
         api.neutron.network_get(IsA(http.HttpRequest), network_id)\
             .AndReturn(self.networks.first())
-        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id)\
+        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id,
+                              fields=IsA(list))\
             .AndReturn([self.ports.first()])
         # Called from SubnetTable
         api.neutron.network_get(IsA(http.HttpRequest), network_id)\
@@ -1620,7 +1628,8 @@ class NetworkSubnetTests(test.TestCase):
             .AndReturn([self.subnets.first()])
         api.neutron.network_get(IsA(http.HttpRequest), network_id)\
             .AndReturn(self.networks.first())
-        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id)\
+        api.neutron.port_list(IsA(http.HttpRequest), network_id=network_id,
+                              fields=IsA(list))\
             .AndReturn([self.ports.first()])
         # Called from SubnetTable
         api.neutron.network_get(IsA(http.HttpRequest), network_id)\
@@ -1895,7 +1904,7 @@ class NetworkViewTests(test.TestCase):
             IsA(http.HttpRequest), network_id=network_id)\
             .AndReturn(self.subnets.list())
         api.neutron.port_list(
-            IsA(http.HttpRequest), network_id=network_id)\
+            IsA(http.HttpRequest), network_id=network_id, fields=IsA(list))\
             .AndReturn([self.ports.first()])
         api.neutron.is_extension_supported(
             IsA(http.HttpRequest), 'mac-learning')\
@@ -50,19 +50,19 @@ class UsageViewTests(test.TestCase):
     def _stub_neutron_api_calls(self, neutron_sg_enabled=True):
         self.mox.StubOutWithMock(api.neutron, 'is_extension_supported')
         self.mox.StubOutWithMock(api.network, 'floating_ip_supported')
-        self.mox.StubOutWithMock(api.network, 'tenant_floating_ip_list')
+        self.mox.StubOutWithMock(api.network, 'tenant_floating_ip_count')
         if neutron_sg_enabled:
-            self.mox.StubOutWithMock(api.network, 'security_group_list')
+            self.mox.StubOutWithMock(api.network, 'security_group_count')
         api.neutron.is_extension_supported(
             IsA(http.HttpRequest),
             'security-group').AndReturn(neutron_sg_enabled)
         api.network.floating_ip_supported(IsA(http.HttpRequest)) \
             .AndReturn(True)
-        api.network.tenant_floating_ip_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.floating_ips.list())
+        api.network.tenant_floating_ip_count(IsA(http.HttpRequest)) \
+            .AndReturn(len(self.floating_ips.list()))
         if neutron_sg_enabled:
-            api.network.security_group_list(IsA(http.HttpRequest)) \
-                .AndReturn(self.q_secgroups.list())
+            api.network.security_group_count(IsA(http.HttpRequest)) \
+                .AndReturn(len(self.q_secgroups.list()))
 
     def test_usage(self):
         self._test_usage(nova_stu_enabled=True)
@@ -295,8 +295,8 @@ class UsageViewTests(test.TestCase):
         self.mox.StubOutWithMock(api.neutron, 'tenant_quota_get')
         self.mox.StubOutWithMock(api.neutron, 'is_extension_supported')
         self.mox.StubOutWithMock(api.network, 'floating_ip_supported')
-        self.mox.StubOutWithMock(api.network, 'tenant_floating_ip_list')
-        self.mox.StubOutWithMock(api.network, 'security_group_list')
+        self.mox.StubOutWithMock(api.network, 'tenant_floating_ip_count')
+        self.mox.StubOutWithMock(api.network, 'security_group_count')
         start = datetime.datetime(now.year, now.month, 1, 0, 0, 0, 0)
         end = datetime.datetime(now.year, now.month, now.day, 23, 59, 59, 0)
         api.nova.usage_get(IsA(http.HttpRequest),
@@ -316,11 +316,11 @@ class UsageViewTests(test.TestCase):
         api.network.floating_ip_supported(IsA(http.HttpRequest)) \
             .AndReturn(neutron_fip_enabled)
         if neutron_fip_enabled:
-            api.network.tenant_floating_ip_list(IsA(http.HttpRequest)) \
-                .AndReturn(self.floating_ips.list())
+            api.network.tenant_floating_ip_count(IsA(http.HttpRequest)) \
+                .AndReturn(len(self.floating_ips.list()))
         if neutron_sg_enabled:
-            api.network.security_group_list(IsA(http.HttpRequest)) \
-                .AndReturn(self.q_secgroups.list())
+            api.network.security_group_count(IsA(http.HttpRequest)) \
+                .AndReturn(len(self.q_secgroups.list()))
         api.neutron.tenant_quota_get(IsA(http.HttpRequest), self.tenant.id) \
             .AndReturn(self.neutron_quotas.first())
         self.mox.ReplayAll()
@@ -10,19 +10,83 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import hashlib
 import json
 
+from django.core.cache import cache
+from django.utils import translation
+import six
+
 from openstack_dashboard.api import heat
 
 from openstack_dashboard.dashboards.project.stacks import mappings
 from openstack_dashboard.dashboards.project.stacks import sro
 
 
+CACHE_PREFIX = 'horizon:stacks:d3'
+# rendered info boxes and topology snapshots live this long in the cache
+CACHE_TIMEOUT = 600
+
+
 class Stack(object):
     pass
 
 
-def d3_data(request, stack_id=''):
+def _cache_key(request, *parts):
+    # Stack ids are only unique within a project
+    parts = (request.user.tenant_id,) + parts
+    key = '|'.join(six.text_type(part) for part in parts).encode('utf-8')
+    return ':'.join((CACHE_PREFIX, hashlib.md5(key).hexdigest()))
+
+
+def _resource_fingerprint(resource):
+    return '%s|%s' % (resource.resource_status,
+                      getattr(resource, 'updated_time', None))
+
+
+def _resource_info_boxes(request, stack_id, resources):
+    """Returns the info box of each resource, keyed by resource name.
+
+    Rendered boxes are cached per resource, status and update time, so a
+    poll only renders the resources which changed since the last one.
+    """
+    language = translation.get_language()
+    keys = [_cache_key(request, 'info', stack_id, resource.resource_name,
+                       _resource_fingerprint(resource), language)
+            for resource in resources]
+    cached = cache.get_many(keys)
+    boxes = {}
+    rendered = {}
+    for key, resource in zip(keys, resources):
+        if key not in cached:
+            cached[key] = rendered[key] = sro.resource_info(resource)
+        boxes[resource.resource_name] = cached[key]
+    if rendered:
+        cache.set_many(rendered, CACHE_TIMEOUT)
+    return boxes
+
+
+def _stack_info_box(request, stack, stack_image):
+    key = _cache_key(request, 'stack', stack.id, stack.stack_status,
+                     getattr(stack, 'updated_time', None),
+                     stack.stack_status_reason, translation.get_language())
+    info_box = cache.get(key)
+    if info_box is None:
+        info_box = sro.stack_info(stack, stack_image)
+        cache.set(key, info_box, CACHE_TIMEOUT)
+    return info_box
+
+
+def d3_data(request, stack_id='', since=None):
+    """Returns the JSON the stack topology graph is drawn from.
+
+    The result carries a ``version`` token. When the token of an earlier
+    result is passed as ``since``, only the resources whose status or
+    update time changed are included in ``nodes``, the names of the ones
+    which disappeared are listed in ``removed`` and ``incremental`` is set.
+    If the snapshot behind the token has expired, the full data is
+    returned.
+    """
     try:
         stack = heat.stack_get(request, stack_id)
     except Exception:
@@ -37,7 +101,27 @@ def d3_data(request, stack_id=''):
     except Exception:
         resources = []
 
-    d3_data = {"nodes": [], "stack": {}}
+    snapshot = dict((resource.resource_name,
+                     _resource_fingerprint(resource))
+                    for resource in resources)
+    version = hashlib.md5(
+        json.dumps(sorted(snapshot.items()))).hexdigest()
+    previous = None
+    if since:
+        previous = cache.get(_cache_key(request, 'snapshot', stack_id,
+                                        since))
+    cache.set(_cache_key(request, 'snapshot', stack_id, version), snapshot,
+              CACHE_TIMEOUT)
+
+    d3_data = {"nodes": [], "stack": {}, "version": version}
+    if previous is not None:
+        d3_data['incremental'] = True
+        d3_data['removed'] = [name for name in previous
+                              if name not in snapshot]
+        resources = [resource for resource in resources
+                     if previous.get(resource.resource_name) !=
+                     snapshot[resource.resource_name]]
+
     if stack:
         stack_image = mappings.get_resource_image(stack.stack_status, 'stack')
         stack_node = {
@@ -51,11 +135,12 @@ def d3_data(request, stack_id=''):
             'text_x': 40,
             'text_y': ".35em",
             'in_progress': (stack.status == 'IN_PROGRESS'),
-            'info_box': sro.stack_info(stack, stack_image)
+            'info_box': _stack_info_box(request, stack, stack_image)
         }
         d3_data['stack'] = stack_node
 
     if resources:
+        info_boxes = _resource_info_boxes(request, stack.id, resources)
         for resource in resources:
             resource_image = mappings.get_resource_image(
                 resource.resource_status,
@@ -77,7 +162,7 @@ def d3_data(request, stack_id=''):
                 'text_x': 35,
                 'text_y': ".35em",
                 'in_progress': in_progress,
-                'info_box': sro.resource_info(resource)
+                'info_box': info_boxes[resource.resource_name]
             }
             d3_data['nodes'].append(resource_node)
     return json.dumps(d3_data)
@@ -26,8 +26,10 @@ from mox import IsA  # noqa
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
 
+from openstack_dashboard.dashboards.project.stacks import api as project_api
 from openstack_dashboard.dashboards.project.stacks import forms
 from openstack_dashboard.dashboards.project.stacks import mappings
+from openstack_dashboard.dashboards.project.stacks import sro
 from openstack_dashboard.dashboards.project.stacks import tables
 
 
@@ -107,6 +109,101 @@ class MappingsTests(test.TestCase):
             mappings.stack_output('http://www.example.com/foo'))
 
 
+class MockStackResource(object):
+    def __init__(self, name, status, updated_time):
+        self.resource_name = name
+        self.resource_status = status
+        self.resource_status_reason = None
+        self.resource_type = 'OS::Nova::Server'
+        self.required_by = []
+        self.updated_time = updated_time
+
+
+class D3DataTests(test.TestCase):
+
+    def _stub_stack(self, resources):
+        stack = self.stacks.first()
+        api.heat.stack_get(IsA(http.HttpRequest), stack.id) \
+            .AndReturn(stack)
+        api.heat.resources_list(IsA(http.HttpRequest), stack.stack_name) \
+            .AndReturn(resources)
+        return stack
+
+    @test.create_stubs({api.heat: ('stack_get', 'resources_list'),
+                        sro: ('resource_info',)})
+    def test_d3_data_incremental(self):
+        server1 = MockStackResource('server1', 'CREATE_IN_PROGRESS', None)
+        server2 = MockStackResource('server2', 'CREATE_COMPLETE', None)
+        server3 = MockStackResource('server3', 'CREATE_COMPLETE', None)
+        stack = self._stub_stack([server1, server2, server3])
+        sro.resource_info(server1).AndReturn('<p>server1</p>')
+        sro.resource_info(server2).AndReturn('<p>server2</p>')
+        sro.resource_info(server3).AndReturn('<p>server3</p>')
+
+        server1_done = MockStackResource('server1', 'CREATE_COMPLETE',
+                                         '2015-03-01T10:00:00Z')
+        self._stub_stack([server1_done, server2])
+        sro.resource_info(server1_done).AndReturn('<p>server1 done</p>')
+        self.mox.ReplayAll()
+
+        full = json.loads(project_api.d3_data(self.request,
+                                              stack_id=stack.id))
+        self.assertNotIn('incremental', full)
+        self.assertEqual(['server1', 'server2', 'server3'],
+                         sorted(node['name'] for node in full['nodes']))
+
+        data = json.loads(project_api.d3_data(self.request,
+                                              stack_id=stack.id,
+                                              since=full['version']))
+        self.assertTrue(data['incremental'])
+        self.assertEqual(['server3'], data['removed'])
+        self.assertEqual(1, len(data['nodes']))
+        self.assertEqual('CREATE_COMPLETE', data['nodes'][0]['status'])
+        self.assertEqual('<p>server1 done</p>', data['nodes'][0]['info_box'])
+        self.assertNotEqual(full['version'], data['version'])
+
+    @test.create_stubs({api.heat: ('stack_get', 'resources_list'),
+                        sro: ('resource_info',)})
+    def test_d3_data_unknown_version(self):
+        server1 = MockStackResource('server1', 'CREATE_COMPLETE', None)
+        stack = self._stub_stack([server1])
+        sro.resource_info(server1).AndReturn('<p>server1</p>')
+        self._stub_stack([server1])
+        self.mox.ReplayAll()
+
+        data = json.loads(project_api.d3_data(self.request,
+                                              stack_id=stack.id,
+                                              since='expired'))
+        self.assertNotIn('incremental', data)
+        self.assertEqual(1, len(data['nodes']))
+
+        # the info box is rendered once and then served from the cache
+        data = json.loads(project_api.d3_data(self.request,
+                                              stack_id=stack.id))
+        self.assertEqual('<p>server1</p>', data['nodes'][0]['info_box'])
+
+    @test.create_stubs({api.heat: ('stack_get', 'resources_list'),
+                        sro: ('resource_info',)})
+    def test_d3_data_per_project(self):
+        server1 = MockStackResource('server1', 'CREATE_COMPLETE', None)
+        stack = self._stub_stack([server1])
+        sro.resource_info(server1).AndReturn('<p>server1</p>')
+        self._stub_stack([server1])
+        sro.resource_info(server1).AndReturn('<p>server1 elsewhere</p>')
+        self.mox.ReplayAll()
+
+        full = json.loads(project_api.d3_data(self.request,
+                                              stack_id=stack.id))
+        # nothing cached for another project is served
+        self.request.user.tenant_id = 'another-project'
+        data = json.loads(project_api.d3_data(self.request,
+                                              stack_id=stack.id,
+                                              since=full['version']))
+        self.assertNotIn('incremental', data)
+        self.assertEqual('<p>server1 elsewhere</p>',
+                         data['nodes'][0]['info_box'])
+
+
 class StackTests(test.TestCase):
 
     @override_settings(API_RESULT_PAGE_SIZE=2)
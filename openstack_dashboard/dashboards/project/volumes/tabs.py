@@ -12,6 +12,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import functools
+
 from django.utils.datastructures import SortedDict
 from django.utils.translation import ugettext_lazy as _
 
@@ -86,9 +88,9 @@ class VolumeTab(tabs.TableTab, VolumeTableMixIn):
     preload = False
 
     def get_volumes_data(self):
-        volumes = self._get_volumes()
-        instances = self._get_instances()
-        volume_ids_with_snapshots = self._get_volumes_ids_with_snapshots()
+        volumes, instances, volume_ids_with_snapshots = api.base.gather(
+            self._get_volumes, self._get_instances,
+            self._get_volumes_ids_with_snapshots)
         self._set_volume_attributes(
             volumes, instances, volume_ids_with_snapshots)
         return volumes
@@ -104,8 +106,10 @@ class SnapshotTab(tabs.TableTab):
     def get_volume_snapshots_data(self):
         if api.base.is_service_enabled(self.request, 'volume'):
             try:
-                snapshots = api.cinder.volume_snapshot_list(self.request)
-                volumes = api.cinder.volume_list(self.request)
+                snapshots, volumes = api.base.gather(
+                    functools.partial(api.cinder.volume_snapshot_list,
+                                      self.request),
+                    functools.partial(api.cinder.volume_list, self.request))
                 volumes = dict((v.id, v) for v in volumes)
             except Exception:
                 snapshots = []
@@ -134,8 +138,10 @@ class BackupsTab(tabs.TableTab, VolumeTableMixIn):
 
     def get_volume_backups_data(self):
         try:
-            backups = api.cinder.volume_backup_list(self.request)
-            volumes = api.cinder.volume_list(self.request)
+            backups, volumes = api.base.gather(
+                functools.partial(api.cinder.volume_backup_list,
+                                  self.request),
+                functools.partial(api.cinder.volume_list, self.request))
             volumes = dict((v.id, v) for v in volumes)
             for backup in backups:
                 backup.volume = volumes.get(backup.volume_id)
@@ -110,6 +110,7 @@ else:
     MIDDLEWARE_CLASSES += ('django.middleware.doc.XViewMiddleware',)
 MIDDLEWARE_CLASSES += (
     'horizon.middleware.HorizonMiddleware',
+    'openstack_dashboard.api.tracing.ApiTraceMiddleware',
     'django.middleware.locale.LocaleMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 )
@@ -18,7 +18,11 @@
 
 from __future__ import absolute_import
 
+import threading
+import time
+
 from django.conf import settings
+from django.test.utils import override_settings
 
 from horizon import exceptions
 
@@ -26,6 +30,7 @@ from openstack_dashboard.api import base as api_base
 from openstack_dashboard.api import cinder
 from openstack_dashboard.api import glance
 from openstack_dashboard.api import keystone
+from openstack_dashboard.api import nova
 from openstack_dashboard.test import helpers as test
 
 
@@ -84,6 +89,37 @@ class APIResourceWrapperTests(test.TestCase):
         self.assertIn('bar', resource_str)
         self.assertNotIn('baz', resource_str)
 
+    def test_compact(self):
+        resource = APIResource.get_instance()
+        resource._apiresource.undeclared = 'undeclared'
+        compacted = resource.compact()
+
+        self.assertIsInstance(compacted, APIResource)
+        self.assertIsInstance(compacted._apiresource,
+                              api_base.ResourceRecord)
+        self.assertEqual('foo', compacted.foo)
+        self.assertEqual('bar', compacted.bar)
+        with self.assertRaises(AttributeError):
+            compacted.baz
+        with self.assertRaises(AttributeError):
+            compacted.undeclared
+        self.assertEqual({'foo': 'foo', 'bar': 'bar', 'baz': None},
+                         compacted.to_dict())
+        # The original wrapper is left alone
+        self.assertEqual('undeclared', resource._apiresource.undeclared)
+
+    def test_compact_server(self):
+        server = nova.Server(self.servers.first(), self.request)
+        compacted = server.compact()
+
+        self.assertFalse(hasattr(compacted._apiresource, 'manager'))
+        self.assertIs(server.request, compacted.request)
+        for attr in server._attrs:
+            if attr != 'image_name':
+                self.assertEqual(getattr(server, attr, None),
+                                 getattr(compacted, attr, None))
+        self.assertEqual(server.internal_name, compacted.internal_name)
+
 
 class APIDictWrapperTests(test.TestCase):
     # APIDict allows for both attribute access and dictionary style [element]
@@ -240,6 +276,100 @@ class ApiHelperTests(test.TestCase):
         with self.assertRaises(exceptions.ServiceCatalogException):
             url = api_base.url_for(self.request, 'image')
 
+    def test_is_service_enabled(self):
+        self.assertTrue(api_base.is_service_enabled(self.request, 'compute'))
+        self.assertTrue(api_base.is_service_enabled(self.request, 'compute',
+                                                    'nova'))
+        self.assertFalse(api_base.is_service_enabled(self.request, 'compute',
+                                                     'other'))
+        self.assertFalse(api_base.is_service_enabled(self.request,
+                                                     'notAnApi'))
+
+        self.request.user.services_region = "RegionTwo"
+        self.assertTrue(api_base.is_service_enabled(self.request, 'compute'))
+        self.assertFalse(api_base.is_service_enabled(self.request, 'image'))
+        # The region is ignored for identity
+        self.request.user.services_region = "bogus_value"
+        self.assertTrue(api_base.is_service_enabled(self.request,
+                                                    'identity'))
+
+    def test_catalog_index_per_token(self):
+        index = api_base.get_catalog_index(self.request)
+        self.assertIs(index, api_base.get_catalog_index(self.request))
+
+        self.request.user.token.id = 'another-token'
+        self.assertIsNot(index, api_base.get_catalog_index(self.request))
+
+    def test_catalog_index_v3(self):
+        catalog = [{'type': 'identity', 'name': 'keystone', 'endpoints': [
+            {'region': 'RegionOne', 'interface': 'admin',
+             'url': 'http://admin.keystone.example.com:35357/v3'},
+            {'region': 'RegionOne', 'interface': 'public',
+             'url': 'http://public.keystone.example.com:5000/v3'}]},
+            {'type': 'compute', 'name': 'nova', 'endpoints': [
+                {'region': 'RegionOne', 'interface': 'public'},
+                {'region': 'RegionOne', 'interface': 'public',
+                 'url': 'http://public.nova.example.com:8774/v2'},
+                {'region': 'RegionTwo', 'interface': 'internal',
+                 'url': 'http://int.nova2.example.com:8774/v2'}]}]
+        index = api_base.ServiceCatalogIndex(catalog)
+
+        self.assertEqual('http://public.nova.example.com:8774/v2',
+                         index.url_for('compute', 'RegionOne', 'publicURL'))
+        self.assertEqual('http://int.nova2.example.com:8774/v2',
+                         index.url_for('compute', 'RegionTwo',
+                                       'internalURL'))
+        self.assertIsNone(index.url_for('compute', 'RegionTwo', 'publicURL'))
+        self.assertEqual('http://admin.keystone.example.com:35357/v3',
+                         index.url_for('identity', 'RegionTwo', 'adminURL'))
+        self.assertTrue(index.is_enabled('compute', 'RegionTwo', 'nova'))
+        self.assertFalse(index.is_enabled('compute', 'RegionThree'))
+        for service in catalog:
+            for region in ('RegionOne', 'RegionTwo'):
+                for endpoint_type in ('publicURL', 'internalURL',
+                                      'adminURL'):
+                    self.assertEqual(
+                        api_base.get_url_for_service(service, region,
+                                                     endpoint_type),
+                        index.url_for(service['type'], region,
+                                      endpoint_type))
+
+    @override_settings(CONCURRENT_DATA_LOADS=4)
+    def test_gather(self):
+        threads = []
+
+        def call(result, delay=0.05):
+            def api_call():
+                threads.append(threading.current_thread())
+                time.sleep(delay)
+                return result
+            return api_call
+
+        # The slowest call comes first, the results keep the order
+        self.assertEqual(['servers', 'volumes', 'images'], api_base.gather(
+            call('servers', 0.1), call('volumes'), call('images')))
+        self.assertEqual(3, len(set(threads)))
+        self.assertNotIn(threading.current_thread(), threads)
+
+    @override_settings(CONCURRENT_DATA_LOADS=4)
+    def test_gather_error(self):
+        def fail(message):
+            def api_call():
+                raise exceptions.NotAvailable(message)
+            return api_call
+
+        with self.assertRaisesRegexp(exceptions.NotAvailable, 'first'):
+            api_base.gather(lambda: 'servers', fail('first'), fail('second'))
+
+    def test_gather_sequential(self):
+        threads = []
+
+        def api_call():
+            threads.append(threading.current_thread())
+
+        api_base.gather(api_call, api_call)
+        self.assertEqual([threading.current_thread()] * 2, threads)
+
 
 class QuotaSetTests(test.TestCase):
 
@@ -127,6 +127,16 @@ class NetworkApiNovaFloatingIpTests(NetworkApiNovaTestBase):
             exp_instance_type = 'compute' if e.instance_id else None
             self.assertEqual(exp_instance_type, r.instance_type)
 
+    def test_floating_ip_count(self):
+        fips = self.api_floating_ips.list()
+        novaclient = self.stub_novaclient()
+        novaclient.floating_ips = self.mox.CreateMockAnything()
+        novaclient.floating_ips.list().AndReturn(fips)
+        self.mox.ReplayAll()
+
+        self.assertEqual(len(fips),
+                         api.network.tenant_floating_ip_count(self.request))
+
     def test_floating_ip_get(self):
         fip = self.api_floating_ips.first()
         novaclient = self.stub_novaclient()
@@ -284,7 +294,9 @@ class NetworkApiNeutronTests(NetworkApiNeutronTestBase):
             self.qclient.list_floatingips(tenant_id=tenant_id,
                                           port_id=server_port_ids) \
                 .AndReturn({'floatingips': assoc_fips})
-            self.qclient.list_ports(tenant_id=tenant_id) \
+            self.qclient.list_ports(
+                tenant_id=tenant_id,
+                fields=['id', 'device_id', 'device_owner']) \
                 .AndReturn({'ports': self.api_ports.list()})
         self.qclient.list_networks(id=set(server_network_ids)) \
             .AndReturn({'networks': server_networks})
@@ -385,6 +397,16 @@ class NetworkApiNeutronSecurityGroupTests(NetworkApiNeutronTestBase):
         for (exp, ret) in itertools.izip(sgs, rets):
             self._cmp_sg(exp, ret)
 
+    def test_security_group_count(self):
+        sgs = self.api_q_secgroups.list()
+        tenant_id = self.request.user.tenant_id
+        self.qclient.list_security_groups(tenant_id=tenant_id, fields=['id']) \
+            .AndReturn({'security_groups': [{'id': sg['id']} for sg in sgs]})
+        self.mox.ReplayAll()
+
+        self.assertEqual(len(sgs), api.network.security_group_count(
+            self.request))
+
     def test_security_group_get(self):
         secgroup = self.api_q_secgroups.first()
         sg_ids = set([secgroup['id']] +
@@ -545,12 +567,23 @@ class NetworkApiNeutronFloatingIpTests(NetworkApiNeutronTestBase):
             self.assertEqual([p[attr] for p in ext_nets],
                              [getattr(p, attr) for p in rets])
 
+    def test_floating_ip_count(self):
+        fips = self.api_q_floating_ips.list()
+        self.qclient.list_floatingips(tenant_id=self.request.user.tenant_id,
+                                      fields=['id']) \
+            .AndReturn({'floatingips': [{'id': fip['id']} for fip in fips]})
+        self.mox.ReplayAll()
+
+        self.assertEqual(len(fips),
+                         api.network.tenant_floating_ip_count(self.request))
+
     def test_floating_ip_list(self):
         fips = self.api_q_floating_ips.list()
         filters = {'tenant_id': self.request.user.tenant_id}
         self.qclient.list_floatingips(**filters) \
             .AndReturn({'floatingips': fips})
-        self.qclient.list_ports(**filters) \
+        self.qclient.list_ports(fields=['id', 'device_id', 'device_owner'],
+                                **filters) \
             .AndReturn({'ports': self.api_ports.list()})
         self.mox.ReplayAll()
 
@@ -571,7 +604,8 @@ class NetworkApiNeutronFloatingIpTests(NetworkApiNeutronTestBase):
     def test_floating_ip_list_all_tenants(self):
         fips = self.api_q_floating_ips.list()
         self.qclient.list_floatingips().AndReturn({'floatingips': fips})
-        self.qclient.list_ports().AndReturn({'ports': self.api_ports.list()})
+        self.qclient.list_ports(fields=['id', 'device_id', 'device_owner']) \
+            .AndReturn({'ports': self.api_ports.list()})
         self.mox.ReplayAll()
 
         # all_tenants option for floating IP list is api.neutron specific,
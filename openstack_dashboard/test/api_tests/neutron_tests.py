@@ -37,6 +37,20 @@ class NeutronApiTests(test.APITestCase):
         for n in ret_val:
             self.assertIsInstance(n, api.neutron.Network)
 
+    def test_network_list_fields(self):
+        networks = {'networks': [{'id': n['id'], 'name': n['name']}
+                                 for n in self.api_networks.list()]}
+
+        neutronclient = self.stub_neutronclient()
+        neutronclient.list_networks(fields=['id', 'name']).AndReturn(networks)
+        self.mox.ReplayAll()
+
+        ret_val = api.neutron.network_list(self.request,
+                                           fields=['id', 'name'])
+        for n in ret_val:
+            self.assertIsInstance(n, api.neutron.Network)
+            self.assertNotIn('subnets', n.to_dict())
+
     def test_network_get(self):
         network = {'network': self.api_networks.first()}
         subnet = {'subnet': self.api_subnets.first()}
@@ -136,6 +136,24 @@ class ComputeApiTests(test.APITestCase):
         for server in ret_val:
             self.assertIsInstance(server, api.nova.Server)
 
+    def test_server_list_compact(self):
+        servers = self.servers.list()
+
+        novaclient = self.stub_novaclient()
+        novaclient.servers = self.mox.CreateMockAnything()
+        novaclient.servers.list(True, {'all_tenants': True}).AndReturn(servers)
+        self.mox.ReplayAll()
+
+        ret_val, has_more = api.nova.server_list(self.request,
+                                                 all_tenants=True,
+                                                 compact=True)
+        self.assertEqual([server.id for server in servers],
+                         [server.id for server in ret_val])
+        for server in ret_val:
+            self.assertIsInstance(server, api.nova.Server)
+            self.assertIsInstance(server._apiresource,
+                                  api.base.ResourceRecord)
+
     def test_server_list_pagination(self):
         page_size = getattr(settings, 'API_RESULT_PAGE_SIZE', 20)
         servers = self.servers.list()
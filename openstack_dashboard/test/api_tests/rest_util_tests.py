@@ -11,10 +11,47 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
+import os
+import time
+import unittest
+
+from django.test.utils import override_settings
+
+from openstack_dashboard.api import base as api_base
 from openstack_dashboard.api.rest import utils
 from openstack_dashboard.test import helpers as test
 
 
+class Resource(object):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class Wrapped(api_base.APIResourceWrapper):
+    _attrs = ['id', 'name']
+
+
+class Summary(api_base.APIResourceWrapper):
+    _attrs = ['id', 'name']
+
+    def to_dict(self):
+        return {'summary': '%s (%s)' % (self.name, self.id)}
+
+
+class LazyResource(Resource):
+    def __getattr__(self, attr):
+        raise Exception('lazy load of %s failed' % attr)
+
+
+dumps_calls = []
+
+
+def counting_dumps(data, **kwargs):
+    dumps_calls.append(data)
+    return json.dumps(data, **kwargs)
+
+
 class RestUtilsTestCase(test.TestCase):
     def test_api_success(self):
         @utils.ajax()
@@ -127,6 +164,163 @@ class RestUtilsTestCase(test.TestCase):
         self.assertEqual(response['location'], '/api/spam/spam123')
         self.assertEqual(response.content, '"spam!"')
 
+    def test_api_get_etag(self):
+        @utils.ajax()
+        def f(self, request):
+            return {'items': ['spam']}
+        request = self.mock_rest_request(method='GET', META={})
+        response = f(None, request)
+        self.assertStatusCode(response, 200)
+        self.assertTrue(response.has_header('ETag'))
+
+        request = self.mock_rest_request(method='GET', META={
+            'HTTP_IF_NONE_MATCH': response['ETag']})
+        response = f(None, request)
+        self.assertStatusCode(response, 304)
+        self.assertEqual(response.content, '')
+
+    def test_api_get_etag_changed(self):
+        @utils.ajax()
+        def f(self, request):
+            return {'items': ['spam']}
+        request = self.mock_rest_request(method='GET', META={
+            'HTTP_IF_NONE_MATCH': '"stale"'})
+        response = f(None, request)
+        self.assertStatusCode(response, 200)
+        self.assertEqual(response.content, '{"items": ["spam"]}')
+
+    @override_settings(REST_API_RESPONSE_CACHE_TIMEOUT=30)
+    def test_api_response_cache(self):
+        calls = []
+
+        @utils.ajax(cached=True)
+        def f(self, request):
+            calls.append(request)
+            return {'items': ['spam']}
+
+        def make_request(token_id, **meta):
+            request = self.mock_rest_request(**{
+                'method': 'GET',
+                'META': meta,
+                'user.token.id': token_id,
+                'user.services_region': 'RegionOne',
+                'get_full_path.return_value': '/api/spam/?eggs=1',
+            })
+            return request
+
+        first = f(None, make_request('token1'))
+        self.assertStatusCode(first, 200)
+        second = f(None, make_request('token1'))
+        self.assertStatusCode(second, 200)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['ETag'], first['ETag'])
+        self.assertEqual(len(calls), 1)
+
+        response = f(None, make_request('token1',
+                                        HTTP_IF_NONE_MATCH=first['ETag']))
+        self.assertStatusCode(response, 304)
+        self.assertEqual(len(calls), 1)
+
+        # another user's token never shares the cached entry
+        f(None, make_request('token2'))
+        self.assertEqual(len(calls), 2)
+
+    def test_api_response_cache_disabled(self):
+        calls = []
+
+        @utils.ajax(cached=True)
+        def f(self, request):
+            calls.append(request)
+            return {'items': ['spam']}
+
+        for i in range(2):
+            request = self.mock_rest_request(method='GET', META={})
+            self.assertStatusCode(f(None, request), 200)
+        self.assertEqual(len(calls), 2)
+
+    def test_api_wrapped_items(self):
+        @utils.ajax()
+        def f(self, request):
+            return {'items': [
+                Wrapped(Resource(id='1', name='spam')),
+                api_base.APIDictWrapper({'id': '2'}),
+            ]}
+        request = self.mock_rest_request()
+        response = f(None, request)
+        self.assertStatusCode(response, 200)
+        self.assertEqual(json.loads(response.content), {'items': [
+            {'id': '1', 'name': 'spam'},
+            {'id': '2'},
+        ]})
+
+    @override_settings(REST_API_JSON_SERIALIZER='openstack_dashboard.test.'
+                       'api_tests.rest_util_tests.counting_dumps')
+    def test_api_custom_serializer(self):
+        del dumps_calls[:]
+        response = utils.JSONResponse({'items': ['spam']})
+        self.assertEqual(dumps_calls, [{'items': ['spam']}])
+        self.assertEqual(response.content, '{"items": ["spam"]}')
+
+    def test_streaming_response(self):
+        items = [api_base.APIDictWrapper({'id': str(i)})
+                 for i in range(10000)]
+        response = utils.StreamingJSONResponse({'items': items})
+        self.assertStatusCode(response, 200)
+        self.assertEqual(response['content-type'], 'application/json')
+        chunks = list(response.streaming_content)
+        self.assertTrue(len(chunks) > 1)
+        self.assertEqual(json.loads(''.join(chunks)),
+                         {'items': [{'id': str(i)} for i in range(10000)]})
+
+    def test_default_serializer(self):
+        try:
+            import simplejson as expected
+        except ImportError:
+            expected = json
+        self.assertIs(expected, utils.json_encoder)
+        self.assertIs(utils._default_dumps, utils._serializer())
+
+    def test_serialize_wrappers(self):
+        data = {'items': [Wrapped(Resource(id='1')),
+                          Summary(Resource(id='2', name='eggs')),
+                          api_base.APIDictWrapper({'id': '3', 'ports': [
+                              Wrapped(Resource(id='4', name='ham'))]})],
+                1: (None, 'spam')}
+        self.assertEqual(json.loads(utils.dumps(data)), {
+            'items': [{'id': '1', 'name': None},
+                      {'summary': 'eggs (2)'},
+                      {'id': '3', 'ports': [{'id': '4', 'name': 'ham'}]}],
+            '1': [None, 'spam']})
+
+    @override_settings(DEBUG=True)
+    def test_serialize_wrappers_sorted(self):
+        wrapped = Wrapped(Resource(id='1', name='spam'))
+        self.assertEqual(utils.dumps({'b': [wrapped], 'a': 1}),
+                         '{"a": 1, "b": [{"id": "1", "name": "spam"}]}')
+
+    def test_api_large_listing_not_streamed(self):
+        @utils.ajax()
+        def f(self, request):
+            return {'items': [Wrapped(LazyResource(id=str(i)))
+                              for i in range(utils.STREAMING_LISTING_SIZE
+                                             + 1)]}
+        request = self.mock_rest_request()
+        response = f(None, request)
+        # The error is reported, not sent as a truncated listing
+        self.assertStatusCode(response, 500)
+        self.assertFalse(response.streaming)
+
+    def test_api_large_listing_streamed(self):
+        @utils.ajax(streamed=True)
+        def f(self, request):
+            return {'items': range(utils.STREAMING_LISTING_SIZE + 1)}
+        request = self.mock_rest_request()
+        response = f(None, request)
+        self.assertTrue(response.streaming)
+        self.assertNotIn('ETag', response)
+        self.assertEqual(json.loads(''.join(response.streaming_content)),
+                         {'items': range(utils.STREAMING_LISTING_SIZE + 1)})
+
     def test_parse_filters_keywords(self):
         kwargs = {
             'sort_dir': '1',
@@ -166,3 +360,42 @@ class RestUtilsTestCase(test.TestCase):
             request)
         self.assertDictEqual({}, output_kwargs)
         self.assertDictEqual({}, output_filters)
+
+
+@unittest.skipUnless(os.environ.get('WITH_BENCHMARKS', False),
+                     "The WITH_BENCHMARKS env variable is not set.")
+class RestUtilsBenchmarks(test.TestCase):
+    """Serialization timings for 10k item listings.
+
+    Run with WITH_BENCHMARKS=1; timings are printed, not asserted.
+    """
+    count = 10000
+
+    def _report(self, name, func, rounds=5):
+        timings = []
+        for i in range(rounds):
+            start = time.time()
+            func()
+            timings.append(time.time() - start)
+        print("\n%s: best of %d %.4fs" % (name, rounds, min(timings)))
+
+    def test_serialize_resource_wrappers(self):
+        items = [Wrapped(Resource(id=str(i), name='server-%d' % i))
+                 for i in range(self.count)]
+        self._report('to_dict() copies',
+                     lambda: utils.JSONResponse(
+                         {'items': [i.to_dict() for i in items]}))
+        self._report('wrappers', lambda: utils.JSONResponse({'items': items}))
+        self._report('streamed',
+                     lambda: ''.join(utils.StreamingJSONResponse(
+                         {'items': items}).streaming_content))
+
+    def test_serialize_dict_wrappers(self):
+        items = [api_base.APIDictWrapper({'id': str(i),
+                                          'name': 'port-%d' % i,
+                                          'fixed_ips': [{'ip': '10.0.0.1'}]})
+                 for i in range(self.count)]
+        self._report('dict() copies',
+                     lambda: utils.JSONResponse(
+                         {'items': [dict(i.to_dict()) for i in items]}))
+        self._report('wrappers', lambda: utils.JSONResponse({'items': items}))
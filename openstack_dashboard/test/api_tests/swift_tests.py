@@ -18,7 +18,13 @@
 
 from __future__ import absolute_import
 
+import json
+
+from django.test.utils import override_settings
+import mock
 from mox import IsA  # noqa
+import six.moves.urllib.parse as urlparse
+from swiftclient import client as swift_client
 
 from horizon import exceptions
 
@@ -32,8 +38,7 @@ class SwiftApiTests(test.APITestCase):
         cont_data = [c._apidict for c in containers]
         swift_api = self.stub_swiftclient()
         swift_api.get_account(limit=1001,
-                              marker=None,
-                              full_listing=True).AndReturn([{}, cont_data])
+                              marker=None).AndReturn([{}, cont_data])
         self.mox.ReplayAll()
 
         (conts, more) = api.swift.swift_get_containers(self.request)
@@ -114,8 +119,7 @@ class SwiftApiTests(test.APITestCase):
                                 limit=1001,
                                 marker=None,
                                 prefix=None,
-                                delimiter='/',
-                                full_listing=True).AndReturn([{}, objects])
+                                delimiter='/').AndReturn([{}, objects])
         self.mox.ReplayAll()
 
         (objs, more) = api.swift.swift_get_objects(self.request,
@@ -123,6 +127,143 @@ class SwiftApiTests(test.APITestCase):
         self.assertEqual(len(objects), len(objs))
         self.assertFalse(more)
 
+    @override_settings(API_RESULT_LIMIT=2)
+    def test_swift_filter_objects_pages(self):
+        container = self.containers.first()
+        objects = [{'name': name} for name in
+                   ('apple', 'banana', 'cherry', 'grape', 'pear', 'plum')]
+
+        swift_api = self.stub_swiftclient()
+        swift_api.get_container(container.name,
+                                limit=3,
+                                marker=None,
+                                prefix=None,
+                                delimiter='/').AndReturn([{}, objects[:3]])
+        swift_api.get_container(container.name,
+                                limit=3,
+                                marker='banana',
+                                prefix=None,
+                                delimiter='/').AndReturn([{}, objects[2:5]])
+        self.mox.ReplayAll()
+
+        # stops after the second page, once it has a page of matches
+        objs, truncated = api.swift.swift_filter_objects(self.request, '*p*',
+                                                         container.name)
+        self.assertEqual(['apple', 'grape'], [o.name for o in objs])
+        self.assertTrue(truncated)
+
+    @override_settings(API_RESULT_LIMIT=2)
+    def test_swift_filter_objects_max_pages(self):
+        container = self.containers.first()
+        objects = [{'name': name} for name in ('apple', 'banana', 'cherry')]
+
+        swift_api = self.stub_swiftclient()
+        swift_api.get_container(container.name,
+                                limit=3,
+                                marker=None,
+                                prefix=None,
+                                delimiter='/').AndReturn([{}, objects])
+        self.mox.ReplayAll()
+
+        with mock.patch.object(api.swift, 'FILTER_MAX_PAGES', 1):
+            objs, truncated = api.swift.swift_filter_objects(
+                self.request, '*x*', container.name)
+        self.assertEqual([], objs)
+        self.assertTrue(truncated)
+
+    def test_swift_delete_container_not_empty(self):
+        container = self.containers.first()
+
+        swift_api = self.stub_swiftclient()
+        swift_api.head_container(container.name) \
+            .AndReturn({'x-container-object-count': '3'})
+        self.mox.ReplayAll()
+
+        self.assertRaises(exceptions.Conflict,
+                          api.swift.swift_delete_container,
+                          self.request, container.name)
+
+    @mock.patch.object(swift_client, 'http_connection')
+    def test_swift_delete_objects_bulk(self, http_connection):
+        container = self.containers.first()
+        names = [u'one', u'tw\u00f6', u'thr\u00e9e']
+
+        swift_api = self.stub_swiftclient()
+        swift_api.get_capabilities() \
+            .AndReturn({'bulk_delete': {'max_deletes_per_request': 2}})
+        self.mox.ReplayAll()
+
+        error_path = urlparse.quote(
+            (u'/%s/tw\u00f6' % container.name).encode('utf8'))
+        http_conn = mock.Mock()
+        http_conn.getresponse.side_effect = [
+            mock.Mock(status=200, reason='OK', **{
+                'read.return_value': json.dumps({
+                    'Response Status': '400 Bad Request',
+                    'Number Deleted': 1,
+                    'Errors': [[error_path, '409 Conflict']]})}),
+            mock.Mock(status=200, reason='OK', **{
+                'read.return_value': json.dumps({
+                    'Response Status': '200 OK',
+                    'Number Deleted': 1,
+                    'Errors': []})}),
+        ]
+        http_connection.return_value = (
+            urlparse.urlparse('http://swift/v1/AUTH_x'), http_conn)
+
+        results = api.swift.swift_delete_objects(self.request,
+                                                 container.name, names)
+        self.assertEqual(set(names), set(results))
+        self.assertIsNone(results[u'one'])
+        self.assertIsInstance(results[u'tw\u00f6'],
+                              swift_client.ClientException)
+        self.assertIsNone(results[u'thr\u00e9e'])
+        self.assertEqual(2, http_conn.request.call_count)
+        # One connection for all of the batches, closed once done
+        http_connection.assert_called_once_with(
+            mock.ANY, cacert=mock.ANY, insecure=mock.ANY)
+        http_conn.close.assert_called_once_with()
+        method, path, body, headers = http_conn.request.call_args[0]
+        self.assertEqual('POST', method)
+        self.assertEqual('/v1/AUTH_x?bulk-delete', path)
+        self.assertEqual(urlparse.quote(
+            (u'/%s/thr\u00e9e' % container.name).encode('utf8')), body)
+        self.assertEqual(self.request.user.token.id, headers['X-Auth-Token'])
+
+    @mock.patch.object(api.swift, 'swift_get_capabilities',
+                       return_value={})
+    @mock.patch.object(api.swift, '_swift_connection')
+    def test_swift_delete_objects_concurrent(self, connection, capabilities):
+        names = ['object-%d' % i for i in range(25)]
+
+        def delete_object(container_name, name):
+            if name in ('object-3', 'object-7'):
+                exc = swift_client.ClientException('failed')
+                exc.http_status = 404 if name == 'object-3' else 503
+                raise exc
+        connection.return_value.delete_object.side_effect = delete_object
+
+        results = api.swift.swift_delete_objects(self.request,
+                                                 'container', names)
+        self.assertEqual(set(names), set(results))
+        self.assertEqual(503, results.pop('object-7').http_status)
+        self.assertEqual([None] * 24, list(results.values()))
+        self.assertEqual(api.swift.BULK_WORKERS, connection.call_count)
+        self.assertEqual(
+            25, connection.return_value.delete_object.call_count)
+
+    def test_swift_delete_container(self):
+        container = self.containers.first()
+
+        swift_api = self.stub_swiftclient()
+        swift_api.head_container(container.name) \
+            .AndReturn({'x-container-object-count': '0'})
+        swift_api.delete_container(container.name)
+        self.mox.ReplayAll()
+
+        self.assertTrue(api.swift.swift_delete_container(self.request,
+                                                         container.name))
+
     def test_swift_get_object_with_data(self):
         container = self.containers.first()
         object = self.objects.first()
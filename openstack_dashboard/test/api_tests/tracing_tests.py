@@ -0,0 +1,185 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from __future__ import absolute_import
+
+import json
+
+from django import http
+from django.test.utils import override_settings
+import mock
+
+from openstack_dashboard.api import tracing
+from openstack_dashboard.test import helpers as test
+
+
+class FakeServerManager(object):
+    def list(self):
+        return ['server1', 'server2']
+
+    def get(self, server_id):
+        raise ValueError(server_id)
+
+
+class FakeImageManager(object):
+    def list(self, fail=False):
+        yield 'image1'
+        yield 'image2'
+        if fail:
+            raise ValueError()
+
+
+class FakeClient(object):
+    def __init__(self):
+        self.servers = FakeServerManager()
+        self.images = FakeImageManager()
+        self.version = '2'
+
+    def list_ports(self):
+        return {'ports': [{'id': 1}, {'id': 2}, {'id': 3}]}
+
+
+@tracing.traced('compute')
+def fake_client(request):
+    return FakeClient()
+
+
+class TraceTests(test.TestCase):
+    def test_summary(self):
+        trace = tracing.Trace()
+        trace.add_call('compute', 'servers.get', 0.25, items=None)
+        trace.add_call('compute', 'servers.get', 0.25, items=None)
+        trace.add_call('image', 'images.list', 0.5, items=3)
+        trace.add_cache_lookup(True)
+        trace.add_cache_lookup(False)
+        trace.add_cache_lookup(False)
+
+        self.assertEqual({'compute': {'calls': 2, 'time': 0.5},
+                          'image': {'calls': 1, 'time': 0.5}},
+                         trace.services())
+        self.assertEqual({'compute:servers.get': 2}, trace.repeated_calls())
+        self.assertEqual('calls=3; time=1.000; cache_hits=1; cache_misses=2',
+                         trace.header_value())
+
+    def test_calls_are_capped(self):
+        trace = tracing.Trace()
+        for i in range(tracing.MAX_CALLS + 10):
+            trace.add_call('compute', 'servers.list', 0.001)
+        trace.add_call('compute', 'servers.get', 0.001)
+        trace.add_call('compute', 'servers.get', 0.001)
+        self.assertEqual(tracing.MAX_CALLS + 12, trace.call_count)
+        self.assertEqual(tracing.MAX_CALLS, len(trace.calls))
+        # The summaries also cover the calls which were dropped
+        self.assertEqual(tracing.MAX_CALLS + 12,
+                         trace.services()['compute']['calls'])
+        self.assertEqual({'compute:servers.list': tracing.MAX_CALLS + 10,
+                          'compute:servers.get': 2},
+                         trace.repeated_calls())
+
+    def test_record_cache_untraced(self):
+        # Nothing to record into, this must not fail
+        tracing.record_cache(self.request, True)
+        self.request._api_trace = tracing.Trace()
+        tracing.record_cache(self.request, True)
+        self.assertEqual(1, self.request._api_trace.cache_hits)
+
+
+class TracedClientTests(test.TestCase):
+    def test_untraced_request(self):
+        client = fake_client(self.request)
+        self.assertIsInstance(client, FakeClient)
+
+    def test_traced_calls(self):
+        trace = tracing.Trace()
+        self.request._api_trace = trace
+        client = fake_client(self.request)
+
+        self.assertEqual(['server1', 'server2'], client.servers.list())
+        self.assertEqual(3, len(client.list_ports()['ports']))
+        self.assertRaises(ValueError, client.servers.get, 'abc')
+        self.assertEqual('2', client.version)
+
+        self.assertEqual(
+            [('compute', 'servers.list', 2, None),
+             ('compute', 'list_ports', 3, None),
+             ('compute', 'servers.get', None, 'ValueError')],
+            [(call.service, call.name, call.items, call.error)
+             for call in trace.calls])
+        self.assertEqual(3, trace.call_count)
+
+    def test_traced_generator(self):
+        trace = tracing.Trace()
+        self.request._api_trace = trace
+        client = fake_client(self.request)
+
+        images = client.images.list()
+        # Nothing is recorded before the listing is consumed
+        self.assertEqual(0, trace.call_count)
+        self.assertEqual(['image1', 'image2'], list(images))
+        self.assertRaises(ValueError, list, client.images.list(fail=True))
+
+        self.assertEqual(
+            [('compute', 'images.list', 2, None),
+             ('compute', 'images.list', 2, 'ValueError')],
+            [(call.service, call.name, call.items, call.error)
+             for call in trace.calls])
+
+
+class ApiTraceMiddlewareTests(test.TestCase):
+    def _process(self, response):
+        middleware = tracing.ApiTraceMiddleware()
+        middleware.process_request(self.request)
+        trace = tracing.get_trace(self.request)
+        if trace is not None:
+            trace.add_call('compute', 'servers.list', 0.5, items=2)
+            trace.add_call('compute', 'flavors.get', 0.1)
+            trace.add_call('compute', 'flavors.get', 0.1)
+        return middleware.process_response(self.request, response)
+
+    def test_disabled(self):
+        response = self._process(http.HttpResponse('<body></body>'))
+        self.assertIsNone(tracing.get_trace(self.request))
+        self.assertFalse(response.has_header(tracing.HEADER))
+
+    @override_settings(API_TRACE={'enabled': True, 'sample_rate': 0.0})
+    def test_not_sampled(self):
+        response = self._process(http.HttpResponse('<body></body>'))
+        self.assertFalse(response.has_header(tracing.HEADER))
+
+    @override_settings(API_TRACE={'enabled': True})
+    @mock.patch.object(tracing, 'LOG')
+    def test_header_and_log(self, mock_log):
+        response = self._process(http.HttpResponse('<body></body>'))
+        self.assertTrue(response[tracing.HEADER].startswith(
+            'calls=3; time=0.700;'))
+        self.assertEqual(b'<body></body>', response.content)
+
+        self.assertEqual(1, mock_log.info.call_count)
+        data = json.loads(mock_log.info.call_args[0][1])
+        self.assertEqual(3, data['calls'])
+        self.assertEqual({'compute:flavors.get': 2}, data['repeated'])
+        self.assertEqual(self.request.path, data['path'])
+
+    @override_settings(API_TRACE={'enabled': True, 'log': False,
+                                  'panel': True})
+    def test_panel(self):
+        response = self._process(http.HttpResponse('<body>page</body>'))
+        self.assertContains(response, 'id="api_trace_panel"')
+        self.assertContains(response, 'flavors.get', 2)
+        self.assertTrue(response.content.endswith(b'</body>'))
+
+    @override_settings(API_TRACE={'enabled': True, 'log': False,
+                                  'panel': True})
+    def test_panel_not_added_to_json(self):
+        response = self._process(http.HttpResponse(
+            '{}', content_type='application/json'))
+        self.assertEqual(b'{}', response.content)
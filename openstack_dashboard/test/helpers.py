@@ -27,6 +27,7 @@ from ceilometerclient.v2 import client as ceilometer_client
 from cinderclient import client as cinder_client
 from django.conf import settings
 from django.contrib.messages.storage import default_storage  # noqa
+from django.core.cache import cache
 from django.core.handlers import wsgi
 from django.core import urlresolvers
 from django.test.client import RequestFactory  # noqa
@@ -164,6 +165,10 @@ class TestCase(horizon_helpers.TestCase):
         self.patchers = {}
         self.add_panel_mocks()
 
+        # Lookup maps and other cached API data must not leak between tests.
+        cache.clear()
+        api.base.clear_catalog_indexes()
+
         super(TestCase, self).setUp()
 
     def _setup_test_data(self):
@@ -201,5 +201,9 @@ POLICY_FILES = {
     'compute': 'nova_policy.json'
 }
 
+# The mox expectations of the view tests are ordered, so the data is loaded
+# sequentially; the tests of the concurrent loading override this.
+CONCURRENT_DATA_LOADS = 1
+
 # The openstack_auth.user.Token object isn't JSON-serializable ATM
 SESSION_SERIALIZER = 'django.contrib.sessions.serializers.PickleSerializer'
@@ -0,0 +1,361 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Page level benchmarks of the heaviest views, run on scaled-up test data.
+
+The API layer is mocked so only Horizon's own work is measured; the
+upstream calls reported are the calls made to the mocked
+``openstack_dashboard.api`` functions, memoized ones included. Run with
+``WITH_BENCHMARKS=1``; the following environment variables are honoured:
+
+``BENCHMARK_ROUNDS``
+    The number of times each page is rendered (default 3).
+``BENCHMARK_RESULTS``
+    The file the results are written to as JSON
+    (default ``benchmark_results.json``).
+``BENCHMARK_BASELINE``
+    The results file of a previous run. A page whose best time is slower
+    than the baseline by more than ``BENCHMARK_TOLERANCE`` (default 0.25,
+    i.e. 25%) or which makes more upstream calls fails.
+
+``ResourceBenchmarks`` compares the memory held by the api wrappers of a
+large listing with their compact form.
+"""
+
+from __future__ import absolute_import
+
+import collections
+import copy
+import gc
+import json
+import os
+import platform
+import resource
+import sys
+import time
+import types
+
+import django
+from django.core.cache import cache
+from django.core.urlresolvers import reverse
+from django.utils import unittest
+import mock
+
+from openstack_dashboard import api
+from openstack_dashboard.dashboards.project.instances import console
+from openstack_dashboard.test import helpers as test
+from openstack_dashboard.usage import quotas
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+RESULTS = collections.OrderedDict()
+
+
+def _with_id(obj, obj_id):
+    obj = copy.copy(obj)
+    if isinstance(obj, api.base.APIResourceWrapper):
+        obj._apiresource = _with_id(obj._apiresource, obj_id)
+    elif isinstance(obj, api.base.APIDictWrapper):
+        obj._apidict = dict(obj._apidict, id=obj_id)
+    elif isinstance(obj, dict):
+        obj['id'] = obj_id
+    else:
+        if hasattr(obj, '_info'):
+            obj._info = dict(obj._info, id=obj_id)
+        obj.id = obj_id
+    return obj
+
+
+def scaled(items, count):
+    """Returns ``count`` copies of ``items``, cycled, each with its own id."""
+    return [_with_id(items[i % len(items)], 'bench-%05d' % i)
+            for i in range(count)]
+
+
+def _max_rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _retained_kb(root, shared=()):
+    """Returns the memory held by ``root`` and the objects it refers to.
+
+    Classes, modules, functions and the ``shared`` objects (e.g. the
+    request every wrapper refers to) are not counted.
+    """
+    seen = set(id(obj) for obj in shared)
+    skipped = (type, types.ModuleType, types.FunctionType,
+               types.BuiltinFunctionType)
+    size = 0
+    pending = [root]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, skipped):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        pending.extend(gc.get_referents(obj))
+    return size // 1024
+
+
+def _write_results(rounds):
+    if not RESULTS:
+        return
+    path = os.environ.get('BENCHMARK_RESULTS', 'benchmark_results.json')
+    with open(path, 'w') as f:
+        json.dump({'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                   'python': platform.python_version(),
+                   'django': django.get_version(),
+                   'rounds': rounds,
+                   'results': RESULTS}, f, indent=2)
+
+
+@unittest.skipUnless(os.environ.get('WITH_BENCHMARKS', False),
+                     "The WITH_BENCHMARKS env variable is not set.")
+class PageBenchmarks(test.BaseAdminViewTests):
+    rounds = int(os.environ.get('BENCHMARK_ROUNDS', 3))
+
+    @classmethod
+    def tearDownClass(cls):
+        super(PageBenchmarks, cls).tearDownClass()
+        _write_results(cls.rounds)
+
+    def _stub(self, stubs):
+        mocks = {}
+        for module, functions in stubs.items():
+            for name, value in functions.items():
+                patcher = mock.patch.object(module, name, return_value=value)
+                mocks['%s.%s' % (module.__name__.split('.')[-1], name)] = \
+                    patcher.start()
+        return mocks
+
+    def _render(self, url):
+        response = self.client.get(url)
+        self.assertEqual(200, response.status_code)
+        if getattr(response, 'streaming', False):
+            return ''.join(response.streaming_content)
+        return response.content
+
+    def benchmark(self, name, url, stubs):
+        """Renders ``url`` with the API calls in ``stubs`` mocked.
+
+        ``stubs`` maps modules to a dict of the function names to stub and
+        the value they return. Each round starts with an empty cache so that
+        the lookups of a first page load are included.
+        """
+        mocks = self._stub(stubs)
+        timings = []
+        peak_kb = None
+        rss_before = _max_rss_kb()
+        for i in range(self.rounds):
+            cache.clear()
+            for stub in mocks.values():
+                stub.reset_mock()
+            gc.collect()
+            if tracemalloc is not None:
+                tracemalloc.start()
+            start = time.time()
+            self._render(url)
+            timings.append(time.time() - start)
+            if tracemalloc is not None:
+                peak = tracemalloc.get_traced_memory()[1] // 1024
+                tracemalloc.stop()
+                peak_kb = peak if peak_kb is None else max(peak_kb, peak)
+        calls = dict((stub_name, stub.call_count)
+                     for stub_name, stub in mocks.items() if stub.call_count)
+        timings.sort()
+        result = {'url': url,
+                  'best': round(timings[0], 4),
+                  'median': round(timings[len(timings) // 2], 4),
+                  'peak_alloc_kb': peak_kb,
+                  'max_rss_growth_kb': _max_rss_kb() - rss_before,
+                  'upstream_calls': sum(calls.values()),
+                  'calls': calls}
+        RESULTS[name] = result
+        print("\n%s: best %.4fs, median %.4fs, %d upstream calls"
+              % (name, result['best'], result['median'],
+                 result['upstream_calls']))
+        self._compare(name, result)
+        return result
+
+    def _compare(self, name, result):
+        path = os.environ.get('BENCHMARK_BASELINE')
+        if not path:
+            return
+        with open(path) as f:
+            baseline = json.load(f)['results'].get(name)
+        if baseline is None:
+            return
+        tolerance = float(os.environ.get('BENCHMARK_TOLERANCE', 0.25))
+        limit = baseline['best'] * (1 + tolerance)
+        self.assertLessEqual(result['best'], limit,
+                             "%s regressed: %.4fs, baseline %.4fs"
+                             % (name, result['best'], baseline['best']))
+        self.assertLessEqual(result['upstream_calls'],
+                             baseline['upstream_calls'],
+                             "%s makes more upstream calls than the "
+                             "baseline" % name)
+
+    def _instances_index(self, count):
+        servers = scaled(self.servers.list(), count)
+        self.benchmark(
+            'instances_index_%d' % count,
+            reverse('horizon:project:instances:index'),
+            {api.nova: {'server_list': [servers, False],
+                        'flavor_list': self.flavors.list(),
+                        'tenant_absolute_limits': self.limits['absolute'],
+                        'extension_supported': True},
+             api.glance: {'image_list_detailed': (self.images.list(),
+                                                  False, False)},
+             api.network: {'servers_update_addresses': None,
+                           'floating_ip_supported': True,
+                           'floating_ip_simple_associate_supported': True}})
+
+    def test_instances_index_1k(self):
+        self._instances_index(1000)
+
+    def test_instances_index_10k(self):
+        self._instances_index(10000)
+
+    def test_admin_volumes_index(self):
+        self.benchmark(
+            'admin_volumes_index',
+            reverse('horizon:admin:volumes:index'),
+            {api.cinder: {'volume_list': scaled(self.cinder_volumes.list(),
+                                                1000),
+                          'volume_snapshot_list': []},
+             api.nova: {'server_list': [scaled(self.servers.list(), 1000),
+                                        False]},
+             api.keystone: {'tenant_list': [scaled(self.tenants.list(), 100),
+                                            False]}})
+
+    def test_network_topology_json(self):
+        # The console lookups are bound when the console module is loaded
+        vnc_console = api.nova.VNCConsole(
+            self.servers.vnc_console_data['console'])
+        consoles = {'VNC': mock.Mock(return_value=vnc_console)}
+        with mock.patch.dict(console.CONSOLES, consoles, clear=True):
+            self.benchmark(
+                'network_topology_json',
+                reverse('horizon:project:network_topology:json'),
+                {api.nova: {'server_list': [scaled(self.servers.list(), 1000),
+                                            False]},
+                 api.neutron: {
+                     'network_list_for_tenant': scaled(self.networks.list(),
+                                                       100),
+                     'network_list': [],
+                     'router_list': scaled(self.routers.list(), 50),
+                     'port_list': scaled(self.ports.list(), 2000)}})
+
+    def test_launch_instance_workflow(self):
+        image = self.images.first()
+        self.benchmark(
+            'launch_instance_workflow',
+            '%s?source_type=image_id&source_id=%s'
+            % (reverse('horizon:project:instances:launch'), image.id),
+            {api.nova: {'extension_supported': True,
+                        'flavor_list': scaled(self.flavors.list(), 200),
+                        'keypair_list': self.keypairs.list(),
+                        'tenant_absolute_limits': self.limits['absolute'],
+                        'availability_zone_list':
+                            self.availability_zones.list()},
+             api.network: {'security_group_list':
+                           scaled(self.security_groups.list(), 200)},
+             api.cinder: {'volume_list': scaled(self.cinder_volumes.list(),
+                                                500),
+                          'volume_snapshot_list': []},
+             api.neutron: {'network_list': scaled(self.networks.list(),
+                                                  100)},
+             api.glance: {'image_list_detailed':
+                          (scaled(self.images.list(), 1000), False, False)}})
+
+    def test_project_members_workflow(self):
+        project = self.tenants.first()
+        self.benchmark(
+            'project_members_workflow',
+            reverse('horizon:identity:projects:update', args=[project.id]),
+            {api.keystone: {'tenant_get': project,
+                            'domain_get': self.domain,
+                            'get_default_role': self.roles.first(),
+                            'user_list': scaled(self.users.list(), 1000),
+                            'group_list': scaled(self.groups.list(), 100),
+                            'role_list': self.roles.list(),
+                            'roles_for_user': self.roles.list(),
+                            'roles_for_group': self.roles.list(),
+                            'role_assignments_list':
+                                self.role_assignments.list()},
+             quotas: {'get_tenant_quota_data': self.quotas.first(),
+                      'get_disabled_quotas': self.disabled_quotas.first()}})
+
+    def test_metering_report(self):
+        self.benchmark(
+            'metering_report',
+            reverse('horizon:admin:metering:csvreport') + '?date_options=7',
+            {api.keystone: {'tenant_list': [scaled(self.tenants.list(), 50),
+                                            False]},
+             api.ceilometer: {'meter_list': [api.ceilometer.Meter(meter)
+                                             for meter in self.meters.list()],
+                              'statistic_list':
+                                  [api.ceilometer.Statistic(statistic)
+                                   for statistic in self.statistics.list()]}})
+
+
+@unittest.skipUnless(os.environ.get('WITH_BENCHMARKS', False),
+                     "The WITH_BENCHMARKS env variable is not set.")
+class ResourceBenchmarks(test.TestCase):
+    rounds = int(os.environ.get('BENCHMARK_ROUNDS', 3))
+
+    @classmethod
+    def tearDownClass(cls):
+        super(ResourceBenchmarks, cls).tearDownClass()
+        _write_results(cls.rounds)
+
+    def _read_attrs(self, servers):
+        for server in servers:
+            for attr in server._attrs:
+                if attr != 'image_name':
+                    getattr(server, attr, None)
+
+    def benchmark(self, name, wrap):
+        """Measures the wrappers built by ``wrap`` for 10000 servers."""
+        raw = scaled(self.servers.list(), 10000)
+        build, read = [], []
+        for i in range(self.rounds):
+            start = time.time()
+            servers = wrap(raw)
+            build.append(time.time() - start)
+            start = time.time()
+            self._read_attrs(servers)
+            read.append(time.time() - start)
+        servers = wrap(raw)
+        del raw
+        result = {'build': round(min(build), 4),
+                  'read_attrs': round(min(read), 4),
+                  'retained_kb': _retained_kb(servers, [self.request])}
+        RESULTS[name] = result
+        print("\n%s: built in %.4fs, attributes read in %.4fs, %d KB"
+              % (name, result['build'], result['read_attrs'],
+                 result['retained_kb']))
+        return result
+
+    def test_server_wrappers(self):
+        full = self.benchmark(
+            'server_wrappers_10k',
+            lambda raw: [api.nova.Server(s, self.request) for s in raw])
+        compact = self.benchmark(
+            'compact_server_wrappers_10k',
+            lambda raw: [api.nova.Server(s, self.request).compact()
+                         for s in raw])
+        self.assertLess(compact['retained_kb'], full['retained_kb'])
@@ -12,19 +12,98 @@
 
 from __future__ import division
 
+import collections
 import datetime
+import hashlib
 
+from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
+import six
 
 from horizon import exceptions
 from horizon import forms
 from horizon import messages
+from horizon.utils import functions
 
 from openstack_dashboard import api
 from openstack_dashboard.usage import quotas
 
 
+USAGE_CACHE_PREFIX = 'horizon:usage'
+# The usage totals which add up over consecutive periods.
+USAGE_TOTALS = ('total_hours', 'total_local_gb_usage',
+                'total_memory_mb_usage', 'total_vcpus_usage')
+# How long the project id to name index is kept in the cache.
+PROJECT_NAMES_CACHE_TIMEOUT = 300
+
+
+def summarize_usages(usage_list):
+    """Adds up the summaries of ``usage_list`` in a single pass.
+
+    Gives the same result as summing ``get_summary()`` of each usage, without
+    walking the server usages of every project once per summary field.
+    """
+    summary = {'instances': 0, 'memory_mb': 0, 'vcpus': 0, 'vcpu_hours': 0,
+               'local_gb': 0, 'disk_gb_hours': 0, 'memory_mb_hours': 0}
+    if not usage_list:
+        return {}
+    for usage in usage_list:
+        summary['vcpus'] += getattr(usage, 'total_vcpus_usage', 0)
+        summary['vcpu_hours'] += getattr(usage, 'total_hours', 0)
+        summary['disk_gb_hours'] += getattr(usage, 'total_local_gb_usage', 0)
+        summary['memory_mb_hours'] += getattr(usage, 'total_memory_mb_usage',
+                                              0)
+        for server_usage in usage.server_usages:
+            if server_usage['ended_at'] is None:
+                summary['instances'] += 1
+                summary['memory_mb'] += server_usage['memory_mb']
+                summary['local_gb'] += server_usage['local_gb']
+    return summary
+
+
+def _server_key(server_usage):
+    # Older Nova releases do not report the instance id.
+    return (server_usage.get('instance_id') or
+            (server_usage.get('name'), server_usage.get('started_at')))
+
+
+def _merge_usages(usages, later_usages):
+    """Merges the usage dicts of a later period into ``usages``.
+
+    Both are dicts of project ids to usage dicts as returned by
+    ``NovaUsage.to_dict``. The totals and instance hours add up, everything
+    else is taken from the later period.
+    """
+    for tenant_id, later in later_usages.items():
+        usage = usages.get(tenant_id)
+        if usage is None:
+            usages[tenant_id] = later
+            continue
+        for key in USAGE_TOTALS:
+            usage[key] = usage.get(key, 0) + later.get(key, 0)
+        usage['stop'] = later.get('stop')
+        servers = collections.OrderedDict(
+            (_server_key(server), server)
+            for server in usage.get('server_usages', []))
+        for server in later.get('server_usages', []):
+            key = _server_key(server)
+            earlier = servers.get(key)
+            if earlier is not None:
+                server = dict(server,
+                              hours=earlier['hours'] + server['hours'])
+            servers[key] = server
+        usage['server_usages'] = list(servers.values())
+    return usages
+
+
+class _UsageRecord(object):
+    """Holds a usage dict so that it can be wrapped in a NovaUsage."""
+    def __init__(self, info):
+        self.__dict__.update(info)
+
+
 class BaseUsage(object):
     show_terminated = False
 
@@ -106,12 +185,12 @@ class BaseUsage(object):
     def _get_neutron_usage(self, limits, resource_name):
         resource_map = {
             'floatingip': {
-                'api': api.network.tenant_floating_ip_list,
+                'api': api.network.tenant_floating_ip_count,
                 'limit_name': 'totalFloatingIpsUsed',
                 'message': _('Unable to retrieve floating IP addresses.')
             },
             'security_group': {
-                'api': api.network.security_group_list,
+                'api': api.network.security_group_count,
                 'limit_name': 'totalSecurityGroupsUsed',
                 'message': _('Unable to retrieve security groups.')
             }
@@ -120,7 +199,7 @@ class BaseUsage(object):
         resource = resource_map[resource_name]
         try:
             method = resource['api']
-            current_used = len(method(self.request))
+            current_used = method(self.request)
         except Exception:
             current_used = 0
             msg = resource['message']
@@ -144,8 +223,12 @@ class BaseUsage(object):
         limits[limit_name_map[resource_name]] = resource_max
 
     def get_neutron_limits(self):
+        """Returns the floating IP and security group limits if neutron is
+        enabled.
+        """
+        limits = {}
         if not api.base.is_service_enabled(self.request, 'network'):
-            return
+            return limits
         try:
             neutron_quotas_supported = (
                 api.neutron.is_quotas_extension_supported(self.request))
@@ -153,9 +236,9 @@ class BaseUsage(object):
                 api.neutron.is_extension_supported(self.request,
                                                    'security-group'))
             if api.network.floating_ip_supported(self.request):
-                self._get_neutron_usage(self.limits, 'floatingip')
+                self._get_neutron_usage(limits, 'floatingip')
             if neutron_sg_used:
-                self._get_neutron_usage(self.limits, 'security_group')
+                self._get_neutron_usage(limits, 'security_group')
             # Quotas are an optional extension in Neutron. If it isn't
             # enabled, assume the floating IP limit is infinite.
             if neutron_quotas_supported:
@@ -171,44 +254,55 @@ class BaseUsage(object):
             msg = _('Unable to retrieve network quota information.')
             exceptions.handle(self.request, msg)
 
-        self._set_neutron_limit(self.limits, neutron_quotas, 'floatingip')
+        self._set_neutron_limit(limits, neutron_quotas, 'floatingip')
         if neutron_sg_used:
-            self._set_neutron_limit(self.limits, neutron_quotas,
+            self._set_neutron_limit(limits, neutron_quotas,
                                     'security_group')
+        return limits
+
+    def get_nova_limits(self):
+        """Returns the compute limits."""
+        try:
+            return api.nova.tenant_absolute_limits(self.request)
+        except Exception:
+            exceptions.handle(self.request,
+                              _("Unable to retrieve limit information."))
+        return {}
 
     def get_cinder_limits(self):
-        """Get volume limits if cinder is enabled."""
+        """Returns the volume limits if cinder is enabled."""
         if not api.base.is_service_enabled(self.request, 'volume'):
-            return
+            return {}
         try:
-            self.limits.update(api.cinder.tenant_absolute_limits(self.request))
+            return api.cinder.tenant_absolute_limits(self.request)
         except Exception:
             msg = _("Unable to retrieve volume limit information.")
             exceptions.handle(self.request, msg)
-
-        return
+        return {}
 
     def get_manila_limits(self):
-        """Get share limits if manila is enabled."""
+        """Returns the share limits if manila is enabled."""
         if not api.base.is_service_enabled(self.request, 'share'):
-            return
+            return {}
         try:
-            self.limits.update(api.manila.tenant_absolute_limits(self.request))
+            return api.manila.tenant_absolute_limits(self.request)
         except Exception:
             msg = _("Unable to retrieve share limit information.")
             exceptions.handle(self.request, msg)
-
-        return
+        return {}
 
     def get_limits(self):
-        try:
-            self.limits = api.nova.tenant_absolute_limits(self.request)
-        except Exception:
-            exceptions.handle(self.request,
-                              _("Unable to retrieve limit information."))
-        self.get_neutron_limits()
-        self.get_cinder_limits()
-        self.get_manila_limits()
+        """Gathers the limits of all the services concurrently.
+
+        The neutron limits take precedence over the nova ones.
+        """
+        results = functions.run_concurrently(
+            self.get_nova_limits, self.get_neutron_limits,
+            self.get_cinder_limits, self.get_manila_limits,
+            max_workers=getattr(settings, 'CONCURRENT_DATA_LOADS', 4))
+        self.limits = {}
+        for limits in results:
+            self.limits.update(limits)
 
     def get_usage_list(self, start, end):
         return []
@@ -236,11 +330,7 @@ class BaseUsage(object):
                            _("Invalid time period. You are requesting "
                              "data from the future which may not exist."))
 
-        for project_usage in self.usage_list:
-            project_summary = project_usage.get_summary()
-            for key, value in project_summary.items():
-                self.summary.setdefault(key, 0)
-                self.summary[key] += value
+        self.summary.update(summarize_usages(self.usage_list))
 
     def get_quotas(self):
         try:
@@ -261,10 +351,105 @@ class BaseUsage(object):
 
 
 class GlobalUsage(BaseUsage):
+    """The usage of all the projects of the cloud.
+
+    When ``GLOBAL_USAGE_CACHE_TIMEOUT`` is set, the usage of the days which
+    are over is kept in the cache and extended by one day at a time, so that
+    only the current day is fetched from Nova on each load.
+    """
     show_terminated = True
 
+    def _usage_cache_key(self, start, end):
+        # Clouds of different keystones may share a region name
+        user = self.request.user
+        scope = '|'.join(six.text_type(part) for part in (
+            getattr(user, 'endpoint', None),
+            getattr(user, 'services_region', None)))
+        return ':'.join((USAGE_CACHE_PREFIX, 'global',
+                         hashlib.md5(scope.encode('utf-8')).hexdigest(),
+                         start.isoformat(), end.isoformat()))
+
+    def _fetch_usages(self, start, end):
+        return collections.OrderedDict(
+            (usage.tenant_id, usage.to_dict())
+            for usage in api.nova.usage_list(self.request, start, end))
+
+    def _closed_usages(self, start, end, timeout):
+        """Returns the usage dicts of a period which is over.
+
+        A period ending a day earlier which is still in the cache is
+        extended with the usage of the last day instead of fetched again.
+        """
+        key = self._usage_cache_key(start, end)
+        usages = cache.get(key)
+        api.tracing.record_cache(self.request, usages is not None)
+        if usages is not None:
+            return usages
+        day_before = end - datetime.timedelta(days=1)
+        usages = None
+        if day_before > start:
+            usages = cache.get(self._usage_cache_key(start, day_before))
+        if usages is None:
+            usages = self._fetch_usages(start, end)
+        else:
+            usages = _merge_usages(usages,
+                                   self._fetch_usages(day_before, end))
+        cache.set(key, usages, timeout)
+        return usages
+
     def get_usage_list(self, start, end):
-        return api.nova.usage_list(self.request, start, end)
+        timeout = getattr(settings, 'GLOBAL_USAGE_CACHE_TIMEOUT', 0)
+        if not timeout:
+            return api.nova.usage_list(self.request, start, end)
+        midnight = timezone.make_naive(self.today, timezone.utc).replace(
+            hour=0, minute=0, second=0, microsecond=0)
+        if end < midnight:
+            usages = self._closed_usages(start, end, timeout)
+        elif start < midnight:
+            usages = _merge_usages(
+                self._closed_usages(start, midnight, timeout),
+                self._fetch_usages(midnight, end))
+        else:
+            usages = self._fetch_usages(start, end)
+        return [api.nova.NovaUsage(_UsageRecord(usage))
+                for usage in usages.values()]
+
+    def get_project_names(self, project_ids):
+        """Returns a dict mapping project ids to project names.
+
+        The names come from an index of all the projects which is kept in
+        the cache for a few minutes. When one of ``project_ids`` is unknown
+        to a cached index, the index is rebuilt once; projects which are
+        still missing (i.e. deleted ones) are remembered as such and left
+        out of the result.
+        """
+        key = self._project_names_cache_key()
+        project_ids = set(project_ids)
+        cached = cache.get(key)
+        if cached is not None:
+            names, missing = cached
+            if project_ids <= set(names) | missing:
+                api.tracing.record_cache(self.request, True)
+                return names
+        api.tracing.record_cache(self.request, False)
+        projects, has_more = api.keystone.tenant_list(self.request)
+        names = dict((project.id, getattr(project, 'name', None))
+                     for project in projects)
+        missing = project_ids - set(names)
+        cache.set(key, (names, missing), PROJECT_NAMES_CACHE_TIMEOUT)
+        return names
+
+    def _project_names_cache_key(self):
+        # The projects listed depend on the keystone the user logged in to,
+        # the region, the domain in context and the user's own permissions
+        user = self.request.user
+        domain_id = (self.request.session.get('domain_context') or
+                     getattr(user, 'user_domain_id', None))
+        scope = '|'.join(six.text_type(part) for part in (
+            getattr(user, 'endpoint', None),
+            getattr(user, 'services_region', None), domain_id, user.id))
+        return ':'.join((USAGE_CACHE_PREFIX, 'project_names',
+                         hashlib.md5(scope.encode('utf-8')).hexdigest()))
 
 
 class ProjectUsage(BaseUsage):